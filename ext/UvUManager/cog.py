@@ -8,6 +8,7 @@ from discord import app_commands, Interaction
 import logging
 
 from modules.mahjongsoul.contest_manager import ContestManager
+from modules.pymjsoul.ratelimit import parse_rate_limits
 from .table_view import TableView, Player, default_embed
 from typing import *
 
@@ -28,6 +29,9 @@ SPREADSHEET_ID: str           = assert_getenv("spreadsheet_id")
 MS_USERNAME: str              = assert_getenv("ms_username")
 MS_PASSWORD: str              = assert_getenv("ms_password")
 TOURNAMENT_NAME: str          = assert_getenv("tournament_name")
+MS_WARM_STANDBY: bool         = getenv("ms_warm_standby", "0") == "1"
+MS_TOKEN_FILE: Optional[str]  = getenv("ms_token_file") or None
+MS_RATE_LIMITS: dict          = parse_rate_limits(getenv("ms_rate_limits", ""))
 
 class UvUManager(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -37,7 +41,10 @@ class UvUManager(commands.Cog):
             contest_unique_id=CONTEST_UNIQUE_ID,
             mjs_username=MS_USERNAME,
             mjs_password=MS_PASSWORD,
-            game_type=TOURNAMENT_NAME)
+            game_type=TOURNAMENT_NAME,
+            warm_standby=MS_WARM_STANDBY,
+            token_path=MS_TOKEN_FILE,
+            rate_limits=MS_RATE_LIMITS)
 
         current_path = os.path.dirname(__file__)
         gs_client = gspread.service_account(
@@ -138,11 +145,24 @@ class UvUManager(commands.Cog):
         message = await self.manager.unpause_game(player.mjs_nickname)
         await interaction.followup.send(content=message)
 
+    @app_commands.command(name="api_stats", description=f"Show Mahjong Soul API call statistics (only visible to you). Only usable by @{ADMIN_ROLE}.")
+    @app_commands.checks.has_role(ADMIN_ROLE)
+    async def api_stats(self, interaction: Interaction):
+        snapshot = self.manager.metrics_snapshot()
+        lines = [f"reconnects: {snapshot['connection']['reconnects']}, in flight: {snapshot['in_flight']}",
+                 "method: requests, p50/p99 latency, timeouts, errors"]
+        for name, stats in sorted(snapshot['methods'].items()):
+            latency = stats.get('latency_seconds')
+            rendered_latency = f"{latency['p50'] * 1000:.0f}/{latency['p99'] * 1000:.0f}ms" if latency else "-"
+            errors = ", ".join(f"{error} x{count}" for error, count in stats['errors'].items()) or "none"
+            lines.append(f"{name.rsplit('.', 1)[-1]}: {stats['requests']}, {rendered_latency}, {stats['timeouts']}, {errors}")
+        await interaction.response.send_message(content="```\n" + "\n".join(lines)[:1900] + "\n```", ephemeral=True)
+
     async def _register(self, player: discord.Member, friend_id: int, affiliation: str, subbing_for: Optional[str] = None) -> str:
         """Add player to the registry, removing any existing registration first"""
         
         # Fetch Mahjong Soul details
-        res = await self.manager.call("searchAccountByEid", eids = [int(friend_id)])
+        res = await self.manager.api.searchAccountByEid(eids = [int(friend_id)])
         # if no account found, then `res` won't have a `search_result` field, but it won't
         # have an `error`` field, either (i.e., it's not an error!).
         if not res.search_result:
@@ -319,10 +339,12 @@ class UvUManager(commands.Cog):
                 game_results_row.extend(("AI", final_score))
             else:
                 # replace the id with the id of the person the player is subbing for, if any
+                # Sheets calls run in a thread so that other notifications (handled
+                # concurrently by the channel's dispatcher) aren't blocked meanwhile
                 async with self.registry_lock:
-                    found_cell: gspread.cell.Cell = self.registry.find(str(player_account_id), in_column=4)
+                    found_cell: gspread.cell.Cell = await asyncio.to_thread(self.registry.find, str(player_account_id), in_column=4)
                     if found_cell is not None:
-                        [discord_name, _, _, _, affiliation, *rest] = self.registry.row_values(found_cell.row)
+                        [discord_name, _, _, _, affiliation, *rest] = await asyncio.to_thread(self.registry.row_values, found_cell.row)
                         if len(rest) > 0: # we are subbing for someone
                             discord_name = rest[0]
                         game_results_row.extend((discord_name, final_score))
@@ -344,7 +366,7 @@ class UvUManager(commands.Cog):
         asyncio.create_task(self.bot_channel.send(
             content='\n'.join(player_scores_rendered)))
 
-        self.game_results.append_row(game_results_row)
+        await asyncio.to_thread(self.game_results.append_row, game_results_row)
 
     """
     =====================================================
@@ -1,12 +1,14 @@
 import hmac
 import hashlib
 import logging
+import os
 import asyncio
 import datetime
 from typing import *
-from os import getenv
-from modules.pymjsoul.channel import MajsoulChannel, GeneralMajsoulError
-from modules.pymjsoul.proto import liqi_combined_pb2
+from os import getenv, path
+from modules.pymjsoul.channel import MajsoulChannel, GeneralMajsoulError, ResponseTimeoutError, ConnectionLostError
+from modules.pymjsoul.proto.liqi_subsets import load_protocol
+from modules.pymjsoul.proto.liqi_contest_manager_stubs import CustomizedContestManagerApiStub
 from websockets.exceptions import ConnectionClosed, ConnectionClosedError
 
 # MS_MANAGER_WSS_ENDPOINT: `__MJ_DHS_WS__` from https://www.maj-soul.com/dhs/js/config.js
@@ -18,18 +20,88 @@ SOUTH = 1
 WEST = 2
 NORTH = 3
 
+# read-only methods whose concurrent identical calls share one request (see
+# `MajsoulChannel.coalesce`), with how many seconds a response may be reused for.
+# `fetchContestGameRecords` isn't reused: a game that just ended may not be in a slightly older list.
+COALESCED_METHODS = {
+    'startManageGame': 1.0,
+    'fetchContestPlayer': 1.0,
+    'fetchContestInfo': 1.0,
+    'fetchCurrentRankList': 1.0,
+    'searchAccountByEid': 1.0,
+    'fetchContestGameRecords': 0,
+}
+
+# methods that may be sent again when the connection dropped before their response
+# arrived (the server may or may not have processed them). Don't add anything that
+# creates something (e.g. `createContestGame`) or fails when repeated.
+IDEMPOTENT_METHODS = set(COALESCED_METHODS) | {
+    'fetchContestGameRule',
+    'updateContestGameRule',
+}
+
+# rate limit groups (see `MajsoulChannel.rate_limiter`); every other method is in "default"
+RATE_LIMIT_GROUPS = {
+    # pause commands, `create_random_games`, ...
+    'lockGamePlayer': 'game',
+    'unlockGamePlayer': 'game',
+    'createContestGame': 'game',
+    'pauseGame': 'game',
+    'resumeGame': 'game',
+    'terminateGame': 'game',
+    # registration floods
+    'searchAccountByEid': 'search',
+    'searchAccountById': 'search',
+    'searchAccountByNickname': 'search',
+    'searchAccountByPattern': 'search',
+}
+
+# {group: (requests per second, burst)}; overridden per group by `ms_rate_limits`
+DEFAULT_RATE_LIMITS = {
+    'default': (10.0, 20.0),
+    'game': (5.0, 10.0),
+    'search': (2.0, 5.0),
+}
+
+# `type` of `oauth2LoginContestManager` for tokens of this server (as in `ContestManagerClient`)
+OAUTH2_LOGIN_TYPE = 10
+
+# how long a call waits for a lost session to be restored before giving up
+SESSION_PARK_TIMEOUT = 60.0
+
+# response timeouts in a row after which the connection is given up on. A single slow
+# response is no reason to drop every other request in flight; dead connections are
+# noticed by the keepalive (`MajsoulChannel.sustain()`)
+MAX_CONSECUTIVE_TIMEOUTS = 3
+
 class ContestManager(MajsoulChannel):
     """
     wraps around the `MajsoulChannel` class to provide additional functionalities for managing ONE specific contest on Discord
     """
-    def __init__(self, contest_unique_id: int, mjs_username: str, mjs_password: str, game_type: str, log_messages=False):
+    def __init__(self, contest_unique_id: int, mjs_username: str, mjs_password: str, game_type: str, log_messages=False,
+                 warm_standby=False, token_path: Optional[str]=None, rate_limits: Optional[Dict[str, Tuple[float, float]]]=None):
         self.contest_unique_id = contest_unique_id
         self.mjs_username = mjs_username
         self.mjs_password = mjs_password
         self.contest = None # contest info; `CustomizedContest` protobuf
         self.logger = logging.getLogger(game_type)
-        super().__init__(proto=liqi_combined_pb2, log_messages=log_messages, logger_name=game_type)
+        # only the contest manager part of the protocol (see `split_protocol.py`)
+        super().__init__(proto=load_protocol('contest_manager'), log_messages=log_messages, logger_name=game_type,
+                         coalesce=COALESCED_METHODS, warm_standby=warm_standby,
+                         rate_limits={**DEFAULT_RATE_LIMITS, **(rate_limits or {})}, rate_limit_groups=RATE_LIMIT_GROUPS)
+        # typed API. `self.api` goes through the reconnect-and-retry wrapper (`call_method()`
+        # below); `self._session_api` doesn't, for (re)logging in without infinite errors
+        self.api = CustomizedContestManagerApiStub(self)
+        self._session_api = CustomizedContestManagerApiStub(self, super().call_method)
         self.huge_ping_task: Optional[asyncio.Task] = None
+        # access token from the latest login (see `login()`), kept in `token_path` if given
+        # so that it survives restarts
+        self.token_path = token_path
+        self._access_token = self._load_access_token()
+        self.token_logins = 0
+        self.password_logins = 0
+        # see `MAX_CONSECUTIVE_TIMEOUTS`
+        self.consecutive_timeouts = 0
     
     async def login_and_start_listening(self):
         """
@@ -37,17 +109,11 @@ class ContestManager(MajsoulChannel):
         another WSS connection (e.g., when we were logged out outside of this module)
         NOTE: this method starts the `huge_ping` task. It should be canceled before
         reusing this method.
-        NOTE: use `super().call()` to avoid infinite errors
+        NOTE: use `self._session_api` to avoid infinite errors
         """
-        await super().call(
-            methodName = "loginContestManager",
-            account = MS_USERNAME,
-            password = hmac.new(b"lailai", MS_PASSWORD.encode(), hashlib.sha256).hexdigest(),
-            type = 0)
-        self.logger.info(f"`loginContestManager` with {MS_USERNAME} successful!")
+        await self.login()
 
-        res = await super().call(
-            methodName = 'manageContest',
+        res = await self._session_api.manageContest(
             unique_id = self.contest_unique_id)
         self.contest = res.contest
         self.logger.info(f"`manageContest` for {self.contest.contest_name} successful!")
@@ -56,27 +122,77 @@ class ContestManager(MajsoulChannel):
 
         # `startManageGame` will make mahjong soul start sending notifications
         # like `NotifyContestGameStart` and `NotifyContestGameEnd`
-        await super().call(methodName = 'startManageGame')
+        await self._session_api.startManageGame()
         
         self.logger.info(f"`startManageGame` successful!")
     
+    async def login(self):
+        """
+        log in with the access token from an earlier login when there is one: one cheap
+        `oauth2LoginContestManager` with `reconnect` instead of a password login (which
+        also tends to run into `ERR_CONTEST_MGR_HAS_LOGINED`). Falls back to the password
+        when there's no token or it was rejected. Either way, the new token is kept.
+        """
+        if self._access_token:
+            try:
+                res = await self._session_api.oauth2LoginContestManager(
+                    type = OAUTH2_LOGIN_TYPE,
+                    access_token = self._access_token,
+                    reconnect = True)
+                self.token_logins += 1
+                self.logger.info(f"`oauth2LoginContestManager` with {MS_USERNAME} successful!")
+                if res.access_token:
+                    self._save_access_token(res.access_token)
+                return
+            except GeneralMajsoulError as mjsError:
+                self.logger.info(f"Access token rejected ({mjsError.message}); logging in with the password instead.")
+                self._save_access_token(None)
+
+        res = await self._session_api.loginContestManager(
+            account = MS_USERNAME,
+            password = hmac.new(b"lailai", MS_PASSWORD.encode(), hashlib.sha256).hexdigest(),
+            gen_access_token = True,
+            type = 0)
+        self.password_logins += 1
+        self.logger.info(f"`loginContestManager` with {MS_USERNAME} successful!")
+        self._save_access_token(res.access_token or None)
+
+    def _load_access_token(self):
+        if self.token_path is None or not path.exists(self.token_path):
+            return None
+        with open(self.token_path) as f:
+            return f.read().strip() or None
+
+    def _save_access_token(self, access_token):
+        self._access_token = access_token
+        if self.token_path is None:
+            return
+        # it logs in as the contest manager account; keep it private from the start
+        # (not only after writing it), and never leave a half-written file
+        tmpPath = self.token_path + ".tmp"
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600) # in case it was left over with other permissions
+        with os.fdopen(fd, "w") as f:
+            f.write(access_token or "")
+        os.replace(tmpPath, self.token_path)
+
     async def huge_ping(self, huge_ping_interval=14400):
         """
         this task tries to set the contest finish_time to be 90 days from
         `now` regularly (default: every 4 hours). This serves two purposes:
         1. automatically extend the contest finish_time (90 days is the safe max)
-        2. attempts reconnection when necessary (via the wrapped `call()`)
+        2. notices when we were logged out elsewhere (via the wrapped `call_method()`)
         """
         try:
             while True:
                 ninety_days_later = datetime.datetime.now() + datetime.timedelta(days=90)
                 try:
-                    await self.call(
-                        "updateContestGameRule",
-                        finish_time = int(ninety_days_later.timestamp()))
+                    with self.background():
+                        await self.api.updateContestGameRule(
+                            finish_time = int(ninety_days_later.timestamp()))
                     self.logger.info(f"huge_ping'd.")
                 except GeneralMajsoulError:
-                    # ignore mahjong soul errors not caught in wrapped `call()`
+                    # ignore mahjong soul errors not caught in wrapped `call_method()`
                     pass
                 
                 await asyncio.sleep(huge_ping_interval)
@@ -92,6 +208,8 @@ class ContestManager(MajsoulChannel):
         await self.connect(MS_MANAGER_WSS_ENDPOINT)
         # Login, manage specific contest, and start listening to notifications
         await self.login_and_start_listening()
+        # from now on, a lost connection is restored in the background (see `restore_session()`)
+        self.start_supervisor()
     
     async def reconnect_and_login(self):
         """
@@ -99,17 +217,33 @@ class ContestManager(MajsoulChannel):
         Needs to make a new connection with `self.reconnect()` because trying to
         log in through the same connection results in `2504 : "ERR_CONTEST_MGR_HAS_LOGINED"`
         """
-        self.huge_ping_task.cancel()
+        if self.huge_ping_task is not None:
+            self.huge_ping_task.cancel()
         await self.reconnect()
         await self.login_and_start_listening()
 
-    async def call(self, methodName, **msgFields):
+    async def restore_session(self):
         """
-        Wrap around `MajsoulChannel.call()` to handle certain errors. Note that
-        `MajsoulChannel` already prints the API Errors to the console.
+        called by the supervisor (`MajsoulChannel.supervise()`) when the connection dropped
+        or `request_reconnect()` was called; retried with backoff until it succeeds.
+        """
+        await self.reconnect_and_login()
+
+    async def call_method(self, method, reqMessage=None, timeout=None):
         """
+        Wrap around `MajsoulChannel.call_method()` (which both `call()` and `self.api`
+        go through) to handle certain errors. Note that `MajsoulChannel` already
+        prints the API Errors to the console.
+
+        While the supervisor restores a lost session, calls are parked until it's back
+        (at most `SESSION_PARK_TIMEOUT` seconds) instead of failing.
+        """
+        await self.wait_for_session(SESSION_PARK_TIMEOUT)
+        generation = self.session_generation
         try:
-            return await super().call(methodName, **msgFields)
+            res = await super().call_method(method, reqMessage, timeout)
+            self.consecutive_timeouts = 0
+            return res
         except GeneralMajsoulError as mjsError:
             if mjsError.errorCode == 2505:
                 """
@@ -120,26 +254,52 @@ class ContestManager(MajsoulChannel):
                 e.g., from the web version of the tournament manager)
                 """
                 self.logger.info("Received `ERR_CONTEST_MGR_NOT_LOGIN`; now trying to log in again and resend the previous request.")
-                await self.reconnect_and_login()
-                return await super().call(methodName, **msgFields)
+                return await self._resend_after_reconnect(generation, method, reqMessage, timeout)
             else:
                 # raise other GeneralMajsoulError
                 raise mjsError
         except (ConnectionClosedError,
                 ConnectionClosed):
             """
-            similar to above; try logging back in once and retrying the call.
-            Do nothing if the retry still failed.
+            the request couldn't be sent at all; try logging back in once and
+            retrying the call. Do nothing if the retry still failed.
             """
             self.logger.info("ConnectionClosed[Error]; now trying to log in again and resend the previous request.")
-            await self.reconnect_and_login()
-            return await super().call(methodName, **msgFields)
+            return await self._resend_after_reconnect(generation, method, reqMessage, timeout)
+        except ConnectionLostError:
+            """
+            the connection dropped while the request was in flight; the server may
+            have processed it already. Only requests that are safe to repeat are replayed.
+            """
+            if method.name not in IDEMPOTENT_METHODS:
+                raise
+            self.logger.info(f"Connection lost during `{method.name}`; replaying it once the session is restored.")
+            return await self._resend_after_reconnect(generation, method, reqMessage, timeout)
+        except ResponseTimeoutError:
+            """
+            don't resend: the request may have been processed already (e.g.,
+            `createContestGame`). Only if nothing has been answered for
+            `MAX_CONSECUTIVE_TIMEOUTS` calls, reconnect so that the next calls work.
+            """
+            self.consecutive_timeouts += 1
+            if self.consecutive_timeouts >= MAX_CONSECUTIVE_TIMEOUTS:
+                self.logger.info(f"`{method.name}` timed out ({self.consecutive_timeouts} in a row); now trying to log in again.")
+                self.consecutive_timeouts = 0
+                self.request_reconnect(generation)
+            else:
+                self.logger.info(f"`{method.name}` timed out ({self.consecutive_timeouts} in a row).")
+            raise
+
+    async def _resend_after_reconnect(self, generation, method, reqMessage, timeout):
+        self.request_reconnect(generation)
+        await self.wait_for_session(SESSION_PARK_TIMEOUT)
+        return await super().call_method(method, reqMessage, timeout)
 
     async def get_ongoing_game_uuid(self, nickname):
         """
         return the UUID for an ongoing game the specified player is in
         """
-        res = await self.call('startManageGame')
+        res = await self.api.startManageGame()
         for game in res.games:
             for player in game.players:
                 if player.nickname == nickname:
@@ -150,7 +310,8 @@ class ContestManager(MajsoulChannel):
         """
         locate and return a completed game's record
         """
-        res = await self.call('fetchContestGameRecords')
+        with self.background():
+            res = await self.api.fetchContestGameRecords()
         for item in res.record_list:
             if item.record.uuid == game_uuid:
                 return item.record
@@ -172,10 +333,7 @@ class ContestManager(MajsoulChannel):
         if game_uuid == None:
             return f"No ongoing game to be terminated for {nickname}!"
         
-        await self.call(
-            'terminateGame',
-            serviceName='CustomizedContestManagerApi',
-            uuid=game_uuid)
+        await self.api.terminateGame(uuid=game_uuid)
 
         return f"{nickname}'s game has been terminated."
 
@@ -188,9 +346,7 @@ class ContestManager(MajsoulChannel):
         if game_uuid == None:
             return f"No ongoing game to be paused for {nickname}!"
         
-        await self.call(
-            'pauseGame',
-            uuid=game_uuid)
+        await self.api.pauseGame(uuid=game_uuid)
 
         return f"{nickname}'s game has been paused."
     
@@ -203,9 +359,7 @@ class ContestManager(MajsoulChannel):
         if game_uuid == None:
             return f"No paused game to be unpaused for {nickname}!"
         
-        await self.call(
-            'resumeGame',
-            uuid=game_uuid)
+        await self.api.resumeGame(uuid=game_uuid)
 
         return f"{nickname}'s paused game has been unpaused."
 
@@ -227,13 +381,29 @@ class ContestManager(MajsoulChannel):
             playerList.append(self.proto.ReqCreateContestGame.Slot(
                 account_id=account_id,
                 seat=i))
-            # if it's a real player, call `lockGamePlayer`
-            if account_id > 0:
-                await self.call('lockGamePlayer', account_id=account_id)
-        await self.call(
-            methodName='createContestGame',
-            slots=playerList,
-            tag=tag,
-            random_position=random_position,
-            open_live=open_live,
-            ai_level=ai_level)
+        # lock the real players, all at once
+        humans = [account_id for account_id in account_ids if account_id > 0]
+        results = await self.call_many([('lockGamePlayer', {'account_id': account_id}) for account_id in humans])
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            # don't leave the others locked
+            await self.unlock_players([a for a, r in zip(humans, results) if not isinstance(r, Exception)])
+            raise errors[0]
+
+        try:
+            await self.api.createContestGame(
+                slots=playerList,
+                tag=tag,
+                random_position=random_position,
+                open_live=open_live,
+                ai_level=ai_level)
+        except Exception:
+            await self.unlock_players(humans)
+            raise
+
+    async def unlock_players(self, account_ids: List[int]) -> None:
+        """
+        unlock the given players, e.g. after a game couldn't be started;
+        errors (e.g. already unlocked) are ignored
+        """
+        await self.call_many([('unlockGamePlayer', {'account_id': account_id}) for account_id in account_ids])
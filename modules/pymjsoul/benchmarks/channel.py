@@ -0,0 +1,225 @@
+'''
+Benchmark suite: `MajsoulChannel` end to end, against the in-process `FakeContestGateway`
+(no added latency, so these are the costs of the client, the loopback and the fake server).
+
+- latency: `call()` round trips, one at a time (p50/p90/p99/max, microseconds), for a
+  small response (`fetchContestInfo`) and a larger one (`fetchContestPlayer`, 200 players);
+- throughput: sustained calls per second with 1..N concurrent callers;
+- notify: notifications per second from the socket to a subscriber callback
+  (frame parsing, dedup, queue, decoding, dispatch);
+- memory: bytes allocated per in-flight request (`tracemalloc`), while the gateway
+  holds every response back.
+
+Results are printed and, with `--output`, written as JSON together with the Python,
+protobuf and websockets versions. `--compare` takes an earlier JSON file and exits with
+status 1 if anything got more than `--tolerance` worse, e.g. to check a library upgrade:
+
+    python -m modules.pymjsoul.benchmarks.channel --output before.json
+    pip install -U protobuf websockets
+    python -m modules.pymjsoul.benchmarks.channel --compare before.json
+
+Usage (from the repository root):
+    python -m modules.pymjsoul.benchmarks.channel [--calls 2000] [--max-concurrency 64]
+'''
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+
+import google.protobuf
+import websockets
+from google.protobuf.internal import api_implementation
+
+from modules.pymjsoul.channel import MajsoulChannel
+from modules.pymjsoul.fake_gateway import FakeContestGateway
+from modules.pymjsoul.proto import liqi_combined_pb2 as pb2
+
+PLAYER_COUNT = 200
+
+def percentiles(samples):
+    samples = sorted(samples)
+    def at(q):
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+    return {
+        'p50_us': at(0.50) * 1e6,
+        'p90_us': at(0.90) * 1e6,
+        'p99_us': at(0.99) * 1e6,
+        'max_us': samples[-1] * 1e6,
+    }
+
+async def connect(gateway, window):
+    channel = MajsoulChannel(pb2, log_messages=False, logger_name="benchmark", priority_window=window)
+    await channel.connect(gateway.uri)
+    await channel.call('loginContestManager', account='benchmark', password='', type=0)
+    await channel.call('manageContest', unique_id=gateway.contest.unique_id)
+    return channel
+
+async def bench_latency(channel, methodName, calls):
+    # warm up the registry, the adaptive timeouts and the socket
+    for _ in range(min(100, calls)):
+        await channel.call(methodName)
+
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await channel.call(methodName)
+        samples.append(time.perf_counter() - start)
+
+    return percentiles(samples)
+
+async def bench_throughput(channel, concurrency, calls):
+    remaining = calls
+
+    async def caller():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await channel.call('fetchContestInfo')
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return calls / (time.perf_counter() - start)
+
+async def bench_notify(gateway, channel, count):
+    await channel.call('startManageGame')
+
+    received = 0
+    done = asyncio.Event()
+    async def on_game_end(name, msg):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+    await channel.subscribe('NotifyContestGameEnd', on_game_end)
+
+    start = time.perf_counter()
+    for i in range(count):
+        # distinct payloads, or the duplicate filter drops them
+        gateway.notify_all(pb2.NotifyContestGameEnd(unique_id=gateway.contest.unique_id, game_uuid=f'game-{i}'))
+    await done.wait()
+    return count / (time.perf_counter() - start)
+
+async def bench_memory(gateway, channel, inFlight):
+    gateway.method_latency['fetchContestInfo'] = 3600
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tasks = [asyncio.create_task(channel.call('fetchContestInfo')) for _ in range(inFlight)]
+    while len(channel.requests) < inFlight:
+        await asyncio.sleep(0.01)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    gateway.method_latency.pop('fetchContestInfo')
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return allocated / inFlight
+
+async def run(args):
+    results = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'protobuf': google.protobuf.__version__,
+        'protobuf_backend': api_implementation.Type(),
+        'websockets': websockets.__version__,
+    }
+
+    gateway = FakeContestGateway(players={i: f'player{i}' for i in range(1, PLAYER_COUNT + 1)})
+    async with gateway:
+        # every request of the memory benchmark must be sent, not queued
+        channel = await connect(gateway, max(args.max_concurrency, args.in_flight))
+
+        results['latency'] = {
+            methodName: await bench_latency(channel, methodName, args.calls)
+            for methodName in ('fetchContestInfo', 'fetchContestPlayer')
+        }
+
+        concurrency = 1
+        results['throughput_calls_per_s'] = {}
+        while concurrency <= args.max_concurrency:
+            results['throughput_calls_per_s'][str(concurrency)] = await bench_throughput(channel, concurrency, args.calls)
+            concurrency *= 2
+
+        results['notify_per_s'] = await bench_notify(gateway, channel, args.notifies)
+        results['bytes_per_in_flight_request'] = await bench_memory(gateway, channel, args.in_flight)
+
+        await channel.clean_up()
+
+    return results
+
+def print_results(results):
+    print(f"python {results['python']}, protobuf {results['protobuf']} ({results['protobuf_backend']}), websockets {results['websockets']}")
+    for methodName, latency in results['latency'].items():
+        print(f"{methodName:<20} " + '  '.join(f'{k[:-3]} {v:8.1f}us' for k, v in latency.items()))
+    for concurrency, rate in results['throughput_calls_per_s'].items():
+        print(f"{concurrency:>3} callers: {rate:10.0f} calls/s")
+    print(f"notifications:     {results['notify_per_s']:10.0f} /s")
+    print(f"per in-flight req: {results['bytes_per_in_flight_request']:10.0f} bytes")
+
+def flatten(results, prefix=''):
+    '''
+    numeric results as {'latency.fetchContestInfo.p50_us': ...}
+    '''
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}.'))
+        elif isinstance(value, (int, float)):
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+def compare(results, baseline, tolerance):
+    '''
+    Prints the changes against `baseline`; returns the metrics more than `tolerance`
+    (a fraction) worse. Rates are better higher, everything else lower.
+    '''
+    current, previous = flatten(results), flatten(baseline)
+    regressions = []
+    for key, value in current.items():
+        old = previous.get(key)
+        if not old:
+            continue
+        change = value / old - 1
+        worse = -change if ('per_s' in key) else change
+        flag = ' REGRESSION' if worse > tolerance else ''
+        print(f'{key:<45} {old:12.1f} -> {value:12.1f} ({change:+.0%}){flag}')
+        if flag:
+            regressions.append(key)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0], formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=2000, help="calls per latency/throughput measurement")
+    parser.add_argument('--max-concurrency', type=int, default=64)
+    parser.add_argument('--notifies', type=int, default=5000)
+    parser.add_argument('--in-flight', type=int, default=1000)
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON file of an earlier run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown when comparing (0.2: 20%%)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run(args))
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f'{len(regressions)} regression(s) beyond {args.tolerance:.0%}')
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+'''
+Benchmark: per-call encode cost (everything from `call()` up to the frame handed to
+the websocket) for requests without a body, like `startManageGame`.
+
+- legacy: descriptor scan, `MakeClass`, `ReqCommon()` + `SerializeToString()`,
+  `Wrapper(...)` + `SerializeToString()`, header concatenation (the original code);
+- per call: registry lookup, `ReqCommon()` + `SerializeToString()`, `encode_frame()`;
+- prebuilt: registry lookup and the cached wrapped payload behind a fresh 3-byte header.
+
+Usage (from the repository root):
+    python -m modules.pymjsoul.benchmarks.encode
+'''
+import timeit
+
+from modules.pymjsoul.proto import liqi_combined_pb2
+from modules.pymjsoul.registry import ProtoRegistry
+from modules.pymjsoul.framing import encode_frame, encode_empty_frame
+from modules.pymjsoul.benchmarks.registry import legacy_method_lookup
+
+from google.protobuf import reflection
+
+MSG_TYPE_REQUEST = 2
+METHODS = ['startManageGame', 'fetchContestGameRecords', 'fetchContestPlayer', 'fetchCurrentRankList', 'fetchContestInfo']
+
+def legacy_encode(proto, methodName, msgIndex):
+    methodDescriptor = legacy_method_lookup(proto, methodName, None)
+    msgName = f'.{methodDescriptor.full_name}'
+    reqMessage = reflection.MakeClass(methodDescriptor.input_type)()
+    wrapped = proto.Wrapper(name=msgName, data=reqMessage.SerializeToString()).SerializeToString()
+    return MSG_TYPE_REQUEST.to_bytes(1, 'little') + msgIndex.to_bytes(2, 'little') + wrapped
+
+def per_call_encode(registry, methodName, msgIndex):
+    method = registry.method(methodName)
+    reqData = method.request_class().SerializeToString()
+    return encode_frame(MSG_TYPE_REQUEST, msgIndex, method.full_name, reqData)
+
+def prebuilt_encode(registry, methodName, msgIndex):
+    method = registry.method(methodName)
+    return encode_empty_frame(MSG_TYPE_REQUEST, msgIndex, method.full_name)
+
+def per_op_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def main(number=50000):
+    proto = liqi_combined_pb2
+    registry = ProtoRegistry(proto)
+
+    print(f'{"method":<26}{"legacy (us)":>13}{"per call (us)":>15}{"prebuilt (us)":>15}{"vs legacy":>11}')
+    for methodName in METHODS:
+        frame = legacy_encode(proto, methodName, 4321)
+        assert bytes(per_call_encode(registry, methodName, 4321)) == frame
+        assert prebuilt_encode(registry, methodName, 4321) == frame
+
+        legacy = per_op_us(lambda: legacy_encode(proto, methodName, 4321), number)
+        perCall = per_op_us(lambda: per_call_encode(registry, methodName, 4321), number)
+        prebuilt = per_op_us(lambda: prebuilt_encode(registry, methodName, 4321), number)
+        print(f'{methodName:<26}{legacy:>13.2f}{perCall:>15.2f}{prebuilt:>15.2f}{legacy / prebuilt:>10.1f}x')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+'''
+Benchmark: parsing and building websocket frames, old slicing/concatenation path
+versus the memoryview-based `framing` module, on a large `fetchContestGameRecords`
+response.
+
+Allocations are measured with `tracemalloc` as the peak bytes allocated during one
+operation (its result included). A frame-sized copy shows up as roughly one frame size.
+
+Usage (from the repository root):
+    python -m modules.pymjsoul.benchmarks.framing [record_count]
+'''
+import sys
+import timeit
+import tracemalloc
+
+from modules.pymjsoul.proto import liqi_combined_pb2 as pb2
+from modules.pymjsoul.framing import encode_frame, decode_wrapper
+
+MSG_TYPE_REQUEST = 2
+MSG_TYPE_RESPONSE = 3
+METHOD_NAME = '.lq.CustomizedContestManagerApi.fetchContestGameRecords'
+
+def make_records_response(recordCount):
+    res = pb2.ResFetchCustomizedContestGameRecordList(next_index=recordCount)
+    for i in range(recordCount):
+        item = res.record_list.add(tag=f'table {i}')
+        record = item.record
+        record.uuid = f'230101-{i:08d}-0000-0000-0000-000000000000'
+        record.start_time = 1700000000 + i
+        record.end_time = 1700003600 + i
+        for seat in range(4):
+            record.accounts.add(account_id=100000 + 4 * i + seat, seat=seat, nickname=f'player{4 * i + seat}')
+            record.result.players.add(seat=seat, total_point=25000, part_point_1=25000)
+    return res
+
+def legacy_unwrap_response(message):
+    msgIndex = int.from_bytes(message[1:3], 'little')
+    wrapper = pb2.Wrapper()
+    wrapper.ParseFromString(message[3:])
+    return msgIndex, wrapper.data
+
+def framing_unwrap_response(message):
+    view = memoryview(message)
+    msgIndex = int.from_bytes(view[1:3], 'little')
+    _, data = decode_wrapper(view[3:])
+    return msgIndex, data
+
+def legacy_parse_response(message):
+    msgIndex = int.from_bytes(message[1:3], 'little')
+    wrapper = pb2.Wrapper()
+    wrapper.ParseFromString(message[3:])
+    return msgIndex, pb2.ResFetchCustomizedContestGameRecordList.FromString(wrapper.data)
+
+def framing_parse_response(message):
+    view = memoryview(message)
+    msgIndex = int.from_bytes(view[1:3], 'little')
+    _, data = decode_wrapper(view[3:])
+    return msgIndex, pb2.ResFetchCustomizedContestGameRecordList.FromString(data)
+
+def legacy_build_request(msgIndex, data):
+    wrapped = pb2.Wrapper(name=METHOD_NAME, data=data).SerializeToString()
+    return MSG_TYPE_REQUEST.to_bytes(1, 'little') + msgIndex.to_bytes(2, 'little') + wrapped
+
+def framing_build_request(msgIndex, data):
+    return encode_frame(MSG_TYPE_REQUEST, msgIndex, METHOD_NAME, data)
+
+def peak_allocated(func):
+    '''
+    Returns the peak number of bytes allocated during one call of `func` (its result included).
+    '''
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+def per_op_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def report(label, legacy, new, number):
+    legacyPeak = peak_allocated(legacy)
+    newPeak = peak_allocated(new)
+    legacyTime = per_op_us(legacy, number)
+    newTime = per_op_us(new, number)
+    print(f'{label:<16}{legacyPeak / 1024:>14.1f}{newPeak / 1024:>14.1f}{legacyTime:>14.1f}{newTime:>14.1f}')
+
+def main(recordCount=500, number=200):
+    payload = make_records_response(recordCount).SerializeToString()
+    response = bytes((MSG_TYPE_RESPONSE,)) + (1234).to_bytes(2, 'little') + \
+        pb2.Wrapper(name='', data=payload).SerializeToString()
+
+    assert framing_parse_response(response) == legacy_parse_response(response)
+    assert bytes(framing_build_request(1234, payload)) == legacy_build_request(1234, payload)
+
+    print(f'frame size: {len(response) / 1024:.1f} KiB ({recordCount} records)')
+    print(f'{"":<16}{"legacy peak":>14}{"new peak":>14}{"legacy":>14}{"new":>14}')
+    print(f'{"":<16}{"(KiB)":>14}{"(KiB)":>14}{"(us)":>14}{"(us)":>14}')
+    # unwrapping is all `listen()` does for responses/notifications that are never decoded
+    # (unsubscribed, duplicate or raw notifications, timed out requests)
+    report('unwrap response', lambda: legacy_unwrap_response(response), lambda: framing_unwrap_response(response), number)
+    # the protobuf runtime copies a memoryview before parsing it, so a full decode still costs one copy
+    report('parse response', lambda: legacy_parse_response(response), lambda: framing_parse_response(response), number)
+    report('build request', lambda: legacy_build_request(1234, payload), lambda: framing_build_request(1234, payload), number)
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
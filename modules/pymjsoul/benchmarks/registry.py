@@ -0,0 +1,84 @@
+'''
+Micro-benchmark: per-call lookup/encode/decode overhead of `MajsoulChannel.call`,
+comparing the old descriptor scan + `MakeClass` path with the precomputed `ProtoRegistry`.
+
+No network involved; only the work `call()` does around `send()` is measured.
+
+Usage (from the repository root):
+    python -m modules.pymjsoul.benchmarks.registry
+'''
+import timeit
+
+from google.protobuf import reflection
+
+from modules.pymjsoul.proto import liqi_combined_pb2
+from modules.pymjsoul.registry import ProtoRegistry
+
+# (methodName, serviceName, request fields) as used by `ContestManager`
+CALLS = [
+    ('startManageGame', None, {}),
+    ('lockGamePlayer', None, {'account_id': 123456}),
+    ('terminateGame', 'CustomizedContestManagerApi', {'uuid': '230101-00000000-0000-0000-0000-000000000000'}),
+    ('searchAccountByEid', None, {'eids': [12345678]}),
+]
+NOTIFY_NAME = '.lq.NotifyContestGameEnd'
+NOTIFY_DATA = liqi_combined_pb2.NotifyContestGameEnd(unique_id=1, game_uuid='230101-00000000').SerializeToString()
+RESPONSE_DATA = liqi_combined_pb2.ResCommon().SerializeToString()
+
+def legacy_method_lookup(proto, methodName, serviceName):
+    # the lookup `MajsoulChannel.method_lookup` used to do on every call
+    if serviceName:
+        return proto.DESCRIPTOR.services_by_name[serviceName].FindMethodByName(methodName)
+    for serviceDescriptor in proto.DESCRIPTOR.services_by_name.values():
+        try:
+            return serviceDescriptor.FindMethodByName(methodName)
+        except KeyError:
+            continue
+
+def legacy_call(proto, methodName, serviceName, fields):
+    methodDescriptor = legacy_method_lookup(proto, methodName, serviceName)
+    msgName = f'.{methodDescriptor.full_name}'
+    reqMessage = reflection.MakeClass(methodDescriptor.input_type)(**fields)
+    reqMessage.SerializeToString()
+    resMessage = reflection.MakeClass(methodDescriptor.output_type)()
+    resMessage.ParseFromString(RESPONSE_DATA)
+    return msgName, resMessage
+
+def registry_call(registry, methodName, serviceName, fields):
+    method = registry.method(methodName, serviceName)
+    method.request_class(**fields).SerializeToString()
+    return method.full_name, method.response_class.FromString(RESPONSE_DATA)
+
+def legacy_notify(proto):
+    name = NOTIFY_NAME.strip(f'.{proto.DESCRIPTOR.package}')
+    msgClass = reflection.MakeClass(proto.DESCRIPTOR.message_types_by_name[name])
+    msg = msgClass()
+    msg.ParseFromString(NOTIFY_DATA)
+    return name, msg
+
+def registry_notify(registry):
+    msgEntry = registry.message(NOTIFY_NAME)
+    return msgEntry.name, msgEntry.message_class.FromString(NOTIFY_DATA)
+
+def per_op_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def main(number=20000):
+    proto = liqi_combined_pb2
+    registry = ProtoRegistry(proto)
+
+    buildTime = min(timeit.repeat(lambda: ProtoRegistry(proto), number=10, repeat=3)) / 10
+    print(f'registry construction: {buildTime * 1e3:.2f} ms (once per channel)')
+    print(f'{"call":<22}{"legacy (us)":>14}{"registry (us)":>16}{"speedup":>10}')
+
+    for methodName, serviceName, fields in CALLS:
+        before = per_op_us(lambda: legacy_call(proto, methodName, serviceName, fields), number)
+        after = per_op_us(lambda: registry_call(registry, methodName, serviceName, fields), number)
+        print(f'{methodName:<22}{before:>14.2f}{after:>16.2f}{before / after:>9.1f}x')
+
+    before = per_op_us(lambda: legacy_notify(proto), number)
+    after = per_op_us(lambda: registry_notify(registry), number)
+    print(f'{"(notify decode)":<22}{before:>14.2f}{after:>16.2f}{before / after:>9.1f}x')
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
 import asyncio
+import random
+import time
+from collections import Counter
 from typing import Optional
 
 import websockets
+from websockets.exceptions import ConnectionClosed
 import logging
 
-import google.protobuf as pb
 from .errors import ERRORS
+from .registry import ProtoRegistry, MethodEntry
+from .dedup import DigestWindow
+from .dispatcher import NotifyDispatcher
+from .notify_queue import NotificationQueue, OVERFLOW_SPILL
+from .timeouts import AdaptiveTimeouts
+from .metrics import RpcMetrics
+from .inflight import InFlightTable
+from .ratelimit import RateLimiter
+from .scheduler import RequestScheduler, background, current_priority
+from .standby import StandbyWebsocket
+from .recorder import FrameRecorder, DIRECTION_IN, DIRECTION_OUT
+from .message_log import MessageLogger
+from .framing import FrameError, encode_frame, decode_wrapper
 
 MSG_TYPE_NOTIFY = 1
 MSG_TYPE_REQUEST = 2
@@ -23,6 +39,16 @@ class ResponseTimeoutError(Exception):
         self.message = f"Response not received within specified timeout duration ({timeoutDuration}s)"
         super().__init__(self.message)
 
+class MessageIndexExhaustedError(Exception):
+    def __init__(self, maxIndex):
+        self.message = f"All {maxIndex} message indices are in use by in-flight requests"
+        super().__init__(self.message)
+
+class ConnectionLostError(Exception):
+    def __init__(self, reason="Connection lost before the response was received"):
+        self.message = reason
+        super().__init__(self.message)
+
 class GeneralMajsoulError(Exception):
     def __init__(self, errorCode: int, message: str):
         self.errorCode = errorCode
@@ -30,97 +56,301 @@ class GeneralMajsoulError(Exception):
         super().__init__(self.message)
 
 class MajsoulChannel():
+    # the longest a request may wait for its response; see `AdaptiveTimeouts`
     _RESPONSE_TIMEOUT_DURATION = 10
-
-    def __init__(self, proto, log_messages=True, logger_name="MajsoulChannel"):
+    # keepalive ping interval while requests are in flight (see `sustain()`);
+    # up to `_KEEPALIVE_MAX_INTERVAL` when idle
+    _KEEPALIVE_INTERVAL = 3.0
+    _KEEPALIVE_MAX_INTERVAL = 30.0
+    _KEEPALIVE_MIN_INTERVAL = 1.0
+    _PONG_TIMEOUT = 5.0
+    _MAX_MISSED_PONGS = 3
+
+    def __init__(self, proto, log_messages=True, logger_name="MajsoulChannel", multiplexed=True,
+                 notify_dedup_size=256, notify_dedup_age=60.0, notify_concurrency=4, notify_max_pending=100,
+                 notify_queue_size=1000, notify_overflow=OVERFLOW_SPILL, notify_spill_path=None,
+                 timeouts: Optional[AdaptiveTimeouts]=None, coalesce: Optional[dict[str, float]]=None,
+                 warm_standby=False, record_path=None, message_log: Optional[MessageLogger]=None,
+                 max_in_flight=4096, priority_window=64, background_share=0.25,
+                 rate_limits: Optional[dict[str, tuple[float, float]]]=None, rate_limit_groups: Optional[dict[str, str]]=None):
         self.logger = logging.getLogger(logger_name)
         
         self.websocket = None
+        # only guards the socket write; responses are matched to per-index futures
         self.websocket_lock = asyncio.Lock()
+        # when not `multiplexed`, at most one request is in flight at a time
+        # (the old behavior, for servers that can't handle pipelined requests)
+        self.multiplexed = multiplexed
+        self._round_trip_lock = asyncio.Lock()
 
         self.uri = None
+        # with `warm_standby`, `reconnect()` takes over an already open spare connection
+        # (see `StandbyWebsocket`), created on the first `connect()`
+        self.warm_standby = warm_standby
+        self.standby: Optional[StandbyWebsocket] = None
 
         self.proto = proto
+        # method/message lookups are resolved here once instead of per request
+        self.registry = ProtoRegistry(proto)
 
         self.index = 0
-        self.requests = {}
-        self.responses = {}
-
+        # bounded; see `InFlightTable` for how late responses are kept from reaching the wrong request
+        self.requests = InFlightTable(min(max_in_flight, MAX_MSG_INDEX))
+        # interactive requests go before background ones (see `background()`)
+        self.scheduler = RequestScheduler(priority_window, background_share)
+        # token buckets per method group: bursts of requests are spread out (queued, not
+        # rejected) so that the server has no reason to throttle or kick the session
+        self.rate_limiter = RateLimiter(rate_limits, rate_limit_groups)
+        # per-method response timeouts, from the latencies seen so far
+        self.timeouts = timeouts or AdaptiveTimeouts(ceiling=self._RESPONSE_TIMEOUT_DURATION)
+        # per-method request/error/byte counters; see `metrics_snapshot()`
+        self.metrics = RpcMetrics()
+
+        # single-flight: methodName -> seconds a response may be reused for (0: only while
+        # in flight). Concurrent calls to these (read-only!) methods with identical
+        # arguments share one request; see `_coalesced_send()`
+        self.coalesce = dict(coalesce or {})
+        # (wrapper name, request bytes) -> shared `send()` task
+        self._shared_requests = {}
+        # (wrapper name, request bytes) -> (expiry, response bytes)
+        self._shared_responses = {}
+        # methodName -> number of calls answered without a request of their own
+        self.coalesced_calls = Counter()
+
+        # name -> list of (callback, raw) tuples; see `subscribe()`
         self._subscriptions = {}
         self._subscriptions_lock = asyncio.Lock()
-
-        self.MostRecentNotify = None
-        self.Notifications = asyncio.Queue()
+        # name -> number of notifications dropped (undecoded) for lack of subscribers
+        self.unsubscribed_notifies = Counter()
+        # name -> number of notifications dropped because they couldn't be decoded (or keyed)
+        self.failed_notifies = Counter()
+
+        # digests of recent notify payloads. Duplicates can arrive next to each other
+        # or interleaved with other notifications (A, B, A)
+        self._recent_notifies = DigestWindow(notify_dedup_size, notify_dedup_age)
+        # name -> number of duplicate notifications dropped
+        self.duplicate_notifies = Counter()
+        # bounded in memory; see `NotificationQueue` for the overflow policies and the queue
+        # metrics. Not "block" by default: a full queue would stop `listen()`, and with it the
+        # responses a subscriber calling `call()` is waiting for
+        self.Notifications = NotificationQueue(notify_queue_size, notify_overflow, notify_spill_path)
+        # runs the subscriber callbacks; see `NotifyDispatcher` for the ordering guarantees
+        self.dispatcher = NotifyDispatcher(notify_concurrency, self.logger, notify_max_pending)
         self.log_messages = log_messages
+        # how the messages are logged with `log_messages` (sampling, truncation, raw payloads)
+        self.message_log = message_log or MessageLogger(self.logger)
+        # every frame sent and received is appended here; see `recorder.py`
+        self.recorder: Optional[FrameRecorder] = None
+        if record_path is not None:
+            self.start_recording(record_path)
 
         self.sustain_task: Optional[asyncio.Task] = None
         self.listen_task: Optional[asyncio.Task] = None
         self.eventloop_task: Optional[asyncio.Task] = None
+        self.reap_task: Optional[asyncio.Task] = None
+
+        # set when the connection drops on its own (not by `clean_up()`); see `supervise()`
+        self.disconnected = asyncio.Event()
+        # set while the session is usable; cleared while `supervise()` restores it
+        self.session_ready = asyncio.Event()
+        # bumped every time `supervise()` restores the session
+        self.session_generation = 0
+        self.reconnects = 0
+        # seconds from losing the connection to having the session back, latest restore
+        self.restore_seconds = None
+
+        # keepalive (see `sustain()`): smoothed ping round trip time and its variation
+        # (seconds; None until the first pong), the current ping interval and the
+        # number of pongs missed in a row
+        self.rtt: Optional[float] = None
+        self.rtt_var: Optional[float] = None
+        self.keepalive_interval = self._KEEPALIVE_INTERVAL
+        self.missed_pongs = 0
+        self.supervisor_task: Optional[asyncio.Task] = None
     
     async def clean_up(self):
         """
         close the connection, kill the asyncio tasks and reset the variables
-        (except self.uri and the subscriptions).
+        (except self.uri, the subscriptions, the notifications not dispatched yet, and
+        the duplicate-notification window, so a notification re-sent right after
+        reconnecting is still dropped).
         This prepares for starting another connection with `self.connect()`
         while keeping the same subscriptions.
         """
         self.sustain_task.cancel()
         self.listen_task.cancel()
         self.eventloop_task.cancel()
+        self.reap_task.cancel()
 
         self.index = 0
-        self.requests = {}
-        self.responses = {}
-        
-        self.MostRecentNotify = None
-        self.Notifications = asyncio.Queue()
+        self._fail_in_flight()
+        self.requests.clear()
+        # responses from the old session must not be reused in the new one
+        self._shared_requests = {}
+        self._shared_responses = {}
+
+        # the spare connection and its health checks; `connect()` starts them again
+        if self.standby is not None:
+            await self.standby.stop()
 
         await self.close() # lock?
 
     async def reconnect(self):
         """
         calls `self.clean_up()` and reconnect with the existing `self.uri`
+        (through the standby connection, if there is a healthy one)
         """
+        # taken before `clean_up()` stops the standby
+        standby = self.standby.take() if self.standby is not None else None
         await self.clean_up()
-        await self.connect(self.uri)
+        await self.connect(self.uri, standby)
 
-    async def connect(self, uri):
+    async def connect(self, uri, websocket=None):
+        """
+        Connects to `uri`, or adopts `websocket`, an already open connection to it.
+        """
         self.uri = uri
 
-        self.websocket = await websockets.connect(self.uri)
+        if websocket is None:
+            # `sustain()` owns the keepalive; no second ping loop from the library
+            self.websocket = await websockets.connect(self.uri, ping_interval=None)
+            self.logger.info(f'Connected to {self.uri}')
+        else:
+            self.websocket = websocket
+            self.logger.info(f'Connected to {self.uri} (standby connection)')
 
-        self.logger.info(f'Connected to {self.uri}')
+        # only for real servers (not e.g. "replay:" URIs, see `recorder.replay()`)
+        if self.warm_standby and self.uri.startswith(('ws://', 'wss://')):
+            if self.standby is None:
+                self.standby = StandbyWebsocket(self.uri, logger=self.logger)
+            self.standby.start()
+        self.disconnected.clear()
 
         self.sustain_task = asyncio.create_task(self.sustain())
         self.listen_task = asyncio.create_task(self.listen())
         self.eventloop_task = asyncio.create_task(self.eventloop())
+        self.reap_task = asyncio.create_task(self.reap())
 
-    async def sustain(self, ping_interval=3):
+    async def reap(self, reap_interval=30):
         '''
-        Looping coroutine that keeps the connection to the server alive.
+        Looping coroutine that drops abandoned entries of the in-flight table
+        (see `InFlightTable.reap()`).
         '''
+        try:
+            while True:
+                await asyncio.sleep(reap_interval)
+                reaped = self.requests.reap()
+                if reaped:
+                    self.logger.warning(f"Reaped {reaped} abandoned in-flight request(s).")
+        except asyncio.CancelledError:
+            self.logger.info("`reap` task cancelled")
+
+    async def sustain(self):
+        '''
+        Looping coroutine that keeps the connection to the server alive and checks that
+        it still is: every ping must be answered within `_PONG_TIMEOUT` seconds.
+
+        - the round trip times are smoothed into `self.rtt`/`self.rtt_var` (as TCP does);
+        - the interval starts at `_KEEPALIVE_INTERVAL`, grows (up to
+          `_KEEPALIVE_MAX_INTERVAL`) while nothing is in flight, goes back to the
+          base interval when requests are, and drops to `_KEEPALIVE_MIN_INTERVAL`
+          after a missed pong;
+        - after `_MAX_MISSED_PONGS` missed pongs in a row, the connection is declared
+          dead: in-flight requests fail and `supervise()` takes over, instead of the
+          next request finding out the hard way.
+        '''
+        self.keepalive_interval = self._KEEPALIVE_INTERVAL
+        self.missed_pongs = 0
         try:
             while self.websocket.open:
-                await self.websocket.ping()
-                await asyncio.sleep(ping_interval)
+                sentAt = time.perf_counter()
+                try:
+                    pong = await self.websocket.ping()
+                    await asyncio.wait_for(pong, self._PONG_TIMEOUT)
+                except asyncio.TimeoutError:
+                    self.missed_pongs += 1
+                    self.logger.warning(f"No pong within {self._PONG_TIMEOUT}s ({self.missed_pongs} missed in a row).")
+                    if self.missed_pongs >= self._MAX_MISSED_PONGS:
+                        self.logger.warning("Connection is not responding; declaring it dead.")
+                        # no closing handshake: it would only wait for the dead peer
+                        self.websocket.transport.abort()
+                        self._fail_in_flight()
+                        self.disconnected.set()
+                        return
+                    self.keepalive_interval = self._KEEPALIVE_MIN_INTERVAL
+                else:
+                    self._record_rtt(time.perf_counter() - sentAt)
+                    self.missed_pongs = 0
+                    if len(self.requests):
+                        self.keepalive_interval = self._KEEPALIVE_INTERVAL
+                    else:
+                        self.keepalive_interval = min(self.keepalive_interval * 1.5, self._KEEPALIVE_MAX_INTERVAL)
+
+                await asyncio.sleep(self.keepalive_interval)
+        except ConnectionClosed:
+            # `listen()` notices as well
+            pass
         except asyncio.CancelledError:
             self.logger.info("`sustain` task cancelled")
 
-    async def subscribe(self, name, cb):
+    def _record_rtt(self, sample):
+        if self.rtt is None:
+            self.rtt = sample
+            self.rtt_var = sample / 2
+        else:
+            self.rtt_var = 0.75 * self.rtt_var + 0.25 * abs(self.rtt - sample)
+            self.rtt = 0.875 * self.rtt + 0.125 * sample
+
+    async def subscribe(self, name, cb, raw=False):
+        '''
+        Registers `cb(name, msg)` to be awaited for every notification of the given type
+        (e.g. "NotifyContestGameEnd"). Notifications nobody subscribed to are never decoded.
+
+        With `raw=True`, the callback receives the undecoded payload (a bytes-like
+        memoryview into the received frame) instead of the message; use
+        `decode_notify(name, data)` to decode it when (and if) needed.
+        '''
         async with self._subscriptions_lock:
             if name in self._subscriptions:
-                self._subscriptions[name].append(cb)
+                self._subscriptions[name].append((cb, raw))
             else:
-                self._subscriptions[name] = [cb]
+                self._subscriptions[name] = [(cb, raw)]
+
+    def decode_notify(self, name, data):
+        '''
+        Decodes the payload of a notification, e.g. one handed to a `raw` subscriber.
+        '''
+        return self.registry.message(name).message_class.FromString(data)
 
     async def eventloop(self):
-        ''' Event loop running as a separate coroutine to listen(), otherwise we can run into deadlock. '''
+        '''
+        Event loop running as a separate coroutine to listen(), otherwise we can run into deadlock.
+        Callbacks are handed to `self.dispatcher` rather than awaited here, so a slow
+        subscriber doesn't delay the delivery of later notifications. When too many
+        notifications are being handled, the backlog stays in `self.Notifications`.
+        '''
         try:
             while True:
-                name, msg = await self.Notifications.get()
+                await self.dispatcher.wait_for_capacity()
+                name, data = await self.Notifications.get()
                 if name in self._subscriptions:
-                    for sub_callback in self._subscriptions[name]:
-                        await sub_callback(name, msg)
+                    subscriptions = self._subscriptions[name]
+
+                    # decode at most once, shared by all non-raw subscribers
+                    try:
+                        msg = None
+                        if not all(raw for _, raw in subscriptions):
+                            msg = self.decode_notify(name, data)
+                        key = self.dispatcher.key_for(name, msg)
+                    except Exception:
+                        # a malformed payload (or a raising `set_key()` function) mustn't
+                        # stop the delivery of the notifications after it
+                        self.failed_notifies[name] += 1
+                        self.logger.exception(f"Failed to decode notification {name}")
+                        continue
+
+                    callbacks = [(sub_callback, data if raw else msg) for sub_callback, raw in subscriptions]
+                    self.dispatcher.dispatch(name, key, callbacks)
                 else:
                     logging.debug(f"Notification for {name} had no subscribers.")
         except asyncio.CancelledError:
@@ -132,52 +362,212 @@ class MajsoulChannel():
         '''
         try:
             async for message in self.websocket:
-                msgType = int.from_bytes(message[0:1], 'little')
+                # slicing a memoryview doesn't copy; payloads are handed on as views into `message`
+                view = memoryview(message)
+                msgType = view[0]
+
+                if self.recorder is not None:
+                    self.recorder.record(DIRECTION_IN, view)
+
+                try:
+                    if msgType == MSG_TYPE_NOTIFY:
+                        await self._on_notify(view[1:])
+                    elif msgType == MSG_TYPE_RESPONSE:
+                        msgIndex = int.from_bytes(view[1:3], 'little')
+
+                        entry = self.requests.resolve(msgIndex)
+                        if entry is not None and not entry.future.done():
+                            name, data = decode_wrapper(view[3:])
+                            entry.future.set_result(data)
+                except FrameError as e:
+                    self.logger.error(e)
+        except asyncio.CancelledError:
+            # `clean_up()`; whoever cancelled us takes care of the connection
+            self.logger.info("`listen` task cancelled")
+            return
+        except ConnectionClosed as e:
+            self.logger.warning(f"Connection closed: {e}")
+        except Exception:
+            self.logger.exception("`listen` task crashed")
 
-                if msgType == MSG_TYPE_NOTIFY:
-                    msgPayload = message[1:]
-                    name, data = self.unwrap(msgPayload)
+        # the connection is gone (closed by the server, or dropped)
+        self._fail_in_flight()
+        self.disconnected.set()
 
-                    name = name.strip(f'.{self.proto.DESCRIPTOR.package}')
+    def _fail_in_flight(self):
+        '''
+        Fails every request still waiting for a response with `ConnectionLostError`
+        right away, instead of letting each of them run into its timeout.
+        '''
+        for entry in self.requests.entries():
+            if not entry.future.done():
+                entry.future.set_exception(ConnectionLostError())
+
+    async def restore_session(self):
+        '''
+        Called by `supervise()` after the connection was lost. Override this to log
+        back in; by default it only reconnects.
+        '''
+        await self.reconnect()
+
+    def start_supervisor(self, base_delay=1.0, max_delay=60.0):
+        '''
+        Starts `supervise()` (once) and marks the current session as ready.
+        Call this after connecting (and logging in).
+        '''
+        self.session_ready.set()
+        if self.supervisor_task is None or self.supervisor_task.done():
+            self.supervisor_task = asyncio.create_task(self.supervise(base_delay, max_delay))
 
+    async def supervise(self, base_delay=1.0, max_delay=60.0):
+        '''
+        Looping coroutine that restores the session (`restore_session()`) whenever
+        `self.disconnected` is set: by `listen()` when the connection drops, or by
+        `request_reconnect()`. Failed attempts are retried after a random delay between 0
+        and `base_delay * 2**attempt` seconds, at most `max_delay` ("full jitter", so that
+        many clients don't all reconnect in lockstep).
+        '''
+        try:
+            while True:
+                await self.disconnected.wait()
+                self.session_ready.clear()
+                self.logger.warning("Connection lost; restoring the session.")
+
+                lostAt = time.monotonic()
+                attempt = 0
+                while True:
                     try:
-                        msgDescriptor = self.message_lookup(name)
-                    except KeyError as e:
-                        logging.error(e)
-                        continue
+                        await self.restore_session()
+                        break
+                    except Exception as e:
+                        delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+                        attempt += 1
+                        self.logger.warning(f"Reconnection attempt {attempt} failed ({e!r}); retrying in {delay:.1f}s.")
+                        await asyncio.sleep(delay)
+
+                self.reconnects += 1
+                self.session_generation += 1
+                self.restore_seconds = time.monotonic() - lostAt
+                # also absorbs the `request_reconnect()`s made while we were at it
+                self.disconnected.clear()
+                self.session_ready.set()
+                self.logger.info(f"Session restored in {self.restore_seconds:.2f}s.")
+        except asyncio.CancelledError:
+            self.logger.info("`supervise` task cancelled")
 
-                    msgClass = pb.reflection.MakeClass(msgDescriptor)
+    def request_reconnect(self, generation=None):
+        '''
+        Asks `supervise()` to restore the session, e.g. after the server said we were logged
+        out. Pass the `session_generation` seen before the failed call: if the session has
+        been restored since, nothing happens.
+        '''
+        if generation is not None and generation != self.session_generation:
+            return
+        self.session_ready.clear()
+        self.disconnected.set()
 
-                    msg = msgClass()
-                    msg.ParseFromString(data)
+    async def wait_for_session(self, timeout:Optional[float]=None):
+        '''
+        Parks the caller until the session is ready; raises `ConnectionLostError` if it
+        isn't back within `timeout` seconds.
+        '''
+        if self.session_ready.is_set():
+            return
+        try:
+            await asyncio.wait_for(self.session_ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionLostError(f"Session not restored within {timeout}s")
 
-                    # Duplicate notifications can be received next to each other.
-                    # Never process the same message twice.
-                    if (name, msg) != self.MostRecentNotify:
-                        if self.log_messages:
-                            self.logger.info("Notification received.\nname\nmsg")
-                        self.MostRecentNotify = (name, msg)
+    async def _on_notify(self, msgPayload):
+        wrapperName, data = decode_wrapper(msgPayload)
 
-                        await self.Notifications.put((name, msg))
-                elif msgType == MSG_TYPE_RESPONSE:
-                    if self.log_messages:
-                        self.logger.info("Response received.")
-                    msgIndex = int.from_bytes(message[1:3], 'little')
-                    msgPayload = message[3:]
+        msgEntry = self.registry.message(wrapperName)
+        if msgEntry is None:
+            logging.error(f"Unknown notification type: {wrapperName}")
+            return
 
-                    if msgIndex in self.requests:
-                        name, data = self.unwrap(msgPayload)
-                        self.responses[msgIndex] = data
+        name = msgEntry.name
 
-                        resEvent = self.requests[msgIndex]
-                        resEvent.set()
-        except asyncio.CancelledError:
-            self.logger.info("`listen` task cancelled")
+        # the gateway also pushes traffic we don't care about (matching players,
+        # locks, notices...); don't spend time decoding it
+        if name not in self._subscriptions:
+            self.unsubscribed_notifies[name] += 1
+            return
+
+        # Duplicate notifications can be received. Never process the same
+        # message twice (e.g. writing two Game Results rows for one game).
+        if self._recent_notifies.seen(msgPayload):
+            self.duplicate_notifies[name] += 1
+            return
+
+        if self.log_messages:
+            self.message_log.notify(msgEntry, data)
+
+        # decoded lazily in `eventloop()`
+        await self.Notifications.put((name, data))
+
+    def metrics_snapshot(self):
+        '''
+        Everything the channel measures, as plain data (e.g. for `json.dumps()`):
+        per-method requests, latencies, timeouts, errors (by code and name) and bytes
+        (see `RpcMetrics`), plus connection and notification metrics.
+        '''
+        queue = self.Notifications
+        return {
+            'methods': self.metrics.snapshot(ERRORS, self.timeouts.histograms),
+            'in_flight': len(self.requests),
+            'in_flight_table': {
+                'quarantined': self.requests.quarantined,
+                'late_responses': self.requests.late_responses,
+                'orphaned_responses': self.requests.orphaned_responses,
+                'reaped': self.requests.reaped,
+            },
+            'coalesced_calls': dict(self.coalesced_calls),
+            'scheduler': self.scheduler.snapshot(),
+            'rate_limits': self.rate_limiter.snapshot(),
+            'connection': {
+                'connected': self.websocket is not None and self.websocket.open,
+                'reconnects': self.reconnects,
+                'restore_seconds': self.restore_seconds,
+                'rtt_seconds': self.rtt,
+                'rtt_var_seconds': self.rtt_var,
+                'keepalive_interval': self.keepalive_interval,
+                'missed_pongs': self.missed_pongs,
+            },
+            'notifications': {
+                'queue_depth': queue.depth,
+                'queue_max_depth': queue.max_depth,
+                'queue_wait_seconds_mean': queue.wait_seconds_mean,
+                'queue_wait_seconds_max': queue.wait_seconds_max,
+                'dropped': queue.dropped,
+                'spilled': queue.spilled,
+                'duplicates': dict(self.duplicate_notifies),
+                'unsubscribed': dict(self.unsubscribed_notifies),
+                'failed': dict(self.failed_notifies),
+                'pending_callbacks': self.dispatcher.pending,
+                'callbacks': {key: {'calls': stats.calls, 'errors': stats.errors,
+                                    'mean_seconds': stats.mean_seconds, 'max_seconds': stats.max_seconds}
+                              for key, stats in self.dispatcher.stats.items()},
+            },
+        }
+
+    def start_recording(self, path):
+        '''
+        Starts appending every frame sent and received to a new recording at `path`
+        (see `recorder.py` for the format and for replaying it).
+        '''
+        self.stop_recording()
+        self.recorder = FrameRecorder(path)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
 
     async def close(self):
         await self.websocket.close()
 
-    async def send(self, name:str, data:bytes):
+    async def send(self, name:str, data:bytes, timeout:Optional[float]=None):
         '''
         Sends a message/request to the server.
 
@@ -189,6 +579,10 @@ class MajsoulChannel():
                 Message payload to be sent. This needs to be a byte string. After creating a protobuf message 'msg'
                 you can call msg.SerializeToString() and pass it in as this parameter.
 
+            timeout : float
+                Seconds to wait for the response. Defaults to the method's adaptive timeout
+                (see `self.timeouts`).
+
         Info:
             The messages that are sent/received are formatted differently depending on the type of message (notify/request/response).
 
@@ -211,32 +605,105 @@ class MajsoulChannel():
                     |_______|_______ _______
         '''
 
-        msgIndex = self.index
-        self.index = (self.index + 1) % MAX_MSG_INDEX
+        priority = current_priority.get()
+
+        # before taking a slot of the window, which the wait would otherwise hold up
+        bucket = self.rate_limiter.bucket_for(name.rpartition('.')[2]) if self.rate_limiter.buckets else None
+        if bucket is not None:
+            await bucket.acquire(priority)
+
+        await self.scheduler.acquire(priority)
+        try:
+            if self.multiplexed:
+                return await self._send(name, data, timeout)
+
+            async with self._round_trip_lock:
+                return await self._send(name, data, timeout)
+        finally:
+            self.scheduler.release(priority)
 
-        wrapped = self.wrap(name, data)
-        message = MSG_TYPE_REQUEST.to_bytes(1, 'little') + msgIndex.to_bytes(2, 'little') + wrapped
+    def background(self):
+        '''
+        Context manager: requests sent inside it (including from the tasks created inside
+        it) are background traffic, sent after waiting interactive requests and never
+        taking more than `background_share` of the requests in flight. For periodic and
+        bulk work, so it can't delay what users are waiting for:
 
-        resEvent = asyncio.Event()
-        self.requests[msgIndex] = resEvent
+            with self.background():
+                await self.api.fetchContestGameRecords()
+        '''
+        return background()
 
-        async with self.websocket_lock:
-            await self.websocket.send(message)
+    async def _send(self, name:str, data:bytes, timeout:Optional[float]):
+        if timeout is None:
+            timeout = self.timeouts.timeout_for(name)
 
+        msgIndex = self.next_index()
+
+        # header, envelope and payload are written into one buffer
+        message = encode_frame(MSG_TYPE_REQUEST, msgIndex, name, data)
+
+        resFuture = asyncio.get_running_loop().create_future()
+        entry = self.requests.add(msgIndex, resFuture, name, timeout)
+
+        stats = self.metrics.method(name)
+        stats.requests += 1
+        stats.in_flight += 1
+        try:
+            # the lock only guards the write so that other requests can be sent
+            # while this one waits for its response
+            async with self.websocket_lock:
+                await self.websocket.send(message)
+            stats.bytes_sent += len(message)
+
+            if self.recorder is not None:
+                self.recorder.record(DIRECTION_OUT, message)
+
+            sentAt = time.perf_counter()
             try:
-                await asyncio.wait_for(resEvent.wait(), timeout=self._RESPONSE_TIMEOUT_DURATION)
+                res = await asyncio.wait_for(resFuture, timeout=timeout)
             except asyncio.TimeoutError:
-                del self.requests[msgIndex]
-                raise ResponseTimeoutError(self._RESPONSE_TIMEOUT_DURATION)
+                # the real latency is unknown; count it as (at least) the full timeout
+                self.timeouts.record(name, timeout)
+                stats.timeouts += 1
+                raise ResponseTimeoutError(timeout)
 
-            res = self.responses[msgIndex]
+            self.timeouts.record(name, time.perf_counter() - sentAt)
+            stats.bytes_received += len(res)
+            return res
+        except (ConnectionLostError, ConnectionClosed):
+            stats.connection_errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            # no-op if the table was cleared by `clean_up()` in the meantime
+            self.requests.release(msgIndex, entry)
+            # failed by `_fail_in_flight()` while the write was still pending: the write's
+            # own error is what propagates, mark this one as retrieved
+            if resFuture.done() and not resFuture.cancelled():
+                resFuture.exception()
+
+    def next_index(self):
+        '''
+        Returns the next free message index. Indices wrap around at `MAX_MSG_INDEX`;
+        any index still held by an in-flight request (or quarantined, see `InFlightTable`)
+        is skipped so that two requests can never be waiting on the same index.
+        '''
+        if self.requests.full:
+            raise MessageIndexExhaustedError(self.requests.max_size)
 
-            del self.responses[msgIndex]
-            del self.requests[msgIndex]
+        for _ in range(MAX_MSG_INDEX):
+            msgIndex = self.index
+            self.index = (self.index + 1) % MAX_MSG_INDEX
 
-            return res
+            if self.requests.is_free(msgIndex):
+                return msgIndex
+
+            self.logger.warning(f"Message index {msgIndex} is still in flight; skipping it.")
+
+        raise MessageIndexExhaustedError(MAX_MSG_INDEX)
 
-    async def call(self, methodName, **msgFields):
+    async def call(self, methodName, timeout:Optional[float]=None, **msgFields):
         '''
         Simpler method for sending requests. Looks up the request and processes the fields for you.
         Use this instead of MajsoulChannel.send
@@ -245,6 +712,9 @@ class MajsoulChannel():
             methodName : str
                 Name of the method to be called (without package name). Example: 'oauth2Login'
 
+            timeout : float
+                Overrides the method's adaptive response timeout for this call.
+
             **msgFields : dict
                 Fields to be entered into the protobuf message.
 
@@ -263,48 +733,153 @@ class MajsoulChannel():
             serviceName = msgFields['serviceName']
             del msgFields['serviceName']
 
-        methodDescriptor = self.method_lookup(methodName, serviceName)
+        method = self.resolve_method(methodName, serviceName)
+
+        # an empty message always serializes to nothing; the frame for it is prebuilt
+        # (e.g. `startManageGame`, `fetchContestGameRecords`: `ReqCommon` bodies)
+        reqMessage = method.request_class(**msgFields) if msgFields else None
+
+        return await self.call_method(method, reqMessage, timeout)
 
-        msgName = f'.{methodDescriptor.full_name}'
+    async def call_many(self, requests, max_concurrency:Optional[int]=None, all_or_nothing=False, timeout:Optional[float]=None):
+        '''
+        Sends a batch of independent requests concurrently (through `call()`) and returns
+        their responses in request order.
+
+        Param:
+            requests : iterable of (methodName, msgFields) pairs
+                Example: [('lockGamePlayer', {'account_id': 1}), ('lockGamePlayer', {'account_id': 2})]
+
+            max_concurrency : int
+                How many of them may be in flight at once; all of them if None.
+
+            all_or_nothing : bool
+                If False, a request that fails doesn't affect the others: its exception
+                takes its place in the returned list. If True, the first failure cancels
+                the requests not answered yet and is raised. Requests already answered
+                are not undone.
+
+            timeout : float
+                Passed on to every `call()`.
+        '''
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def call_one(methodName, msgFields):
+            if semaphore is None:
+                return await self.call(methodName, timeout, **msgFields)
+            async with semaphore:
+                return await self.call(methodName, timeout, **msgFields)
 
-        reqMessageClass = pb.reflection.MakeClass(methodDescriptor.input_type)
-        reqMessage = reqMessageClass(**msgFields)
+        tasks = [asyncio.ensure_future(call_one(methodName, dict(msgFields))) for methodName, msgFields in requests]
 
-        resData = await self.send(msgName, reqMessage.SerializeToString())
+        if not all_or_nothing:
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
-        resMessageClass = pb.reflection.MakeClass(methodDescriptor.output_type)
-        resMessage = resMessageClass()
-        resMessage.ParseFromString(resData)
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def call_method(self, method: MethodEntry, reqMessage=None, timeout:Optional[float]=None):
+        '''
+        Sends an already-built request for an already-resolved method (`MethodEntry`, see
+        `resolve_method()`) and returns the decoded response. This is what `call()` and the
+        generated stubs (`proto/liqi_<subset>_stubs.py`, e.g. `liqi_contest_manager_stubs.py`)
+        end up in; override this to wrap every request.
+
+        `reqMessage` may be None for a request without fields.
+        '''
+        reqData = reqMessage.SerializeToString() if reqMessage is not None else b''
+
+        if method.name in self.coalesce:
+            resData = await self._coalesced_send(method, reqData, timeout)
+        else:
+            resData = await self.send(method.full_name, reqData, timeout)
+            # anything else may have changed what the reused responses say
+            # (e.g. `createContestGame` -> `startManageGame`)
+            self._shared_responses.clear()
+
+        # every caller gets its own message, even when the response bytes are shared
+        resMessage = method.response_class.FromString(resData)
 
         if resMessage.error.code:
+            # don't keep handing out an error
+            self._shared_responses.pop((method.full_name, reqData), None)
+            self.metrics.method(method.full_name).record_error(resMessage.error.code)
             raise GeneralMajsoulError(resMessage.error.code, ERRORS.get(resMessage.error.code, 'Unknown error'))
 
         if self.log_messages:
-            self.logger.info(resMessage)
+            self.message_log.response(method, resData)
 
         return resMessage
 
-    def method_lookup(self, methodName, serviceName):
-        methodDescriptor = None
-
-        if serviceName:
-            serviceDescriptor = self.proto.DESCRIPTOR.services_by_name[serviceName]
-            methodDescriptor = serviceDescriptor.FindMethodByName(methodName)
+    async def _coalesced_send(self, method, reqData, timeout):
+        '''
+        `send()`, except that a call identical to one already in flight (same method and
+        request bytes) waits for that one's response instead of sending its own, and that
+        a response may be reused for `self.coalesce[method.name]` seconds.
+        '''
+        key = (method.full_name, reqData)
+
+        cached = self._shared_responses.get(key)
+        if cached is not None:
+            expiry, resData = cached
+            if expiry > time.monotonic():
+                self.coalesced_calls[method.name] += 1
+                return resData
+            del self._shared_responses[key]
+
+        shared = self._shared_requests.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self.send(method.full_name, reqData, timeout))
+            self._shared_requests[key] = shared
+            shared.add_done_callback(lambda future: self._on_shared_response(method, key, future))
         else:
-            for serviceDescriptor in self.proto.DESCRIPTOR.services_by_name.values():
-                try:
-                    methodDescriptor = serviceDescriptor.FindMethodByName(methodName)
-                    break
-                except KeyError:
-                    continue
+            self.coalesced_calls[method.name] += 1
+
+        # one caller giving up (e.g. being cancelled) must not cancel the request for the others
+        return await asyncio.shield(shared)
+
+    def _on_shared_response(self, method, key, future):
+        if self._shared_requests.get(key) is future:
+            del self._shared_requests[key]
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        ttl = self.coalesce.get(method.name, 0)
+        if ttl > 0:
+            now = time.monotonic()
+            # drop expired entries so the cache doesn't grow with every distinct request
+            for expiredKey in [k for k, (expiry, _) in self._shared_responses.items() if expiry <= now]:
+                del self._shared_responses[expiredKey]
+            self._shared_responses[key] = (now + ttl, future.result())
 
-        if methodDescriptor == None:
+    def resolve_method(self, methodName, serviceName=None):
+        '''
+        Returns the precomputed `MethodEntry` (wrapper name, request and response classes)
+        for the given method.
+        '''
+        method = self.registry.method(methodName, serviceName)
+
+        if method is None:
             raise MethodNotFoundError(methodName, self.proto.__name__)
 
-        return methodDescriptor
+        return method
+
+    def method_lookup(self, methodName, serviceName):
+        return self.resolve_method(methodName, serviceName).descriptor
 
     def message_lookup(self, messageName):
-        return self.proto.DESCRIPTOR.message_types_by_name[messageName]
+        msgEntry = self.registry.message(messageName)
+
+        if msgEntry is None:
+            raise KeyError(messageName)
+
+        return msgEntry.descriptor
 
     def wrap(self, name, data):
         msg = self.proto.Wrapper(name=name, data=data)
@@ -2,6 +2,8 @@ import asyncio
 import random
 
 from .channel import MajsoulChannel
+from .proto.liqi_lobby_records_stubs import LobbyStub
+from .proto.liqi_contest_manager_stubs import CustomizedContestManagerApiStub
 from .mjsoul import get_contest_management_servers
 
 class MajsoulClient(MajsoulChannel):
@@ -9,17 +11,16 @@ class MajsoulClient(MajsoulChannel):
         super().__init__(proto, log_messages)
 
         self._access_token = access_token
+        self.lobby = LobbyStub(self)
     
     async def login(self):    
-        res = await self.call(
-            methodName = 'oauth2Login',
+        res = await self.lobby.oauth2Login(
             type = 10,
             access_token = self._access_token,
         )
     
     async def fetch_game_log(self, uuid):
-        res = await self.call(
-            methodName = 'fetchGameRecord',
+        res = await self.lobby.fetchGameRecord(
             game_uuid = uuid
         )
 
@@ -27,16 +28,18 @@ class MajsoulClient(MajsoulChannel):
 
 class ContestManagerClient(MajsoulChannel):
     def __init__(self, proto, access_token, log_messages=True):
-        super().__init__(proto, log_messages)
+        # the properties below all fetch the same read-only lists
+        super().__init__(proto, log_messages, coalesce={'startManageGame': 0, 'fetchContestPlayer': 0})
 
         self._access_token = access_token
+        self.api = CustomizedContestManagerApiStub(self)
         self._contest_players = []
         self._active_players = []
         self._ongoing_games = []
 
     @property
     async def contest_players(self):
-        res = await self.call('fetchContestPlayer')
+        res = await self.api.fetchContestPlayer()
 
         self._contest_players = res.players
 
@@ -44,7 +47,7 @@ class ContestManagerClient(MajsoulChannel):
     
     @property
     async def active_players(self):
-        res = await self.call('startManageGame')
+        res = await self.api.startManageGame()
         
         self._active_players = res.players
 
@@ -52,15 +55,14 @@ class ContestManagerClient(MajsoulChannel):
 
     @property
     async def ongoing_games(self):
-        res = await self.call('startManageGame')
+        res = await self.api.startManageGame()
 
         self._ongoing_games = res.games
 
         return self._ongoing_games
 
     async def login(self):    
-        res = await self.call(
-            methodName = 'oauth2LoginContestManager',
+        res = await self.api.oauth2LoginContestManager(
             type = 10,
             access_token = self._access_token,
             reconnect = True
@@ -72,7 +74,7 @@ class ContestManagerClient(MajsoulChannel):
         return the game id
         '''
 
-        res = await self.call('startManageGame')
+        res = await self.api.startManageGame()
         
         for game in res.games:
             for player in game.players:
@@ -80,17 +82,17 @@ class ContestManagerClient(MajsoulChannel):
                     return game.game_uuid
 
     async def pause(self, game_uuid):
-        res = await self.call('pauseGame', uuid=game_uuid)
+        res = await self.api.pauseGame(uuid=game_uuid)
     
     async def unpause(self, game_uuid):
-        res = await self.call('resumeGame', uuid=game_uuid)
+        res = await self.api.resumeGame(uuid=game_uuid)
 
     async def terminate(self, game_uuid):
-        res = await self.call('terminateGame', serviceName='CustomizedContestManagerApi', uuid=game_uuid)
+        res = await self.api.terminateGame(uuid=game_uuid)
     
     async def display_players(self, res=None):
         if res == None:
-            res = await self.call('startManageGame')
+            res = await self.api.startManageGame()
 
         self._ongoing_games = res.games
         self._active_players = res.players
@@ -98,7 +100,7 @@ class ContestManagerClient(MajsoulChannel):
         return (res.games, res.players)
 
     async def get_player_nickname(self, playerID):
-        res = await self.call('fetchContestPlayer')
+        res = await self.api.fetchContestPlayer()
 
         for player in res.players:
             if player.account_id == playerID:
@@ -106,38 +108,62 @@ class ContestManagerClient(MajsoulChannel):
         
         return None
     
+    async def lock_players(self, playerIDs):
+        '''
+        lock the players (0 is AI) all at once; if any of them can't be locked, the
+        others are unlocked again and the error is raised
+        '''
+        humans = [pid for pid in playerIDs if pid > 0]
+        results = await self.call_many([('lockGamePlayer', {'account_id': pid}) for pid in humans])
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            await self.unlock_players([pid for pid, r in zip(humans, results) if not isinstance(r, Exception)])
+            raise errors[0]
+
+    async def unlock_players(self, playerIDs):
+        await self.call_many([('unlockGamePlayer', {'account_id': pid}) for pid in playerIDs if pid > 0])
+
+    def _create_game_request(self, playerIDs):
+        return ('createContestGame', {
+            'slots': [self.proto.ReqCreateContestGame.Slot(account_id=pid) for pid in playerIDs],
+            'random_position': True,
+            'open_live': True,
+            'ai_level': 2
+        })
+
     async def create_game(self, playerIDs):
-        playerList = []
-        for pid in playerIDs:
-            playerList.append(self.proto.ReqCreateContestGame.Slot(account_id=pid))
-            # 0 is AI
-            if pid > 0:
-                await self.call('lockGamePlayer', account_id=pid)
-        res = await self.call(
-            methodName='createContestGame',
-            slots = playerList,
-            random_position=True,
-            open_live=True,
-            ai_level=2
-        )
+        await self.lock_players(playerIDs)
+        methodName, msgFields = self._create_game_request(playerIDs)
+        try:
+            res = await self.call(methodName, **msgFields)
+        except Exception:
+            await self.unlock_players(playerIDs)
+            raise
         return res.game_uuid
     
     async def create_random_games(self):
-        res = await self.call('startManageGame')
+        '''
+        seat the active players at random tables of 4 (the rest wait) and start all the
+        games at once; returns the `game_uuid`s, or the exception for a game that couldn't
+        be created (its players are unlocked again; the other tables aren't affected)
+        '''
+        res = await self.api.startManageGame()
 
-        players = res.players
+        players = list(res.players)
 
-        i = 0
+        tables = []
         table = []
         while len(players) > 0:
             p = random.choice(players)
             players.remove(p)
-            i += 1
             table.append(p.account_id)
             
-            if i == 4:
-                await self.create_game(table)
-                i = 0
+            if len(table) == 4:
+                tables.append(table)
+                table = []
+
+        return await asyncio.gather(*(self.create_game(table) for table in tables), return_exceptions=True)
 
 async def main():
     pass
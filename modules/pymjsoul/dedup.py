@@ -0,0 +1,49 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+class DigestWindow():
+    '''
+    Remembers digests of recently seen payloads, bounded both in count (`max_size`)
+    and in age (`max_age` seconds), so that repeats can be recognized without
+    decoding or comparing whole messages.
+    '''
+    def __init__(self, max_size=256, max_age=60.0):
+        self.max_size = max_size
+        self.max_age = max_age
+
+        # digest -> time first seen; oldest first
+        self._digests = OrderedDict()
+
+    def __len__(self):
+        return len(self._digests)
+
+    def seen(self, payload) -> bool:
+        '''
+        Returns True if `payload` was already seen within the window.
+        Otherwise records it and returns False.
+        '''
+        now = time.monotonic()
+        self._expire(now)
+
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+        if digest in self._digests:
+            return True
+
+        self._digests[digest] = now
+        if len(self._digests) > self.max_size:
+            self._digests.popitem(last=False)
+
+        return False
+
+    def clear(self):
+        self._digests.clear()
+
+    def _expire(self, now):
+        cutoff = now - self.max_age
+        while self._digests:
+            digest, firstSeen = next(iter(self._digests.items()))
+            if firstSeen >= cutoff:
+                break
+            del self._digests[digest]
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+
+def default_notify_key(msg):
+    '''
+    Ordering key for a decoded notification: its game's UUID when it has one
+    (`NotifyContestGameEnd.game_uuid`, `NotifyContestGameStart.game_info.game_uuid`).
+    '''
+    game_uuid = getattr(msg, 'game_uuid', None)
+    if game_uuid:
+        return game_uuid
+
+    game_info = getattr(msg, 'game_info', None)
+    if game_info is not None:
+        return getattr(game_info, 'game_uuid', None) or None
+
+    return None
+
+class CallbackStats():
+    __slots__ = ('calls', 'errors', 'total_seconds', 'max_seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def mean_seconds(self):
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds, failed):
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def __repr__(self):
+        return f'<CallbackStats calls={self.calls} errors={self.errors} mean={self.mean_seconds:.3f}s max={self.max_seconds:.3f}s>'
+
+class NotifyDispatcher():
+    '''
+    Runs subscriber callbacks as tasks so that one slow callback (e.g. one that sleeps and
+    then writes to Google Sheets) doesn't hold up every later notification.
+
+    - at most `concurrency` notifications of the same type are handled at once
+      (per-type limits can be set with `set_concurrency()`);
+    - notifications with the same ordering key (see `set_key()`; the game UUID by default)
+      are handled strictly in arrival order, whatever their type (a game's
+      `NotifyContestGameStart` before its `NotifyContestGameEnd`). Notifications without
+      a key are handled in arrival order relative to other keyless notifications of the
+      same type;
+    - the callbacks of a single notification are awaited one after another, in
+      subscription order, as before.
+
+    At most `max_pending` notifications are scheduled at a time; `wait_for_capacity()` lets
+    the producer hold off (so that the backlog stays in the bounded notification queue).
+
+    Per-callback latency and error counts are kept in `self.stats`.
+    '''
+    def __init__(self, concurrency=4, logger=None, max_pending=100):
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.default_concurrency = concurrency
+        self.max_pending = max_pending
+        self._concurrency = {}
+        self._semaphores = {}
+        self._key_funcs = {}
+
+        # (None, key), or (name, None) for keyless notifications -> task handling the
+        # latest notification with that key
+        self._tails = {}
+        self._tasks = set()
+
+        # "NotifyName:callback_qualname" -> CallbackStats
+        self.stats = {}
+
+    @property
+    def pending(self):
+        return len(self._tasks)
+
+    def set_concurrency(self, name, limit):
+        self._concurrency[name] = limit
+        self._semaphores.pop(name, None)
+
+    def set_key(self, name, key_func):
+        '''
+        `key_func(msg)` returns the ordering key of a decoded notification of type `name`.
+        '''
+        self._key_funcs[name] = key_func
+
+    def key_for(self, name, msg):
+        if msg is None:
+            return None
+
+        return self._key_funcs.get(name, default_notify_key)(msg)
+
+    def dispatch(self, name, key, callbacks):
+        '''
+        Schedules `callbacks` (a list of `(callback, argument)` pairs, each called as
+        `callback(name, argument)`) and returns the task without waiting for it.
+        '''
+        tailKey = (None, key) if key is not None else (name, None)
+        previous = self._tails.get(tailKey)
+
+        task = asyncio.create_task(self._run(name, tailKey, previous, callbacks))
+        self._tails[tailKey] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
+    async def wait_for_capacity(self):
+        while len(self._tasks) >= self.max_pending:
+            await asyncio.wait(list(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    async def join(self):
+        '''
+        Waits until every scheduled notification has been handled.
+        '''
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    def _semaphore(self, name):
+        semaphore = self._semaphores.get(name)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._concurrency.get(name, self.default_concurrency))
+            self._semaphores[name] = semaphore
+
+        return semaphore
+
+    async def _run(self, name, tailKey, previous, callbacks):
+        try:
+            # keep per-key ordering; whatever happened to the previous one doesn't matter here
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            async with self._semaphore(name):
+                for callback, argument in callbacks:
+                    await self._invoke(name, callback, argument)
+        finally:
+            if self._tails.get(tailKey) is asyncio.current_task():
+                del self._tails[tailKey]
+
+    async def _invoke(self, name, callback, argument):
+        statsKey = f'{name}:{getattr(callback, "__qualname__", repr(callback))}'
+        stats = self.stats.get(statsKey)
+        if stats is None:
+            stats = self.stats[statsKey] = CallbackStats()
+
+        failed = False
+        start = time.perf_counter()
+        try:
+            await callback(name, argument)
+        except Exception:
+            failed = True
+            self.logger.exception(f"Subscriber {statsKey} raised an exception.")
+        finally:
+            stats.record(time.perf_counter() - start, failed)
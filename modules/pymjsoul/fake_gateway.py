@@ -0,0 +1,416 @@
+'''
+A local stand-in for the contest manager gateway (`MS_MANAGER_WSS_ENDPOINT`), for
+trying things out, reproducing bugs and benchmarking without Mahjong Soul.
+
+It speaks the same framing as `MajsoulChannel` (3-byte headers, `Wrapper` envelopes)
+and implements the `CustomizedContestManagerApi` methods the bot uses, with a
+simulated contest: players "prepare for match" with `add_ready_player()`, get locked
+with `lockGamePlayer` and seated with `createContestGame`, which sends
+`NotifyContestGameStart` to every session that called `startManageGame`. Games end
+with `end_game()` (or after `game_duration` seconds), which adds a record for
+`fetchContestGameRecords` and sends `NotifyContestGameEnd`.
+
+Every response is delayed by `latency` (plus up to `jitter`) seconds, or the
+per-method `method_latency`. Errors can be injected with `fail_next()` or at random
+with `error_rate`, and `disconnect_all()` drops every connection.
+
+    async with FakeContestGateway(latency=0.05) as gateway:
+        contest_manager.MS_MANAGER_WSS_ENDPOINT = gateway.uri
+        manager = ContestManager(gateway.contest.unique_id, ...)
+        await manager.connect_and_login()
+
+Standalone:
+    python -m modules.pymjsoul.fake_gateway --port 8765 --latency 0.05
+'''
+import argparse
+import asyncio
+import hashlib
+import hmac
+import logging
+import random
+import secrets
+import time
+from collections import defaultdict, deque
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from .proto import liqi_combined_pb2 as pb2
+from .registry import ProtoRegistry
+from .framing import FrameError, HEADER, HEADER_SIZE, encode_frame, decode_wrapper
+
+MSG_TYPE_NOTIFY = 1
+MSG_TYPE_REQUEST = 2
+MSG_TYPE_RESPONSE = 3
+
+SERVICE_NAME = 'CustomizedContestManagerApi'
+# the only methods that work before logging in
+LOGIN_METHODS = {'loginContestManager', 'oauth2LoginContestManager'}
+
+# see errors.py
+ERR_METHOD_NOT_FOUND = 6
+ERR_TOKEN_INVALID = 1202
+ERR_GAME_NOT_EXIST = 1203
+ERR_CONTEST_NOT_FOUND = 2501
+ERR_CONTEST_MGR_HAS_LOGINED = 2504
+ERR_CONTEST_MGR_NOT_LOGIN = 2505
+ERR_CONTEST_PLAYER_NOT_MATCHING = 2509
+
+class _Session():
+    __slots__ = ('websocket', 'logged_in', 'managing', 'notify')
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.logged_in = False
+        self.managing = False
+        # receives the game notifications (after `startManageGame`)
+        self.notify = False
+
+class FakeContestGateway():
+    def __init__(self, host='localhost', port=0, latency=0.0, jitter=0.0, method_latency=None,
+                 error_rate=0.0, error_code=2, game_duration=None, password=None,
+                 contest_unique_id=1000, contest_name="Fake Contest", players=None, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        # method name -> latency, instead of `latency`
+        self.method_latency = dict(method_latency or {})
+        self.error_rate = error_rate
+        self.error_code = error_code
+        # seconds after which a created game ends by itself; None: only with `end_game()`
+        self.game_duration = game_duration
+        # when set, `loginContestManager` checks the (HMAC'd) password
+        self.password = password
+        self.random = random.Random(seed)
+
+        self.registry = ProtoRegistry(pb2)
+        self.contest = pb2.CustomizedContest(unique_id=contest_unique_id, contest_id=contest_unique_id,
+                                             contest_name=contest_name, open=True)
+        # account_id -> nickname of everyone in the contest
+        self.players = dict(players or {})
+        # account_id -> nickname of the players who pressed "prepare for match"
+        self.ready = {}
+        self.locked = set()
+        # game_uuid -> ContestGameInfo
+        self.games = {}
+        self.paused = set()
+        # finished games, newest first
+        self.records = deque()
+        self.access_tokens = set()
+
+        # method name -> deque of error codes for the next calls
+        self._failures = defaultdict(deque)
+        self._sessions = set()
+        self._tasks = set()
+        self._server = None
+
+        # method name -> number of requests received
+        self.calls = defaultdict(int)
+        self.notifications_sent = 0
+
+        self.logger = logging.getLogger("FakeContestGateway")
+
+    @property
+    def uri(self):
+        return f'ws://{self.host}:{self.port}'
+
+    async def start(self):
+        self._server = await websockets.serve(self._serve, self.host, self.port)
+        # the actual port, for `port=0`
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(f"Listening on {self.uri}")
+        return self.uri
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    """
+    =====================================================
+    SIMULATION / FAULT INJECTION
+    =====================================================
+    """
+
+    def add_player(self, account_id, nickname):
+        self.players[account_id] = nickname
+
+    def add_ready_player(self, account_id, nickname=None):
+        '''
+        The player pressed "prepare for match" (and can now be locked and seated).
+        '''
+        nickname = nickname or self.players.get(account_id) or f'player{account_id}'
+        self.players.setdefault(account_id, nickname)
+        self.ready[account_id] = nickname
+
+    def fail_next(self, methodName, code, times=1):
+        '''
+        The next `times` calls of `methodName` fail with error `code`.
+        '''
+        self._failures[methodName].extend([code] * times)
+
+    async def disconnect_all(self):
+        for session in list(self._sessions):
+            await session.websocket.close()
+
+    def end_game(self, game_uuid, points=None):
+        '''
+        Ends an ongoing game: adds its record (with `points`, the final scores by seat;
+        25000 each by default) and sends `NotifyContestGameEnd`.
+        '''
+        game = self.games.pop(game_uuid, None)
+        if game is None:
+            return False
+        self.paused.discard(game_uuid)
+
+        points = points or [25000] * len(game.players)
+        record = pb2.RecordGame(uuid=game_uuid, start_time=game.start_time, end_time=int(time.time()))
+        for seat, player in enumerate(game.players):
+            if player.account_id:
+                record.accounts.add(account_id=player.account_id, seat=seat, nickname=player.nickname)
+        ranked = sorted(range(len(points)), key=lambda seat: -points[seat])
+        for seat in ranked:
+            record.result.players.add(seat=seat, total_point=points[seat] - 25000, part_point_1=points[seat])
+        self.records.appendleft(pb2.ResFetchCustomizedContestGameRecordList.Item(record=record))
+
+        self.notify_all(pb2.NotifyContestGameEnd(unique_id=self.contest.unique_id, game_uuid=game_uuid))
+        return True
+
+    """
+    =====================================================
+    TRANSPORT
+    =====================================================
+    """
+
+    async def _serve(self, websocket, path=None):
+        session = _Session(websocket)
+        self._sessions.add(session)
+        try:
+            async for message in websocket:
+                if not isinstance(message, bytes) or len(message) < HEADER_SIZE or message[0] != MSG_TYPE_REQUEST:
+                    continue
+                _, msgIndex = HEADER.unpack_from(message)
+                # concurrently, so a slow method doesn't hold up the others
+                self._spawn(self._respond(session, msgIndex, memoryview(message)[HEADER_SIZE:]))
+        except ConnectionClosed:
+            pass
+        finally:
+            self._sessions.discard(session)
+
+    def _spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _respond(self, session, msgIndex, payload):
+        try:
+            name, data = decode_wrapper(payload)
+        except FrameError as e:
+            self.logger.error(e)
+            return
+
+        methodName = name.rsplit('.', 1)[-1]
+        self.calls[methodName] += 1
+        method = self.registry.method(methodName, SERVICE_NAME)
+
+        delay = self.method_latency.get(methodName, self.latency)
+        if self.jitter:
+            delay += self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if method is None:
+            res = pb2.ResCommon(error=pb2.Error(code=ERR_METHOD_NOT_FOUND))
+        else:
+            res = self._handle(session, method, method.request_class.FromString(data))
+
+        try:
+            await session.websocket.send(encode_frame(MSG_TYPE_RESPONSE, msgIndex, '', res.SerializeToString()))
+        except ConnectionClosed:
+            pass
+
+    def notify_all(self, message):
+        '''
+        Sends the notification `message` (e.g. a `NotifyContestGameEnd`) to every
+        session that called `startManageGame`.
+        '''
+        frame = bytes([MSG_TYPE_NOTIFY]) + pb2.Wrapper(
+            name=f'.lq.{message.DESCRIPTOR.name}', data=message.SerializeToString()).SerializeToString()
+        for session in self._sessions:
+            if session.notify:
+                self.notifications_sent += 1
+                self._spawn(self._send_notify(session, frame))
+
+    async def _send_notify(self, session, frame):
+        try:
+            await session.websocket.send(frame)
+        except ConnectionClosed:
+            pass
+
+    """
+    =====================================================
+    API
+    =====================================================
+    """
+
+    def _handle(self, session, method, req):
+        res = method.response_class()
+
+        failures = self._failures.get(method.name)
+        if failures:
+            res.error.code = failures.popleft()
+            return res
+        if self.error_rate and method.name not in LOGIN_METHODS and self.random.random() < self.error_rate:
+            res.error.code = self.error_code
+            return res
+
+        handler = getattr(self, f'_on_{method.name}', None)
+        if handler is None:
+            # everything else (e.g. `updateContestGameRule`) just succeeds
+            code = None if session.logged_in else ERR_CONTEST_MGR_NOT_LOGIN
+        elif method.name not in LOGIN_METHODS and not session.logged_in:
+            code = ERR_CONTEST_MGR_NOT_LOGIN
+        else:
+            code = handler(session, req, res)
+
+        if code:
+            res.Clear()
+            res.error.code = code
+        return res
+
+    def _logged_in(self, session, res):
+        session.logged_in = True
+        res.account_id = 1
+        res.nickname = "FakeManager"
+
+    def _on_loginContestManager(self, session, req, res):
+        if session.logged_in:
+            return ERR_CONTEST_MGR_HAS_LOGINED
+        if self.password is not None and req.password != hmac.new(b"lailai", self.password.encode(), hashlib.sha256).hexdigest():
+            return ERR_TOKEN_INVALID
+
+        self._logged_in(session, res)
+        if req.gen_access_token:
+            res.access_token = secrets.token_hex(16)
+            self.access_tokens.add(res.access_token)
+
+    def _on_oauth2LoginContestManager(self, session, req, res):
+        if session.logged_in:
+            return ERR_CONTEST_MGR_HAS_LOGINED
+        if req.access_token not in self.access_tokens:
+            return ERR_TOKEN_INVALID
+
+        self._logged_in(session, res)
+        res.access_token = req.access_token
+
+    def _on_manageContest(self, session, req, res):
+        if req.unique_id != self.contest.unique_id:
+            return ERR_CONTEST_NOT_FOUND
+        session.managing = True
+        res.contest.CopyFrom(self.contest)
+
+    def _on_fetchContestInfo(self, session, req, res):
+        res.contest.CopyFrom(self.contest)
+
+    def _on_startManageGame(self, session, req, res):
+        session.notify = True
+        for account_id, nickname in self.ready.items():
+            res.players.add(account_id=account_id, nickname=nickname)
+        res.games.extend(self.games.values())
+
+    def _on_fetchContestPlayer(self, session, req, res):
+        for account_id, nickname in self.players.items():
+            res.players.add(account_id=account_id, nickname=nickname)
+
+    def _on_searchAccountByEid(self, session, req, res):
+        # friend IDs are the account IDs here
+        for eid in req.eids:
+            if eid in self.players:
+                res.search_result.add(account_id=eid, nickname=self.players[eid])
+
+    def _on_lockGamePlayer(self, session, req, res):
+        if req.account_id not in self.ready:
+            return ERR_CONTEST_PLAYER_NOT_MATCHING
+        self.locked.add(req.account_id)
+
+    def _on_unlockGamePlayer(self, session, req, res):
+        self.locked.discard(req.account_id)
+
+    def _on_createContestGame(self, session, req, res):
+        humans = [slot.account_id for slot in req.slots if slot.account_id]
+        if any(account_id not in self.locked for account_id in humans):
+            return ERR_CONTEST_PLAYER_NOT_MATCHING
+
+        slots = list(req.slots)
+        if req.random_position:
+            self.random.shuffle(slots)
+
+        game_uuid = f'{time.strftime("%y%m%d")}-{secrets.token_hex(16)}'
+        game = pb2.ContestGameInfo(game_uuid=game_uuid, start_time=int(time.time()))
+        for slot in slots:
+            game.players.add(account_id=slot.account_id, nickname=self.ready.get(slot.account_id, ''))
+        for account_id in humans:
+            self.locked.discard(account_id)
+            self.ready.pop(account_id, None)
+
+        self.games[game_uuid] = game
+        res.game_uuid = game_uuid
+
+        self.notify_all(pb2.NotifyContestGameStart(unique_id=self.contest.unique_id, game_info=game))
+        if self.game_duration is not None:
+            asyncio.get_running_loop().call_later(self.game_duration, self.end_game, game_uuid)
+
+    def _on_fetchContestGameRecords(self, session, req, res):
+        res.record_list.extend(self.records)
+
+    def _on_pauseGame(self, session, req, res):
+        if req.uuid not in self.games:
+            return ERR_GAME_NOT_EXIST
+        self.paused.add(req.uuid)
+
+    def _on_resumeGame(self, session, req, res):
+        if req.uuid not in self.games:
+            return ERR_GAME_NOT_EXIST
+        self.paused.discard(req.uuid)
+
+    def _on_terminateGame(self, session, req, res):
+        # ends without a record
+        if self.games.pop(req.uuid, None) is None:
+            return ERR_GAME_NOT_EXIST
+        self.paused.discard(req.uuid)
+        self.notify_all(pb2.NotifyContestGameEnd(unique_id=self.contest.unique_id, game_uuid=req.uuid))
+
+async def main(args):
+    gateway = FakeContestGateway(args.host, args.port, args.latency, args.jitter,
+                                 error_rate=args.error_rate, game_duration=args.game_duration,
+                                 contest_unique_id=args.contest_unique_id)
+    for account_id in range(1, args.ready_players + 1):
+        gateway.add_ready_player(account_id)
+
+    async with gateway:
+        print(f"Fake contest gateway on {gateway.uri} (contest {gateway.contest.unique_id})")
+        await asyncio.Future()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local fake Mahjong Soul contest manager gateway")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds before every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="up to this many extra seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of calls failing with ERR_SYSTEM_ERROR")
+    parser.add_argument('--game-duration', type=float, default=None, help="seconds until created games end")
+    parser.add_argument('--contest-unique-id', type=int, default=1000)
+    parser.add_argument('--ready-players', type=int, default=0, help="players 1..N start out ready")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,144 @@
+'''
+Building and parsing websocket frames without intermediate copies.
+
+A frame is a 1-byte message type, a 2-byte little-endian message index (requests and
+responses only) and a serialized `Wrapper { string name = 1; bytes data = 2; }`.
+`Wrapper` is simple enough to encode/decode by hand, which lets us write the header,
+the envelope and the payload into one buffer when sending, and hand out `memoryview`
+slices of the received frame (instead of copies) when receiving.
+
+Note that the protobuf runtime copies a memoryview it is asked to parse, so decoding a
+payload still costs one copy; the copies saved are the ones made while slicing and
+unwrapping, and those for payloads that end up never being decoded.
+'''
+import struct
+
+HEADER = struct.Struct('<BH')
+HEADER_SIZE = HEADER.size
+
+# Wrapper field tags (field number << 3 | wire type 2)
+_NAME_TAG = 0x0A
+_DATA_TAG = 0x12
+
+class FrameError(Exception):
+    def __init__(self, reason):
+        self.message = f"Malformed frame: {reason}"
+        super().__init__(self.message)
+
+def _varint(value):
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def _read_varint(view, pos):
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(view):
+            raise FrameError("truncated varint")
+        b = view[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+# wrapper name -> encoded `name` field; the same few method names are sent over and over.
+# For requests without a body (`ReqCommon`), this is also the whole wrapped payload.
+_name_fields = {}
+
+def name_field(name):
+    field = _name_fields.get(name)
+
+    if field is None:
+        encoded = name.encode()
+        # proto3 leaves out empty fields; do the same so the bytes match `Wrapper.SerializeToString()`
+        field = bytes((_NAME_TAG,)) + _varint(len(encoded)) + encoded if encoded else b''
+        _name_fields[name] = field
+
+    return field
+
+def wrapped_size(name, data):
+    size = len(name_field(name))
+    if len(data):
+        size += 1 + len(_varint(len(data))) + len(data)
+    return size
+
+def encode_wrapper_into(buffer, offset, name, data):
+    '''
+    Writes `Wrapper(name=name, data=data)` into `buffer` at `offset`; returns the end offset.
+    '''
+    # assigning through a memoryview copies straight from `data`; slice-assigning a
+    # `bytes` to a `bytearray` would first make a temporary copy of it
+    target = memoryview(buffer)
+
+    field = name_field(name)
+    end = offset + len(field)
+    target[offset:end] = field
+
+    if len(data):
+        prefix = bytes((_DATA_TAG,)) + _varint(len(data))
+        target[end:end + len(prefix)] = prefix
+        end += len(prefix)
+        target[end:end + len(data)] = data
+        end += len(data)
+
+    return end
+
+def encode_frame(msgType, msgIndex, name, data):
+    '''
+    Returns the complete frame (header + wrapped payload) in a single preallocated buffer.
+    '''
+    if not len(data):
+        return encode_empty_frame(msgType, msgIndex, name)
+
+    buffer = bytearray(HEADER_SIZE + wrapped_size(name, data))
+    HEADER.pack_into(buffer, 0, msgType, msgIndex)
+    encode_wrapper_into(buffer, HEADER_SIZE, name, data)
+    return buffer
+
+def encode_empty_frame(msgType, msgIndex, name):
+    '''
+    Frame for a request without a body: the wrapped payload is constant (and cached),
+    only the 3-byte header has to be written.
+    '''
+    return HEADER.pack(msgType, msgIndex) + name_field(name)
+
+def decode_wrapper(view):
+    '''
+    Parses a serialized `Wrapper` held in a memoryview.
+    Returns `(name, data)` where `data` is a memoryview slice of `view` (no copy).
+    '''
+    name = ''
+    data = view[0:0]
+
+    pos = 0
+    end = len(view)
+    while pos < end:
+        key, pos = _read_varint(view, pos)
+        wireType = key & 0x07
+
+        if wireType == 2:
+            length, pos = _read_varint(view, pos)
+            if pos + length > end:
+                raise FrameError("truncated field")
+            field = key >> 3
+            if field == 1:
+                name = str(view[pos:pos + length], 'utf-8')
+            elif field == 2:
+                data = view[pos:pos + length]
+            pos += length
+        # skip unknown fields
+        elif wireType == 0:
+            _, pos = _read_varint(view, pos)
+        elif wireType == 1:
+            pos += 8
+        elif wireType == 5:
+            pos += 4
+        else:
+            raise FrameError(f"unsupported wire type {wireType}")
+
+    return name, data
@@ -0,0 +1,124 @@
+import time
+
+class InFlightEntry():
+    __slots__ = ('future', 'name', 'generation', 'deadline')
+
+    def __init__(self, future, name, generation, deadline):
+        self.future = future
+        self.name = name
+        self.generation = generation
+        self.deadline = deadline
+
+class InFlightTable():
+    '''
+    The requests waiting for a response, by message index (`MajsoulChannel.requests`).
+
+    - at most `max_size` entries;
+    - every entry is tagged with the generation of the table; `clear()` (on reconnect)
+      starts a new generation, so a request from an old connection can't remove or
+      complete anything of the new one;
+    - the index of a request that was given up on (timed out, cancelled) is quarantined
+      for `quarantine_seconds`: its response may still arrive, and must not be mistaken
+      for the response to a new request reusing the index. Such responses are counted in
+      `late_responses`; responses matching nothing at all in `orphaned_responses`;
+    - `reap()` (called periodically by `MajsoulChannel.reap()`) drops entries nobody
+      waits for anymore and expired quarantines, so the table can't grow over weeks of
+      flaky connections.
+    '''
+    def __init__(self, max_size=4096, quarantine_seconds=60.0):
+        self.max_size = max_size
+        self.quarantine_seconds = quarantine_seconds
+        self.generation = 0
+
+        # msgIndex -> InFlightEntry
+        self._entries = {}
+        # msgIndex -> (quarantine expiry, method name)
+        self._quarantined = {}
+
+        self.late_responses = 0
+        self.orphaned_responses = 0
+        self.reaped = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, msgIndex):
+        return msgIndex in self._entries
+
+    def entries(self):
+        return list(self._entries.values())
+
+    @property
+    def full(self):
+        return len(self._entries) >= self.max_size
+
+    @property
+    def quarantined(self):
+        return len(self._quarantined)
+
+    def is_free(self, msgIndex):
+        return msgIndex not in self._entries and msgIndex not in self._quarantined
+
+    def add(self, msgIndex, future, name, timeout):
+        entry = InFlightEntry(future, name, self.generation, time.monotonic() + timeout)
+        self._entries[msgIndex] = entry
+        return entry
+
+    def resolve(self, msgIndex):
+        '''
+        The entry a response with `msgIndex` belongs to, or None (late or orphaned).
+        '''
+        entry = self._entries.get(msgIndex)
+        if entry is not None:
+            return entry
+
+        if self._quarantined.pop(msgIndex, None) is not None:
+            self.late_responses += 1
+        else:
+            self.orphaned_responses += 1
+        return None
+
+    def release(self, msgIndex, entry):
+        '''
+        Removes `entry` once its request is over. Unless it got its response, the index
+        is quarantined.
+        '''
+        if entry.generation != self.generation or self._entries.get(msgIndex) is not entry:
+            return
+
+        del self._entries[msgIndex]
+        future = entry.future
+        if future.cancelled() or not future.done() or future.exception() is not None:
+            self._quarantined[msgIndex] = (time.monotonic() + self.quarantine_seconds, entry.name)
+
+    def clear(self):
+        self.generation += 1
+        self._entries = {}
+        self._quarantined = {}
+
+    def reap(self, grace=5.0):
+        '''
+        Drops entries whose deadline passed more than `grace` seconds ago (the waiter
+        went away without releasing them), failing and quarantining those still without
+        a response, and expired quarantines. Returns the number of entries dropped.
+
+        An entry whose future is done but whose deadline hasn't passed isn't abandoned:
+        its waiter just hasn't resumed yet, and will `release()` it.
+        '''
+        now = time.monotonic()
+
+        stale = [msgIndex for msgIndex, entry in self._entries.items() if entry.deadline + grace < now]
+        for msgIndex in stale:
+            entry = self._entries.pop(msgIndex)
+            if entry.future.done():
+                # got its response; nothing more can arrive for this index
+                continue
+            entry.future.set_exception(TimeoutError(f"Reaped request {entry.name} #{msgIndex}"))
+            self._quarantined[msgIndex] = (now + self.quarantine_seconds, entry.name)
+        self.reaped += len(stale)
+
+        expired = [msgIndex for msgIndex, (expiry, _) in self._quarantined.items() if expiry < now]
+        for msgIndex in expired:
+            del self._quarantined[msgIndex]
+
+        return len(stale)
@@ -0,0 +1,186 @@
+'''
+Logging of the messages a `MajsoulChannel` receives (`log_messages=True`), cheap enough
+to leave on:
+
+- nothing is formatted unless a handler actually emits the record: the log record
+  carries a `LazyMessage`, which is only turned into text by `str()`;
+- messages are sampled per method/notification (`sample_rate`, `method_rates`);
+- repeated fields are cut off after `max_items` entries (e.g. the hundreds of
+  `RecordGame`s of `fetchContestGameRecords`);
+- optionally, the raw payloads of the sampled messages are appended to `payload_path`
+  to be decoded offline with `read_payloads()`:
+
+    timestamp (float64, `time.time()`)
+    kind      (uint8, `KIND_RESPONSE` or `KIND_NOTIFY`)
+    name size (uint16), payload size (uint32)
+    name      (the full method or message name, e.g. ".lq.NotifyContestGameEnd")
+    payload   (the serialized response/notification)
+
+  all little-endian.
+
+    python -m modules.pymjsoul.message_log payloads.bin [--max-items 5]
+'''
+import argparse
+import datetime
+import logging
+import random
+import struct
+import time
+
+from google.protobuf.descriptor import FieldDescriptor
+
+PAYLOAD_RECORD = struct.Struct('<dBHI')
+
+KIND_RESPONSE = 0
+KIND_NOTIFY = 1
+
+def _format_scalar(field, value):
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        enumValue = field.enum_type.values_by_number.get(value)
+        return enumValue.name if enumValue is not None else str(value)
+    if field.type in (FieldDescriptor.TYPE_STRING, FieldDescriptor.TYPE_BYTES):
+        return repr(value)
+    return str(value)
+
+def _format_value(lines, field, value, maxItems, indent):
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        lines.append(f'{indent}{field.name} {{')
+        _format_fields(lines, value, maxItems, indent + '  ')
+        lines.append(f'{indent}}}')
+    else:
+        lines.append(f'{indent}{field.name}: {_format_scalar(field, value)}')
+
+def _format_fields(lines, message, maxItems, indent):
+    for field, value in message.ListFields():
+        if field.label != FieldDescriptor.LABEL_REPEATED:
+            _format_value(lines, field, value, maxItems, indent)
+            continue
+
+        if field.message_type is not None and field.message_type.GetOptions().map_entry:
+            valueField = field.message_type.fields_by_name['value']
+            for key in list(value)[:maxItems]:
+                _format_value(lines, valueField, value[key], maxItems, f'{indent}{field.name}[{key!r}].')
+        else:
+            for item in value[:maxItems]:
+                _format_value(lines, field, item, maxItems, indent)
+
+        if len(value) > maxItems:
+            lines.append(f'{indent}# ... {len(value) - maxItems} more {field.name}')
+
+def format_message(message, max_items=5):
+    '''
+    Text format of `message`, with every repeated field cut off after `max_items` entries.
+    '''
+    lines = []
+    _format_fields(lines, message, max_items, '')
+    return '\n'.join(lines)
+
+class LazyMessage():
+    '''
+    Log record argument that is only decoded and formatted when `str()` is called on it,
+    i.e. when a handler emits the record.
+    '''
+    __slots__ = ('label', 'message_class', 'payload', 'max_items')
+
+    def __init__(self, label, message_class, payload, max_items):
+        self.label = label
+        self.message_class = message_class
+        self.payload = payload
+        self.max_items = max_items
+
+    def __str__(self):
+        message = self.message_class.FromString(self.payload)
+        return f'{self.label}\n{format_message(message, self.max_items)}'
+
+class MessageLogger():
+    '''
+    See the module docstring. `method_rates` maps method/notification names (e.g.
+    "fetchContestGameRecords", "NotifyContestGameEnd") to their own sample rate.
+    '''
+    def __init__(self, logger, level=logging.INFO, sample_rate=1.0, method_rates=None, max_items=5, payload_path=None):
+        self.logger = logger
+        self.level = level
+        self.sample_rate = sample_rate
+        self.method_rates = dict(method_rates or {})
+        self.max_items = max_items
+
+        self._payloads = open(payload_path, 'ab') if payload_path is not None else None
+
+    def _sampled(self, name):
+        if not self.logger.isEnabledFor(self.level):
+            return False
+        rate = self.method_rates.get(name, self.sample_rate)
+        return rate >= 1 or random.random() < rate
+
+    def response(self, method, payload):
+        '''
+        `method` is the `MethodEntry`, `payload` the serialized response.
+        '''
+        if not self._sampled(method.name):
+            return
+        self._write_payload(KIND_RESPONSE, method.full_name, payload)
+        self.logger.log(self.level, "%s", LazyMessage(f"Response to {method.name}:", method.response_class, payload, self.max_items))
+
+    def notify(self, message, payload):
+        '''
+        `message` is the `MessageEntry` of the notification, `payload` its serialized body.
+        '''
+        if not self._sampled(message.name):
+            return
+        self._write_payload(KIND_NOTIFY, message.full_name, payload)
+        self.logger.log(self.level, "%s", LazyMessage(f"Notification {message.name}:", message.message_class, payload, self.max_items))
+
+    def _write_payload(self, kind, name, payload):
+        if self._payloads is None:
+            return
+        encodedName = name.encode()
+        self._payloads.write(PAYLOAD_RECORD.pack(time.time(), kind, len(encodedName), len(payload)))
+        self._payloads.write(encodedName)
+        self._payloads.write(payload)
+
+    def close(self):
+        if self._payloads is not None:
+            self._payloads.close()
+            self._payloads = None
+
+def read_payloads(path):
+    '''
+    Yields `(timestamp, kind, name, payload)` for every payload written to `path`.
+    '''
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(PAYLOAD_RECORD.size)
+            if len(header) < PAYLOAD_RECORD.size:
+                return
+            timestamp, kind, nameSize, payloadSize = PAYLOAD_RECORD.unpack(header)
+            name = f.read(nameSize).decode()
+            payload = f.read(payloadSize)
+            if len(payload) < payloadSize:
+                return
+            yield timestamp, kind, name, payload
+
+def print_payloads(path, max_items=5):
+    from .proto import liqi_combined_pb2
+    from .registry import ProtoRegistry
+
+    registry = ProtoRegistry(liqi_combined_pb2)
+    servicesMethods = {entry.full_name: entry for entry in registry.service_methods.values()}
+
+    for timestamp, kind, name, payload in read_payloads(path):
+        if kind == KIND_RESPONSE:
+            messageClass = servicesMethods[name].response_class
+        else:
+            messageClass = registry.message(name).message_class
+        print(f'--- {datetime.datetime.fromtimestamp(timestamp).isoformat()} {name}')
+        print(format_message(messageClass.FromString(payload), max_items))
+
+def main():
+    parser = argparse.ArgumentParser(description="Decodes the payloads written by a `MessageLogger` (`payload_path`).")
+    parser.add_argument('path', help="the payload file, e.g. payloads.bin")
+    parser.add_argument('--max-items', type=int, default=5, help="entries of each repeated field to print")
+    args = parser.parse_args()
+
+    print_payloads(args.path, args.max_items)
+
+if __name__ == "__main__":
+    main()
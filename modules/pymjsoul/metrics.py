@@ -0,0 +1,136 @@
+import bisect
+
+def _log_bounds(lowest, highest, per_doubling):
+    bounds = []
+    bound = lowest
+    while bound < highest:
+        bounds.append(bound)
+        bound *= 2 ** (1 / per_doubling)
+    bounds.append(highest)
+    return bounds
+
+class LatencyHistogram():
+    '''
+    Streaming latency histogram with logarithmic buckets (about 19% wide by default),
+    from `lowest` to `highest` seconds; anything slower lands in an overflow bucket.
+
+    Once `max_count` samples are recorded, every bucket is halved, so old samples
+    gradually lose weight and the percentiles follow changing conditions.
+    '''
+    def __init__(self, lowest=0.001, highest=60.0, per_doubling=4, max_count=2000):
+        self.bounds = _log_bounds(lowest, highest, per_doubling)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.max_count = max_count
+
+        self.count = 0
+        # lifetime totals, not affected by the decay
+        self.total_count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+
+        self.total_count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+        if self.count >= self.max_count:
+            self.counts = [c // 2 for c in self.counts]
+            self.count = sum(self.counts)
+
+    @property
+    def mean_seconds(self):
+        return self.total_seconds / self.total_count if self.total_count else 0.0
+
+    def percentile(self, q):
+        '''
+        Upper bound of the bucket holding the `q` quantile (0 < q <= 1);
+        None without samples.
+        '''
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return min(self.bounds[i], self.max_seconds) if i < len(self.bounds) else self.max_seconds
+
+        return self.max_seconds
+
+    def __repr__(self):
+        p50, p99 = self.percentile(0.5), self.percentile(0.99)
+        if p50 is None:
+            return '<LatencyHistogram empty>'
+        return f'<LatencyHistogram n={self.total_count} p50={p50:.3f}s p99={p99:.3f}s max={self.max_seconds:.3f}s>'
+
+def histogram_snapshot(histogram):
+    return {
+        'count': histogram.total_count,
+        'mean': histogram.mean_seconds,
+        'p50': histogram.percentile(0.5),
+        'p90': histogram.percentile(0.9),
+        'p99': histogram.percentile(0.99),
+        'max': histogram.max_seconds,
+    }
+
+class MethodStats():
+    '''
+    Counters of one rpc method; see `RpcMetrics`.
+    '''
+    __slots__ = ('requests', 'timeouts', 'connection_errors', 'errors', 'bytes_sent', 'bytes_received', 'in_flight')
+
+    def __init__(self):
+        self.requests = 0
+        self.timeouts = 0
+        # requests that failed because the connection closed or dropped
+        self.connection_errors = 0
+        # error code -> number of responses with that `error.code`
+        self.errors = {}
+        self.bytes_sent = 0
+        # response payloads
+        self.bytes_received = 0
+        self.in_flight = 0
+
+    def record_error(self, code):
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+    def snapshot(self, errorNames, histogram=None):
+        snapshot = {
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'timeouts': self.timeouts,
+            'connection_errors': self.connection_errors,
+            'errors': {f'{code} {errorNames.get(code, "Unknown error")}': count for code, count in self.errors.items()},
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+        }
+        if histogram is not None and histogram.total_count:
+            snapshot['latency_seconds'] = histogram_snapshot(histogram)
+        return snapshot
+
+class RpcMetrics():
+    '''
+    Per-method counters of a `MajsoulChannel` (`channel.metrics`), keyed by the full
+    method name (".lq.CustomizedContestManagerApi.lockGamePlayer"). Plain attributes
+    updated in place, so they cost next to nothing per request and can be read at any
+    time; `MajsoulChannel.metrics_snapshot()` puts them together with the latency
+    histograms and the connection/notification metrics as plain data for exporting.
+    '''
+    def __init__(self):
+        # method name -> MethodStats
+        self.methods = {}
+
+    def method(self, name):
+        stats = self.methods.get(name)
+
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+
+        return stats
+
+    def snapshot(self, errorNames, histograms):
+        return {name: stats.snapshot(errorNames, histograms.get(name)) for name, stats in self.methods.items()}
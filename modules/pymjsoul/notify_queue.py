@@ -0,0 +1,159 @@
+import asyncio
+import struct
+import tempfile
+import time
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP_OLDEST = 'drop_oldest'
+OVERFLOW_SPILL = 'spill'
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_SPILL)
+
+class _SpillFile():
+    '''
+    FIFO of `(name, data, enqueued_at)` records kept on disk.
+    '''
+    # name length, data length, enqueue time
+    _RECORD_HEADER = struct.Struct('<HId')
+
+    def __init__(self, path=None):
+        self._file = open(path, 'w+b') if path else tempfile.TemporaryFile()
+        self._read_pos = 0
+        self._write_pos = 0
+        self.count = 0
+
+    def push(self, name, data, enqueuedAt):
+        encodedName = name.encode()
+        self._file.seek(self._write_pos)
+        self._file.write(self._RECORD_HEADER.pack(len(encodedName), len(data), enqueuedAt))
+        self._file.write(encodedName)
+        self._file.write(data)
+        self._write_pos = self._file.tell()
+        self.count += 1
+
+    def pop(self):
+        self._file.seek(self._read_pos)
+        nameLength, dataLength, enqueuedAt = self._RECORD_HEADER.unpack(self._file.read(self._RECORD_HEADER.size))
+        name = self._file.read(nameLength).decode()
+        data = self._file.read(dataLength)
+        self._read_pos = self._file.tell()
+        self.count -= 1
+
+        # start over once everything has been read back, so the file doesn't keep growing
+        if self.count == 0:
+            self.clear()
+
+        return name, data, enqueuedAt
+
+    def clear(self):
+        self._file.seek(0)
+        self._file.truncate()
+        self._read_pos = 0
+        self._write_pos = 0
+        self.count = 0
+
+    def close(self):
+        self._file.close()
+
+class NotificationQueue():
+    '''
+    Bounded FIFO of `(name, data)` notifications between `listen()` and `eventloop()`.
+
+    What happens when `maxsize` items are waiting depends on `overflow`:
+    - "block": `put()` waits for room. This holds up the listener, and with it
+      the responses to pending requests, until subscribers catch up: subscribers
+      that send requests themselves can deadlock against it;
+    - "drop_oldest": the oldest waiting notification is discarded;
+    - "spill": further notifications are appended to a file (`spill_path`, or an
+      anonymous temporary file) and read back in order as room frees up.
+
+    Metrics: `depth` (and `max_depth`), time spent in the queue (`wait_count`,
+    `wait_seconds_total`, `wait_seconds_max`) and overflow counters (`blocked`,
+    `blocked_seconds`, `dropped`, `spilled`).
+    '''
+    def __init__(self, maxsize=1000, overflow=OVERFLOW_SPILL, spill_path=None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'; expected one of {OVERFLOW_POLICIES}")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._spill_path = spill_path
+        self._spill = None
+
+        # (name, data, enqueued_at)
+        self._queue = asyncio.Queue(maxsize)
+
+        self.max_depth = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.dropped = 0
+        self.spilled = 0
+
+    @property
+    def depth(self):
+        return self._queue.qsize() + (self._spill.count if self._spill else 0)
+
+    def qsize(self):
+        return self.depth
+
+    def empty(self):
+        return self.depth == 0
+
+    @property
+    def wait_seconds_mean(self):
+        return self.wait_seconds_total / self.wait_count if self.wait_count else 0.0
+
+    async def put(self, item):
+        name, data = item
+        entry = (name, data, time.monotonic())
+
+        if not self._queue.full() and not (self._spill and self._spill.count):
+            self._queue.put_nowait(entry)
+        elif self.overflow == OVERFLOW_BLOCK:
+            self.blocked += 1
+            start = time.monotonic()
+            await self._queue.put(entry)
+            self.blocked_seconds += time.monotonic() - start
+        elif self.overflow == OVERFLOW_DROP_OLDEST:
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._queue.put_nowait(entry)
+        else:
+            if self._spill is None:
+                self._spill = _SpillFile(self._spill_path)
+            self._spill.push(*entry)
+            self.spilled += 1
+
+        self.max_depth = max(self.max_depth, self.depth)
+
+    async def get(self):
+        self._refill()
+        name, data, enqueuedAt = await self._queue.get()
+        self._refill()
+
+        waited = time.monotonic() - enqueuedAt
+        self.wait_count += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+        return name, data
+
+    def clear(self):
+        '''
+        Discards every waiting notification (metrics are kept).
+        '''
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        if self._spill:
+            self._spill.clear()
+
+    def close(self):
+        if self._spill:
+            self._spill.close()
+            self._spill = None
+
+    def _refill(self):
+        while self._spill and self._spill.count and not self._queue.full():
+            self._queue.put_nowait(self._spill.pop())
@@ -0,0 +1,188 @@
+'''
+Generates `liqi_combined_stubs.py`: one typed async stub class per service in
+`liqi_combined_pb2` (e.g. `CustomizedContestManagerApiStub`, `LobbyStub`), with one
+method per rpc. Request fields are explicit keyword arguments, and the request/response
+classes are bound in the generated code, so calls skip the by-name lookups of
+`MajsoulChannel.call()` and a misspelled method is an AttributeError caught by
+linters/type checkers rather than a `MethodNotFoundError` at runtime.
+
+With `--subset`, generates `liqi_<subset>_stubs.py` instead, for the services of a
+descriptor subset (see `split_protocol.py`, `liqi_subsets.py`): importing those doesn't
+load `liqi_combined_pb2`.
+
+Usage (run from this directory after regenerating `liqi_combined_pb2.py`):
+    python3 generate_stubs.py [ServiceName ...]
+    python3 generate_stubs.py --subset contest_manager [ServiceName ...]
+'''
+import keyword
+import sys
+from os.path import join, dirname
+
+from google.protobuf.descriptor import FieldDescriptor
+
+import liqi_combined_pb2
+from liqi_subsets import load_protocol
+
+CURR_DIR = dirname(__file__)
+OUTPUT_PATH = join(CURR_DIR, "liqi_combined_stubs.py")
+SUBSET_OUTPUT_PATH = join(CURR_DIR, "liqi_{subset}_stubs.py")
+
+PYTHON_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: 'float',
+    FieldDescriptor.TYPE_FLOAT: 'float',
+    FieldDescriptor.TYPE_BOOL: 'bool',
+    FieldDescriptor.TYPE_STRING: 'str',
+    FieldDescriptor.TYPE_BYTES: 'bytes',
+}
+
+HEADER = '''# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from liqi_combined_pb2.  DO NOT EDIT!
+"""Typed async client stubs for the services in liqi_combined.proto."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from . import liqi_combined_pb2 as pb2
+from ..registry import MethodEntry
+
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+'''
+
+SUBSET_HEADER = '''# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from the {subset} descriptor subset.  DO NOT EDIT!
+"""Typed async client stubs for the services in the {subset} protocol subset."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from .liqi_subsets import load_protocol
+from ..registry import MethodEntry
+
+pb2 = load_protocol('{subset}')
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+'''
+
+CLASS_DOCSTRING = """    '''
+    rpc methods of `{full_name}`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+"""
+
+def python_path(descriptor):
+    '''
+    "lq.ReqCreateContestGame.Slot" -> "pb2.ReqCreateContestGame.Slot"
+    '''
+    package = descriptor.file.package
+    return 'pb2.' + descriptor.full_name[len(package) + 1:]
+
+def is_repeated(field):
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+def is_map(field):
+    return field.message_type is not None and field.message_type.GetOptions().map_entry
+
+def scalar_type(field):
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        return python_path(field.message_type)
+    return PYTHON_TYPES.get(field.type, 'int')
+
+def parameter_name(field):
+    if keyword.iskeyword(field.name) or field.name in ('self', 'timeout'):
+        return field.name + '_'
+    return field.name
+
+def is_optional(field):
+    '''
+    Parameters that default to None and are only set when given: messages, repeated
+    fields and members of a oneof (setting those to their default would still select them).
+    '''
+    return is_repeated(field) or field.type == FieldDescriptor.TYPE_MESSAGE or field.containing_oneof is not None
+
+def parameter(field):
+    name = parameter_name(field)
+
+    if is_map(field):
+        keyField, valueField = field.message_type.fields_by_name['key'], field.message_type.fields_by_name['value']
+        return f'{name}: Optional[Mapping[{scalar_type(keyField)}, {scalar_type(valueField)}]] = None'
+    if is_repeated(field):
+        return f'{name}: Optional[Iterable[{scalar_type(field)}]] = None'
+    if is_optional(field):
+        return f'{name}: Optional[{scalar_type(field)}] = None'
+    return f'{name}: {scalar_type(field)} = {field.default_value!r}'
+
+def method_source(serviceName, method):
+    entryName = f'_{serviceName}_{method.name}'
+    requestFields = method.input_type.fields
+    parameters = ', '.join(['self', '*'] + [parameter(f) for f in requestFields] + ['timeout: Optional[float] = None'])
+
+    lines = [
+        f'    async def {method.name}({parameters}) -> {python_path(method.output_type)}:',
+        f"        '''rpc {method.name} ({method.input_type.name}) returns ({method.output_type.name})'''",
+    ]
+
+    if not requestFields:
+        lines.append(f'        return await self._call({entryName}, None, timeout)')
+        return '\n'.join(lines)
+
+    direct = [f for f in requestFields if not is_optional(f)]
+    arguments = ', '.join(f'{f.name}={parameter_name(f)}' for f in direct if f.name == parameter_name(f))
+    renamed = ', '.join(f"'{f.name}': {parameter_name(f)}" for f in direct if f.name != parameter_name(f))
+    if renamed:
+        arguments = ', '.join(filter(None, [arguments, f'**{{{renamed}}}']))
+    lines.append(f'        request = {python_path(method.input_type)}({arguments})')
+
+    for field in requestFields:
+        if not is_optional(field):
+            continue
+        name = parameter_name(field)
+        lines.append(f'        if {name} is not None:')
+        if is_map(field):
+            lines.append(f'            request.{field.name}.update({name})')
+        elif is_repeated(field):
+            lines.append(f'            request.{field.name}.extend({name})')
+        elif field.type == FieldDescriptor.TYPE_MESSAGE:
+            lines.append(f'            request.{field.name}.CopyFrom({name})')
+        else:
+            lines.append(f"            setattr(request, '{field.name}', {name})")
+
+    lines.append(f'        return await self._call({entryName}, request, timeout)')
+    return '\n'.join(lines)
+
+def service_source(service):
+    entries = '\n'.join(
+        f"_{service.name}_{m.name} = MethodEntry(_SERVICES['{service.name}'].methods_by_name['{m.name}'])"
+        for m in service.methods)
+    methods = '\n\n'.join(method_source(service.name, m) for m in service.methods)
+
+    return f'''
+{entries}
+
+class {service.name}Stub():
+{CLASS_DOCSTRING.format(full_name=service.full_name)}
+{methods}
+'''
+
+def main(serviceNames, subset=None):
+    if subset is None:
+        proto, header, outputPath = liqi_combined_pb2, HEADER, OUTPUT_PATH
+    else:
+        proto = load_protocol(subset)
+        header = SUBSET_HEADER.format(subset=subset)
+        outputPath = SUBSET_OUTPUT_PATH.format(subset=subset)
+
+    services = proto.DESCRIPTOR.services_by_name
+    serviceNames = serviceNames or list(services)
+
+    source = header + ''.join(service_source(services[name]) for name in serviceNames)
+
+    with open(outputPath, "w") as f:
+        f.write(source)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args[:1] == ['--subset']:
+        main(args[2:], args[1])
+    else:
+        main(args)
@@ -0,0 +1,2127 @@
+# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from liqi_combined_pb2.  DO NOT EDIT!
+"""Typed async client stubs for the services in liqi_combined.proto."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from . import liqi_combined_pb2 as pb2
+from ..registry import MethodEntry
+
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+
+_Lobby_fetchConnectionInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchConnectionInfo'])
+_Lobby_fetchQueueInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchQueueInfo'])
+_Lobby_cancelQueue = MethodEntry(_SERVICES['Lobby'].methods_by_name['cancelQueue'])
+_Lobby_openidCheck = MethodEntry(_SERVICES['Lobby'].methods_by_name['openidCheck'])
+_Lobby_signup = MethodEntry(_SERVICES['Lobby'].methods_by_name['signup'])
+_Lobby_login = MethodEntry(_SERVICES['Lobby'].methods_by_name['login'])
+_Lobby_loginSuccess = MethodEntry(_SERVICES['Lobby'].methods_by_name['loginSuccess'])
+_Lobby_emailLogin = MethodEntry(_SERVICES['Lobby'].methods_by_name['emailLogin'])
+_Lobby_oauth2Auth = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Auth'])
+_Lobby_oauth2Check = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Check'])
+_Lobby_oauth2Signup = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Signup'])
+_Lobby_oauth2Login = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Login'])
+_Lobby_dmmPreLogin = MethodEntry(_SERVICES['Lobby'].methods_by_name['dmmPreLogin'])
+_Lobby_createPhoneVerifyCode = MethodEntry(_SERVICES['Lobby'].methods_by_name['createPhoneVerifyCode'])
+_Lobby_createEmailVerifyCode = MethodEntry(_SERVICES['Lobby'].methods_by_name['createEmailVerifyCode'])
+_Lobby_verfifyCodeForSecure = MethodEntry(_SERVICES['Lobby'].methods_by_name['verfifyCodeForSecure'])
+_Lobby_bindPhoneNumber = MethodEntry(_SERVICES['Lobby'].methods_by_name['bindPhoneNumber'])
+_Lobby_unbindPhoneNumber = MethodEntry(_SERVICES['Lobby'].methods_by_name['unbindPhoneNumber'])
+_Lobby_fetchPhoneLoginBind = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchPhoneLoginBind'])
+_Lobby_createPhoneLoginBind = MethodEntry(_SERVICES['Lobby'].methods_by_name['createPhoneLoginBind'])
+_Lobby_bindEmail = MethodEntry(_SERVICES['Lobby'].methods_by_name['bindEmail'])
+_Lobby_modifyPassword = MethodEntry(_SERVICES['Lobby'].methods_by_name['modifyPassword'])
+_Lobby_bindAccount = MethodEntry(_SERVICES['Lobby'].methods_by_name['bindAccount'])
+_Lobby_logout = MethodEntry(_SERVICES['Lobby'].methods_by_name['logout'])
+_Lobby_heatbeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['heatbeat'])
+_Lobby_loginBeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['loginBeat'])
+_Lobby_createNickname = MethodEntry(_SERVICES['Lobby'].methods_by_name['createNickname'])
+_Lobby_modifyNickname = MethodEntry(_SERVICES['Lobby'].methods_by_name['modifyNickname'])
+_Lobby_modifyBirthday = MethodEntry(_SERVICES['Lobby'].methods_by_name['modifyBirthday'])
+_Lobby_fetchRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRoom'])
+_Lobby_createRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['createRoom'])
+_Lobby_joinRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['joinRoom'])
+_Lobby_leaveRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['leaveRoom'])
+_Lobby_readyPlay = MethodEntry(_SERVICES['Lobby'].methods_by_name['readyPlay'])
+_Lobby_dressingStatus = MethodEntry(_SERVICES['Lobby'].methods_by_name['dressingStatus'])
+_Lobby_startRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['startRoom'])
+_Lobby_kickPlayer = MethodEntry(_SERVICES['Lobby'].methods_by_name['kickPlayer'])
+_Lobby_modifyRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['modifyRoom'])
+_Lobby_matchGame = MethodEntry(_SERVICES['Lobby'].methods_by_name['matchGame'])
+_Lobby_cancelMatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['cancelMatch'])
+_Lobby_fetchAccountInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountInfo'])
+_Lobby_changeAvatar = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeAvatar'])
+_Lobby_receiveVersionReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveVersionReward'])
+_Lobby_fetchAccountStatisticInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountStatisticInfo'])
+_Lobby_fetchAccountChallengeRankInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountChallengeRankInfo'])
+_Lobby_fetchAccountCharacterInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountCharacterInfo'])
+_Lobby_shopPurchase = MethodEntry(_SERVICES['Lobby'].methods_by_name['shopPurchase'])
+_Lobby_fetchGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecord'])
+_Lobby_readGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['readGameRecord'])
+_Lobby_fetchGameRecordList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecordList'])
+_Lobby_fetchCollectedGameRecordList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCollectedGameRecordList'])
+_Lobby_fetchGameRecordsDetail = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecordsDetail'])
+_Lobby_addCollectedGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['addCollectedGameRecord'])
+_Lobby_removeCollectedGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['removeCollectedGameRecord'])
+_Lobby_changeCollectedGameRecordRemarks = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeCollectedGameRecordRemarks'])
+_Lobby_fetchLevelLeaderboard = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchLevelLeaderboard'])
+_Lobby_fetchChallengeLeaderboard = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchChallengeLeaderboard'])
+_Lobby_fetchMutiChallengeLevel = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchMutiChallengeLevel'])
+_Lobby_fetchMultiAccountBrief = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchMultiAccountBrief'])
+_Lobby_fetchFriendList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchFriendList'])
+_Lobby_fetchFriendApplyList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchFriendApplyList'])
+_Lobby_applyFriend = MethodEntry(_SERVICES['Lobby'].methods_by_name['applyFriend'])
+_Lobby_handleFriendApply = MethodEntry(_SERVICES['Lobby'].methods_by_name['handleFriendApply'])
+_Lobby_removeFriend = MethodEntry(_SERVICES['Lobby'].methods_by_name['removeFriend'])
+_Lobby_searchAccountById = MethodEntry(_SERVICES['Lobby'].methods_by_name['searchAccountById'])
+_Lobby_searchAccountByPattern = MethodEntry(_SERVICES['Lobby'].methods_by_name['searchAccountByPattern'])
+_Lobby_fetchAccountState = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountState'])
+_Lobby_fetchBagInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchBagInfo'])
+_Lobby_useBagItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['useBagItem'])
+_Lobby_openManualItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['openManualItem'])
+_Lobby_openRandomRewardItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['openRandomRewardItem'])
+_Lobby_openAllRewardItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['openAllRewardItem'])
+_Lobby_composeShard = MethodEntry(_SERVICES['Lobby'].methods_by_name['composeShard'])
+_Lobby_fetchAnnouncement = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAnnouncement'])
+_Lobby_readAnnouncement = MethodEntry(_SERVICES['Lobby'].methods_by_name['readAnnouncement'])
+_Lobby_fetchMailInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchMailInfo'])
+_Lobby_readMail = MethodEntry(_SERVICES['Lobby'].methods_by_name['readMail'])
+_Lobby_deleteMail = MethodEntry(_SERVICES['Lobby'].methods_by_name['deleteMail'])
+_Lobby_takeAttachmentFromMail = MethodEntry(_SERVICES['Lobby'].methods_by_name['takeAttachmentFromMail'])
+_Lobby_receiveAchievementReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveAchievementReward'])
+_Lobby_receiveAchievementGroupReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveAchievementGroupReward'])
+_Lobby_fetchAchievementRate = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAchievementRate'])
+_Lobby_fetchAchievement = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAchievement'])
+_Lobby_buyShiLian = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyShiLian'])
+_Lobby_matchShiLian = MethodEntry(_SERVICES['Lobby'].methods_by_name['matchShiLian'])
+_Lobby_goNextShiLian = MethodEntry(_SERVICES['Lobby'].methods_by_name['goNextShiLian'])
+_Lobby_updateClientValue = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateClientValue'])
+_Lobby_fetchClientValue = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchClientValue'])
+_Lobby_clientMessage = MethodEntry(_SERVICES['Lobby'].methods_by_name['clientMessage'])
+_Lobby_fetchCurrentMatchInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCurrentMatchInfo'])
+_Lobby_userComplain = MethodEntry(_SERVICES['Lobby'].methods_by_name['userComplain'])
+_Lobby_fetchReviveCoinInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchReviveCoinInfo'])
+_Lobby_gainReviveCoin = MethodEntry(_SERVICES['Lobby'].methods_by_name['gainReviveCoin'])
+_Lobby_fetchDailyTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchDailyTask'])
+_Lobby_refreshDailyTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['refreshDailyTask'])
+_Lobby_useGiftCode = MethodEntry(_SERVICES['Lobby'].methods_by_name['useGiftCode'])
+_Lobby_useSpecialGiftCode = MethodEntry(_SERVICES['Lobby'].methods_by_name['useSpecialGiftCode'])
+_Lobby_fetchTitleList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchTitleList'])
+_Lobby_useTitle = MethodEntry(_SERVICES['Lobby'].methods_by_name['useTitle'])
+_Lobby_sendClientMessage = MethodEntry(_SERVICES['Lobby'].methods_by_name['sendClientMessage'])
+_Lobby_fetchGameLiveInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveInfo'])
+_Lobby_fetchGameLiveLeftSegment = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveLeftSegment'])
+_Lobby_fetchGameLiveList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveList'])
+_Lobby_fetchCommentSetting = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCommentSetting'])
+_Lobby_updateCommentSetting = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateCommentSetting'])
+_Lobby_fetchCommentList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCommentList'])
+_Lobby_fetchCommentContent = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCommentContent'])
+_Lobby_leaveComment = MethodEntry(_SERVICES['Lobby'].methods_by_name['leaveComment'])
+_Lobby_deleteComment = MethodEntry(_SERVICES['Lobby'].methods_by_name['deleteComment'])
+_Lobby_updateReadComment = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateReadComment'])
+_Lobby_fetchRollingNotice = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRollingNotice'])
+_Lobby_fetchServerTime = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchServerTime'])
+_Lobby_fetchPlatformProducts = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchPlatformProducts'])
+_Lobby_cancelGooglePlayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['cancelGooglePlayOrder'])
+_Lobby_openChest = MethodEntry(_SERVICES['Lobby'].methods_by_name['openChest'])
+_Lobby_buyFromChestShop = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyFromChestShop'])
+_Lobby_fetchDailySignInInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchDailySignInInfo'])
+_Lobby_doDailySignIn = MethodEntry(_SERVICES['Lobby'].methods_by_name['doDailySignIn'])
+_Lobby_doActivitySignIn = MethodEntry(_SERVICES['Lobby'].methods_by_name['doActivitySignIn'])
+_Lobby_fetchCharacterInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCharacterInfo'])
+_Lobby_updateCharacterSort = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateCharacterSort'])
+_Lobby_changeMainCharacter = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeMainCharacter'])
+_Lobby_changeCharacterSkin = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeCharacterSkin'])
+_Lobby_changeCharacterView = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeCharacterView'])
+_Lobby_setHiddenCharacter = MethodEntry(_SERVICES['Lobby'].methods_by_name['setHiddenCharacter'])
+_Lobby_sendGiftToCharacter = MethodEntry(_SERVICES['Lobby'].methods_by_name['sendGiftToCharacter'])
+_Lobby_sellItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['sellItem'])
+_Lobby_fetchCommonView = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCommonView'])
+_Lobby_changeCommonView = MethodEntry(_SERVICES['Lobby'].methods_by_name['changeCommonView'])
+_Lobby_saveCommonViews = MethodEntry(_SERVICES['Lobby'].methods_by_name['saveCommonViews'])
+_Lobby_fetchCommonViews = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCommonViews'])
+_Lobby_fetchAllCommonViews = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAllCommonViews'])
+_Lobby_useCommonView = MethodEntry(_SERVICES['Lobby'].methods_by_name['useCommonView'])
+_Lobby_upgradeCharacter = MethodEntry(_SERVICES['Lobby'].methods_by_name['upgradeCharacter'])
+_Lobby_addFinishedEnding = MethodEntry(_SERVICES['Lobby'].methods_by_name['addFinishedEnding'])
+_Lobby_receiveEndingReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveEndingReward'])
+_Lobby_gameMasterCommand = MethodEntry(_SERVICES['Lobby'].methods_by_name['gameMasterCommand'])
+_Lobby_fetchShopInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchShopInfo'])
+_Lobby_buyFromShop = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyFromShop'])
+_Lobby_buyFromZHP = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyFromZHP'])
+_Lobby_refreshZHPShop = MethodEntry(_SERVICES['Lobby'].methods_by_name['refreshZHPShop'])
+_Lobby_fetchMonthTicketInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchMonthTicketInfo'])
+_Lobby_payMonthTicket = MethodEntry(_SERVICES['Lobby'].methods_by_name['payMonthTicket'])
+_Lobby_exchangeCurrency = MethodEntry(_SERVICES['Lobby'].methods_by_name['exchangeCurrency'])
+_Lobby_exchangeChestStone = MethodEntry(_SERVICES['Lobby'].methods_by_name['exchangeChestStone'])
+_Lobby_exchangeDiamond = MethodEntry(_SERVICES['Lobby'].methods_by_name['exchangeDiamond'])
+_Lobby_fetchServerSettings = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchServerSettings'])
+_Lobby_fetchAccountSettings = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountSettings'])
+_Lobby_updateAccountSettings = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateAccountSettings'])
+_Lobby_fetchModNicknameTime = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchModNicknameTime'])
+_Lobby_createWechatNativeOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createWechatNativeOrder'])
+_Lobby_createWechatAppOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createWechatAppOrder'])
+_Lobby_createAlipayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createAlipayOrder'])
+_Lobby_createAlipayScanOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createAlipayScanOrder'])
+_Lobby_createAlipayAppOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createAlipayAppOrder'])
+_Lobby_createJPCreditCardOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPCreditCardOrder'])
+_Lobby_createJPPaypalOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPPaypalOrder'])
+_Lobby_createJPAuOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPAuOrder'])
+_Lobby_createJPDocomoOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPDocomoOrder'])
+_Lobby_createJPWebMoneyOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPWebMoneyOrder'])
+_Lobby_createJPSoftbankOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPSoftbankOrder'])
+_Lobby_createJPPayPayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createJPPayPayOrder'])
+_Lobby_fetchJPCommonCreditCardOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchJPCommonCreditCardOrder'])
+_Lobby_createENPaypalOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createENPaypalOrder'])
+_Lobby_createENMasterCardOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createENMasterCardOrder'])
+_Lobby_createENVisaOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createENVisaOrder'])
+_Lobby_createENJCBOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createENJCBOrder'])
+_Lobby_createENAlipayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createENAlipayOrder'])
+_Lobby_createKRPaypalOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createKRPaypalOrder'])
+_Lobby_createKRMasterCardOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createKRMasterCardOrder'])
+_Lobby_createKRVisaOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createKRVisaOrder'])
+_Lobby_createKRJCBOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createKRJCBOrder'])
+_Lobby_createKRAlipayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createKRAlipayOrder'])
+_Lobby_createDMMOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createDMMOrder'])
+_Lobby_createIAPOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createIAPOrder'])
+_Lobby_createSteamOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createSteamOrder'])
+_Lobby_verifySteamOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['verifySteamOrder'])
+_Lobby_createMyCardAndroidOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createMyCardAndroidOrder'])
+_Lobby_createMyCardWebOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createMyCardWebOrder'])
+_Lobby_createPaypalOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createPaypalOrder'])
+_Lobby_createXsollaOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createXsollaOrder'])
+_Lobby_verifyMyCardOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['verifyMyCardOrder'])
+_Lobby_verificationIAPOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['verificationIAPOrder'])
+_Lobby_createYostarSDKOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createYostarSDKOrder'])
+_Lobby_createBillingOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['createBillingOrder'])
+_Lobby_solveGooglePlayOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['solveGooglePlayOrder'])
+_Lobby_solveGooglePayOrderV3 = MethodEntry(_SERVICES['Lobby'].methods_by_name['solveGooglePayOrderV3'])
+_Lobby_deliverAA32Order = MethodEntry(_SERVICES['Lobby'].methods_by_name['deliverAA32Order'])
+_Lobby_fetchMisc = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchMisc'])
+_Lobby_modifySignature = MethodEntry(_SERVICES['Lobby'].methods_by_name['modifySignature'])
+_Lobby_fetchIDCardInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchIDCardInfo'])
+_Lobby_updateIDCardInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['updateIDCardInfo'])
+_Lobby_fetchVipReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchVipReward'])
+_Lobby_gainVipReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['gainVipReward'])
+_Lobby_fetchRefundOrder = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRefundOrder'])
+_Lobby_fetchCustomizedContestList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestList'])
+_Lobby_fetchCustomizedContestExtendInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestExtendInfo'])
+_Lobby_fetchCustomizedContestAuthInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestAuthInfo'])
+_Lobby_enterCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['enterCustomizedContest'])
+_Lobby_leaveCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['leaveCustomizedContest'])
+_Lobby_fetchCustomizedContestOnlineInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestOnlineInfo'])
+_Lobby_fetchCustomizedContestByContestId = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestByContestId'])
+_Lobby_startCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['startCustomizedContest'])
+_Lobby_stopCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['stopCustomizedContest'])
+_Lobby_joinCustomizedContestChatRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['joinCustomizedContestChatRoom'])
+_Lobby_leaveCustomizedContestChatRoom = MethodEntry(_SERVICES['Lobby'].methods_by_name['leaveCustomizedContestChatRoom'])
+_Lobby_sayChatMessage = MethodEntry(_SERVICES['Lobby'].methods_by_name['sayChatMessage'])
+_Lobby_fetchCustomizedContestGameRecords = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestGameRecords'])
+_Lobby_fetchCustomizedContestGameLiveList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestGameLiveList'])
+_Lobby_followCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['followCustomizedContest'])
+_Lobby_unfollowCustomizedContest = MethodEntry(_SERVICES['Lobby'].methods_by_name['unfollowCustomizedContest'])
+_Lobby_fetchActivityList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchActivityList'])
+_Lobby_fetchAccountActivityData = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchAccountActivityData'])
+_Lobby_exchangeActivityItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['exchangeActivityItem'])
+_Lobby_completeActivityTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['completeActivityTask'])
+_Lobby_completeActivityFlipTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['completeActivityFlipTask'])
+_Lobby_completePeriodActivityTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['completePeriodActivityTask'])
+_Lobby_completePeriodActivityTaskBatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['completePeriodActivityTaskBatch'])
+_Lobby_completeRandomActivityTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['completeRandomActivityTask'])
+_Lobby_receiveActivityFlipTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveActivityFlipTask'])
+_Lobby_completeSegmentTaskReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['completeSegmentTaskReward'])
+_Lobby_fetchActivityFlipInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchActivityFlipInfo'])
+_Lobby_gainAccumulatedPointActivityReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['gainAccumulatedPointActivityReward'])
+_Lobby_gainMultiPointActivityReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['gainMultiPointActivityReward'])
+_Lobby_fetchRankPointLeaderboard = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRankPointLeaderboard'])
+_Lobby_gainRankPointReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['gainRankPointReward'])
+_Lobby_richmanActivityNextMove = MethodEntry(_SERVICES['Lobby'].methods_by_name['richmanActivityNextMove'])
+_Lobby_richmanAcitivitySpecialMove = MethodEntry(_SERVICES['Lobby'].methods_by_name['richmanAcitivitySpecialMove'])
+_Lobby_richmanActivityChestInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['richmanActivityChestInfo'])
+_Lobby_createGameObserveAuth = MethodEntry(_SERVICES['Lobby'].methods_by_name['createGameObserveAuth'])
+_Lobby_refreshGameObserveAuth = MethodEntry(_SERVICES['Lobby'].methods_by_name['refreshGameObserveAuth'])
+_Lobby_fetchActivityBuff = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchActivityBuff'])
+_Lobby_upgradeActivityBuff = MethodEntry(_SERVICES['Lobby'].methods_by_name['upgradeActivityBuff'])
+_Lobby_upgradeActivityLevel = MethodEntry(_SERVICES['Lobby'].methods_by_name['upgradeActivityLevel'])
+_Lobby_receiveUpgradeActivityReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveUpgradeActivityReward'])
+_Lobby_upgradeChallenge = MethodEntry(_SERVICES['Lobby'].methods_by_name['upgradeChallenge'])
+_Lobby_refreshChallenge = MethodEntry(_SERVICES['Lobby'].methods_by_name['refreshChallenge'])
+_Lobby_fetchChallengeInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchChallengeInfo'])
+_Lobby_forceCompleteChallengeTask = MethodEntry(_SERVICES['Lobby'].methods_by_name['forceCompleteChallengeTask'])
+_Lobby_fetchChallengeSeason = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchChallengeSeason'])
+_Lobby_receiveChallengeRankReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveChallengeRankReward'])
+_Lobby_fetchABMatchInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchABMatchInfo'])
+_Lobby_buyInABMatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyInABMatch'])
+_Lobby_receiveABMatchReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveABMatchReward'])
+_Lobby_quitABMatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['quitABMatch'])
+_Lobby_startUnifiedMatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['startUnifiedMatch'])
+_Lobby_cancelUnifiedMatch = MethodEntry(_SERVICES['Lobby'].methods_by_name['cancelUnifiedMatch'])
+_Lobby_fetchGamePointRank = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGamePointRank'])
+_Lobby_fetchSelfGamePointRank = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchSelfGamePointRank'])
+_Lobby_readSNS = MethodEntry(_SERVICES['Lobby'].methods_by_name['readSNS'])
+_Lobby_replySNS = MethodEntry(_SERVICES['Lobby'].methods_by_name['replySNS'])
+_Lobby_likeSNS = MethodEntry(_SERVICES['Lobby'].methods_by_name['likeSNS'])
+_Lobby_digMine = MethodEntry(_SERVICES['Lobby'].methods_by_name['digMine'])
+_Lobby_fetchLastPrivacy = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchLastPrivacy'])
+_Lobby_checkPrivacy = MethodEntry(_SERVICES['Lobby'].methods_by_name['checkPrivacy'])
+_Lobby_responseCaptcha = MethodEntry(_SERVICES['Lobby'].methods_by_name['responseCaptcha'])
+_Lobby_fetchRPGBattleHistory = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRPGBattleHistory'])
+_Lobby_fetchRPGBattleHistoryV2 = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRPGBattleHistoryV2'])
+_Lobby_receiveRPGRewards = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveRPGRewards'])
+_Lobby_receiveRPGReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveRPGReward'])
+_Lobby_buyArenaTicket = MethodEntry(_SERVICES['Lobby'].methods_by_name['buyArenaTicket'])
+_Lobby_enterArena = MethodEntry(_SERVICES['Lobby'].methods_by_name['enterArena'])
+_Lobby_receiveArenaReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveArenaReward'])
+_Lobby_fetchOBToken = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchOBToken'])
+_Lobby_receiveCharacterRewards = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveCharacterRewards'])
+_Lobby_feedActivityFeed = MethodEntry(_SERVICES['Lobby'].methods_by_name['feedActivityFeed'])
+_Lobby_sendActivityGiftToFriend = MethodEntry(_SERVICES['Lobby'].methods_by_name['sendActivityGiftToFriend'])
+_Lobby_receiveActivityGift = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveActivityGift'])
+_Lobby_receiveAllActivityGift = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveAllActivityGift'])
+_Lobby_fetchFriendGiftActivityData = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchFriendGiftActivityData'])
+_Lobby_openPreChestItem = MethodEntry(_SERVICES['Lobby'].methods_by_name['openPreChestItem'])
+_Lobby_fetchVoteActivity = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchVoteActivity'])
+_Lobby_voteActivity = MethodEntry(_SERVICES['Lobby'].methods_by_name['voteActivity'])
+_Lobby_unlockActivitySpot = MethodEntry(_SERVICES['Lobby'].methods_by_name['unlockActivitySpot'])
+_Lobby_receiveActivitySpotReward = MethodEntry(_SERVICES['Lobby'].methods_by_name['receiveActivitySpotReward'])
+_Lobby_deleteAccount = MethodEntry(_SERVICES['Lobby'].methods_by_name['deleteAccount'])
+_Lobby_cancelDeleteAccount = MethodEntry(_SERVICES['Lobby'].methods_by_name['cancelDeleteAccount'])
+_Lobby_logReport = MethodEntry(_SERVICES['Lobby'].methods_by_name['logReport'])
+_Lobby_bindOauth2 = MethodEntry(_SERVICES['Lobby'].methods_by_name['bindOauth2'])
+_Lobby_fetchOauth2Info = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchOauth2Info'])
+_Lobby_setLoadingImage = MethodEntry(_SERVICES['Lobby'].methods_by_name['setLoadingImage'])
+_Lobby_fetchShopInterval = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchShopInterval'])
+_Lobby_fetchActivityInterval = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchActivityInterval'])
+_Lobby_fetchRecentFriend = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchRecentFriend'])
+_Lobby_openGacha = MethodEntry(_SERVICES['Lobby'].methods_by_name['openGacha'])
+_Lobby_taskRequest = MethodEntry(_SERVICES['Lobby'].methods_by_name['taskRequest'])
+
+class LobbyStub():
+    '''
+    rpc methods of `lq.Lobby`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def fetchConnectionInfo(self, *, timeout: Optional[float] = None) -> pb2.ResConnectionInfo:
+        '''rpc fetchConnectionInfo (ReqCommon) returns (ResConnectionInfo)'''
+        return await self._call(_Lobby_fetchConnectionInfo, None, timeout)
+
+    async def fetchQueueInfo(self, *, timeout: Optional[float] = None) -> pb2.ResFetchQueueInfo:
+        '''rpc fetchQueueInfo (ReqCommon) returns (ResFetchQueueInfo)'''
+        return await self._call(_Lobby_fetchQueueInfo, None, timeout)
+
+    async def cancelQueue(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc cancelQueue (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_cancelQueue, None, timeout)
+
+    async def openidCheck(self, *, type: int = 0, token: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Check:
+        '''rpc openidCheck (ReqOpenidCheck) returns (ResOauth2Check)'''
+        request = pb2.ReqOpenidCheck(type=type, token=token)
+        return await self._call(_Lobby_openidCheck, request, timeout)
+
+    async def signup(self, *, account: str = '', password: str = '', code: str = '', type: int = 0, device: Optional[pb2.ClientDeviceInfo] = None, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResSignupAccount:
+        '''rpc signup (ReqSignupAccount) returns (ResSignupAccount)'''
+        request = pb2.ReqSignupAccount(account=account, password=password, code=code, type=type, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        return await self._call(_Lobby_signup, request, timeout)
+
+    async def login(self, *, account: str = '', password: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, type: int = 0, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc login (ReqLogin) returns (ResLogin)'''
+        request = pb2.ReqLogin(account=account, password=password, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, type=type, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_login, request, timeout)
+
+    async def loginSuccess(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc loginSuccess (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_loginSuccess, None, timeout)
+
+    async def emailLogin(self, *, email: str = '', password: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: str = '', gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc emailLogin (ReqEmailLogin) returns (ResLogin)'''
+        request = pb2.ReqEmailLogin(email=email, password=password, reconnect=reconnect, random_key=random_key, client_version=client_version, gen_access_token=gen_access_token)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_emailLogin, request, timeout)
+
+    async def oauth2Auth(self, *, type: int = 0, code: str = '', uid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Auth:
+        '''rpc oauth2Auth (ReqOauth2Auth) returns (ResOauth2Auth)'''
+        request = pb2.ReqOauth2Auth(type=type, code=code, uid=uid, client_version_string=client_version_string)
+        return await self._call(_Lobby_oauth2Auth, request, timeout)
+
+    async def oauth2Check(self, *, type: int = 0, access_token: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Check:
+        '''rpc oauth2Check (ReqOauth2Check) returns (ResOauth2Check)'''
+        request = pb2.ReqOauth2Check(type=type, access_token=access_token)
+        return await self._call(_Lobby_oauth2Check, request, timeout)
+
+    async def oauth2Signup(self, *, type: int = 0, access_token: str = '', email: str = '', advertise_str: str = '', device: Optional[pb2.ClientDeviceInfo] = None, client_version: Optional[pb2.ClientVersionInfo] = None, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Signup:
+        '''rpc oauth2Signup (ReqOauth2Signup) returns (ResOauth2Signup)'''
+        request = pb2.ReqOauth2Signup(type=type, access_token=access_token, email=email, advertise_str=advertise_str, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        return await self._call(_Lobby_oauth2Signup, request, timeout)
+
+    async def oauth2Login(self, *, type: int = 0, access_token: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc oauth2Login (ReqOauth2Login) returns (ResLogin)'''
+        request = pb2.ReqOauth2Login(type=type, access_token=access_token, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_oauth2Login, request, timeout)
+
+    async def dmmPreLogin(self, *, finish_url: str = '', timeout: Optional[float] = None) -> pb2.ResDMMPreLogin:
+        '''rpc dmmPreLogin (ReqDMMPreLogin) returns (ResDMMPreLogin)'''
+        request = pb2.ReqDMMPreLogin(finish_url=finish_url)
+        return await self._call(_Lobby_dmmPreLogin, request, timeout)
+
+    async def createPhoneVerifyCode(self, *, phone: str = '', usage: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc createPhoneVerifyCode (ReqCreatePhoneVerifyCode) returns (ResCommon)'''
+        request = pb2.ReqCreatePhoneVerifyCode(phone=phone, usage=usage)
+        return await self._call(_Lobby_createPhoneVerifyCode, request, timeout)
+
+    async def createEmailVerifyCode(self, *, email: str = '', usage: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc createEmailVerifyCode (ReqCreateEmailVerifyCode) returns (ResCommon)'''
+        request = pb2.ReqCreateEmailVerifyCode(email=email, usage=usage)
+        return await self._call(_Lobby_createEmailVerifyCode, request, timeout)
+
+    async def verfifyCodeForSecure(self, *, code: str = '', operation: int = 0, timeout: Optional[float] = None) -> pb2.ResVerfiyCodeForSecure:
+        '''rpc verfifyCodeForSecure (ReqVerifyCodeForSecure) returns (ResVerfiyCodeForSecure)'''
+        request = pb2.ReqVerifyCodeForSecure(code=code, operation=operation)
+        return await self._call(_Lobby_verfifyCodeForSecure, request, timeout)
+
+    async def bindPhoneNumber(self, *, code: str = '', phone: str = '', password: str = '', multi_bind_version: bool = False, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc bindPhoneNumber (ReqBindPhoneNumber) returns (ResCommon)'''
+        request = pb2.ReqBindPhoneNumber(code=code, phone=phone, password=password, multi_bind_version=multi_bind_version)
+        return await self._call(_Lobby_bindPhoneNumber, request, timeout)
+
+    async def unbindPhoneNumber(self, *, code: str = '', phone: str = '', password: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc unbindPhoneNumber (ReqUnbindPhoneNumber) returns (ResCommon)'''
+        request = pb2.ReqUnbindPhoneNumber(code=code, phone=phone, password=password)
+        return await self._call(_Lobby_unbindPhoneNumber, request, timeout)
+
+    async def fetchPhoneLoginBind(self, *, timeout: Optional[float] = None) -> pb2.ResFetchPhoneLoginBind:
+        '''rpc fetchPhoneLoginBind (ReqCommon) returns (ResFetchPhoneLoginBind)'''
+        return await self._call(_Lobby_fetchPhoneLoginBind, None, timeout)
+
+    async def createPhoneLoginBind(self, *, password: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc createPhoneLoginBind (ReqCreatePhoneLoginBind) returns (ResCommon)'''
+        request = pb2.ReqCreatePhoneLoginBind(password=password)
+        return await self._call(_Lobby_createPhoneLoginBind, request, timeout)
+
+    async def bindEmail(self, *, email: str = '', code: str = '', password: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc bindEmail (ReqBindEmail) returns (ResCommon)'''
+        request = pb2.ReqBindEmail(email=email, code=code, password=password)
+        return await self._call(_Lobby_bindEmail, request, timeout)
+
+    async def modifyPassword(self, *, new_password: str = '', old_password: str = '', secure_token: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc modifyPassword (ReqModifyPassword) returns (ResCommon)'''
+        request = pb2.ReqModifyPassword(new_password=new_password, old_password=old_password, secure_token=secure_token)
+        return await self._call(_Lobby_modifyPassword, request, timeout)
+
+    async def bindAccount(self, *, account: str = '', password: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc bindAccount (ReqBindAccount) returns (ResCommon)'''
+        request = pb2.ReqBindAccount(account=account, password=password)
+        return await self._call(_Lobby_bindAccount, request, timeout)
+
+    async def logout(self, *, timeout: Optional[float] = None) -> pb2.ResLogout:
+        '''rpc logout (ReqLogout) returns (ResLogout)'''
+        return await self._call(_Lobby_logout, None, timeout)
+
+    async def heatbeat(self, *, no_operation_counter: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc heatbeat (ReqHeatBeat) returns (ResCommon)'''
+        request = pb2.ReqHeatBeat(no_operation_counter=no_operation_counter)
+        return await self._call(_Lobby_heatbeat, request, timeout)
+
+    async def loginBeat(self, *, contract: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc loginBeat (ReqLoginBeat) returns (ResCommon)'''
+        request = pb2.ReqLoginBeat(contract=contract)
+        return await self._call(_Lobby_loginBeat, request, timeout)
+
+    async def createNickname(self, *, nickname: str = '', advertise_str: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc createNickname (ReqCreateNickname) returns (ResCommon)'''
+        request = pb2.ReqCreateNickname(nickname=nickname, advertise_str=advertise_str, tag=tag)
+        return await self._call(_Lobby_createNickname, request, timeout)
+
+    async def modifyNickname(self, *, nickname: str = '', use_item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc modifyNickname (ReqModifyNickname) returns (ResCommon)'''
+        request = pb2.ReqModifyNickname(nickname=nickname, use_item_id=use_item_id)
+        return await self._call(_Lobby_modifyNickname, request, timeout)
+
+    async def modifyBirthday(self, *, birthday: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc modifyBirthday (ReqModifyBirthday) returns (ResCommon)'''
+        request = pb2.ReqModifyBirthday(birthday=birthday)
+        return await self._call(_Lobby_modifyBirthday, request, timeout)
+
+    async def fetchRoom(self, *, timeout: Optional[float] = None) -> pb2.ResSelfRoom:
+        '''rpc fetchRoom (ReqCommon) returns (ResSelfRoom)'''
+        return await self._call(_Lobby_fetchRoom, None, timeout)
+
+    async def createRoom(self, *, player_count: int = 0, mode: Optional[pb2.GameMode] = None, public_live: bool = False, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateRoom:
+        '''rpc createRoom (ReqCreateRoom) returns (ResCreateRoom)'''
+        request = pb2.ReqCreateRoom(player_count=player_count, public_live=public_live, client_version_string=client_version_string)
+        if mode is not None:
+            request.mode.CopyFrom(mode)
+        return await self._call(_Lobby_createRoom, request, timeout)
+
+    async def joinRoom(self, *, room_id: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResJoinRoom:
+        '''rpc joinRoom (ReqJoinRoom) returns (ResJoinRoom)'''
+        request = pb2.ReqJoinRoom(room_id=room_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_joinRoom, request, timeout)
+
+    async def leaveRoom(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc leaveRoom (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_leaveRoom, None, timeout)
+
+    async def readyPlay(self, *, ready: bool = False, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc readyPlay (ReqRoomReady) returns (ResCommon)'''
+        request = pb2.ReqRoomReady(ready=ready)
+        return await self._call(_Lobby_readyPlay, request, timeout)
+
+    async def dressingStatus(self, *, dressing: bool = False, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc dressingStatus (ReqRoomDressing) returns (ResCommon)'''
+        request = pb2.ReqRoomDressing(dressing=dressing)
+        return await self._call(_Lobby_dressingStatus, request, timeout)
+
+    async def startRoom(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc startRoom (ReqRoomStart) returns (ResCommon)'''
+        return await self._call(_Lobby_startRoom, None, timeout)
+
+    async def kickPlayer(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc kickPlayer (ReqRoomKick) returns (ResCommon)'''
+        request = pb2.ReqRoomKick(account_id=account_id)
+        return await self._call(_Lobby_kickPlayer, request, timeout)
+
+    async def modifyRoom(self, *, robot_count: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc modifyRoom (ReqModifyRoom) returns (ResCommon)'''
+        request = pb2.ReqModifyRoom(robot_count=robot_count)
+        return await self._call(_Lobby_modifyRoom, request, timeout)
+
+    async def matchGame(self, *, match_mode: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc matchGame (ReqJoinMatchQueue) returns (ResCommon)'''
+        request = pb2.ReqJoinMatchQueue(match_mode=match_mode, client_version_string=client_version_string)
+        return await self._call(_Lobby_matchGame, request, timeout)
+
+    async def cancelMatch(self, *, match_mode: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc cancelMatch (ReqCancelMatchQueue) returns (ResCommon)'''
+        request = pb2.ReqCancelMatchQueue(match_mode=match_mode)
+        return await self._call(_Lobby_cancelMatch, request, timeout)
+
+    async def fetchAccountInfo(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResAccountInfo:
+        '''rpc fetchAccountInfo (ReqAccountInfo) returns (ResAccountInfo)'''
+        request = pb2.ReqAccountInfo(account_id=account_id)
+        return await self._call(_Lobby_fetchAccountInfo, request, timeout)
+
+    async def changeAvatar(self, *, avatar_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc changeAvatar (ReqChangeAvatar) returns (ResCommon)'''
+        request = pb2.ReqChangeAvatar(avatar_id=avatar_id)
+        return await self._call(_Lobby_changeAvatar, request, timeout)
+
+    async def receiveVersionReward(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc receiveVersionReward (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_receiveVersionReward, None, timeout)
+
+    async def fetchAccountStatisticInfo(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResAccountStatisticInfo:
+        '''rpc fetchAccountStatisticInfo (ReqAccountStatisticInfo) returns (ResAccountStatisticInfo)'''
+        request = pb2.ReqAccountStatisticInfo(account_id=account_id)
+        return await self._call(_Lobby_fetchAccountStatisticInfo, request, timeout)
+
+    async def fetchAccountChallengeRankInfo(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResAccountChallengeRankInfo:
+        '''rpc fetchAccountChallengeRankInfo (ReqAccountInfo) returns (ResAccountChallengeRankInfo)'''
+        request = pb2.ReqAccountInfo(account_id=account_id)
+        return await self._call(_Lobby_fetchAccountChallengeRankInfo, request, timeout)
+
+    async def fetchAccountCharacterInfo(self, *, timeout: Optional[float] = None) -> pb2.ResAccountCharacterInfo:
+        '''rpc fetchAccountCharacterInfo (ReqCommon) returns (ResAccountCharacterInfo)'''
+        return await self._call(_Lobby_fetchAccountCharacterInfo, None, timeout)
+
+    async def shopPurchase(self, *, type: str = '', id: int = 0, timeout: Optional[float] = None) -> pb2.ResShopPurchase:
+        '''rpc shopPurchase (ReqShopPurchase) returns (ResShopPurchase)'''
+        request = pb2.ReqShopPurchase(type=type, id=id)
+        return await self._call(_Lobby_shopPurchase, request, timeout)
+
+    async def fetchGameRecord(self, *, game_uuid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResGameRecord:
+        '''rpc fetchGameRecord (ReqGameRecord) returns (ResGameRecord)'''
+        request = pb2.ReqGameRecord(game_uuid=game_uuid, client_version_string=client_version_string)
+        return await self._call(_Lobby_fetchGameRecord, request, timeout)
+
+    async def readGameRecord(self, *, game_uuid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc readGameRecord (ReqGameRecord) returns (ResCommon)'''
+        request = pb2.ReqGameRecord(game_uuid=game_uuid, client_version_string=client_version_string)
+        return await self._call(_Lobby_readGameRecord, request, timeout)
+
+    async def fetchGameRecordList(self, *, start: int = 0, count: int = 0, type: int = 0, timeout: Optional[float] = None) -> pb2.ResGameRecordList:
+        '''rpc fetchGameRecordList (ReqGameRecordList) returns (ResGameRecordList)'''
+        request = pb2.ReqGameRecordList(start=start, count=count, type=type)
+        return await self._call(_Lobby_fetchGameRecordList, request, timeout)
+
+    async def fetchCollectedGameRecordList(self, *, timeout: Optional[float] = None) -> pb2.ResCollectedGameRecordList:
+        '''rpc fetchCollectedGameRecordList (ReqCommon) returns (ResCollectedGameRecordList)'''
+        return await self._call(_Lobby_fetchCollectedGameRecordList, None, timeout)
+
+    async def fetchGameRecordsDetail(self, *, uuid_list: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> pb2.ResGameRecordsDetail:
+        '''rpc fetchGameRecordsDetail (ReqGameRecordsDetail) returns (ResGameRecordsDetail)'''
+        request = pb2.ReqGameRecordsDetail()
+        if uuid_list is not None:
+            request.uuid_list.extend(uuid_list)
+        return await self._call(_Lobby_fetchGameRecordsDetail, request, timeout)
+
+    async def addCollectedGameRecord(self, *, uuid: str = '', remarks: str = '', start_time: int = 0, end_time: int = 0, timeout: Optional[float] = None) -> pb2.ResAddCollectedGameRecord:
+        '''rpc addCollectedGameRecord (ReqAddCollectedGameRecord) returns (ResAddCollectedGameRecord)'''
+        request = pb2.ReqAddCollectedGameRecord(uuid=uuid, remarks=remarks, start_time=start_time, end_time=end_time)
+        return await self._call(_Lobby_addCollectedGameRecord, request, timeout)
+
+    async def removeCollectedGameRecord(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResRemoveCollectedGameRecord:
+        '''rpc removeCollectedGameRecord (ReqRemoveCollectedGameRecord) returns (ResRemoveCollectedGameRecord)'''
+        request = pb2.ReqRemoveCollectedGameRecord(uuid=uuid)
+        return await self._call(_Lobby_removeCollectedGameRecord, request, timeout)
+
+    async def changeCollectedGameRecordRemarks(self, *, uuid: str = '', remarks: str = '', timeout: Optional[float] = None) -> pb2.ResChangeCollectedGameRecordRemarks:
+        '''rpc changeCollectedGameRecordRemarks (ReqChangeCollectedGameRecordRemarks) returns (ResChangeCollectedGameRecordRemarks)'''
+        request = pb2.ReqChangeCollectedGameRecordRemarks(uuid=uuid, remarks=remarks)
+        return await self._call(_Lobby_changeCollectedGameRecordRemarks, request, timeout)
+
+    async def fetchLevelLeaderboard(self, *, type: int = 0, timeout: Optional[float] = None) -> pb2.ResLevelLeaderboard:
+        '''rpc fetchLevelLeaderboard (ReqLevelLeaderboard) returns (ResLevelLeaderboard)'''
+        request = pb2.ReqLevelLeaderboard(type=type)
+        return await self._call(_Lobby_fetchLevelLeaderboard, request, timeout)
+
+    async def fetchChallengeLeaderboard(self, *, season: int = 0, timeout: Optional[float] = None) -> pb2.ResChallengeLeaderboard:
+        '''rpc fetchChallengeLeaderboard (ReqChallangeLeaderboard) returns (ResChallengeLeaderboard)'''
+        request = pb2.ReqChallangeLeaderboard(season=season)
+        return await self._call(_Lobby_fetchChallengeLeaderboard, request, timeout)
+
+    async def fetchMutiChallengeLevel(self, *, account_id_list: Optional[Iterable[int]] = None, season: int = 0, timeout: Optional[float] = None) -> pb2.ResMutiChallengeLevel:
+        '''rpc fetchMutiChallengeLevel (ReqMutiChallengeLevel) returns (ResMutiChallengeLevel)'''
+        request = pb2.ReqMutiChallengeLevel(season=season)
+        if account_id_list is not None:
+            request.account_id_list.extend(account_id_list)
+        return await self._call(_Lobby_fetchMutiChallengeLevel, request, timeout)
+
+    async def fetchMultiAccountBrief(self, *, account_id_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResMultiAccountBrief:
+        '''rpc fetchMultiAccountBrief (ReqMultiAccountId) returns (ResMultiAccountBrief)'''
+        request = pb2.ReqMultiAccountId()
+        if account_id_list is not None:
+            request.account_id_list.extend(account_id_list)
+        return await self._call(_Lobby_fetchMultiAccountBrief, request, timeout)
+
+    async def fetchFriendList(self, *, timeout: Optional[float] = None) -> pb2.ResFriendList:
+        '''rpc fetchFriendList (ReqCommon) returns (ResFriendList)'''
+        return await self._call(_Lobby_fetchFriendList, None, timeout)
+
+    async def fetchFriendApplyList(self, *, timeout: Optional[float] = None) -> pb2.ResFriendApplyList:
+        '''rpc fetchFriendApplyList (ReqCommon) returns (ResFriendApplyList)'''
+        return await self._call(_Lobby_fetchFriendApplyList, None, timeout)
+
+    async def applyFriend(self, *, target_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc applyFriend (ReqApplyFriend) returns (ResCommon)'''
+        request = pb2.ReqApplyFriend(target_id=target_id)
+        return await self._call(_Lobby_applyFriend, request, timeout)
+
+    async def handleFriendApply(self, *, target_id: int = 0, method: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc handleFriendApply (ReqHandleFriendApply) returns (ResCommon)'''
+        request = pb2.ReqHandleFriendApply(target_id=target_id, method=method)
+        return await self._call(_Lobby_handleFriendApply, request, timeout)
+
+    async def removeFriend(self, *, target_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc removeFriend (ReqRemoveFriend) returns (ResCommon)'''
+        request = pb2.ReqRemoveFriend(target_id=target_id)
+        return await self._call(_Lobby_removeFriend, request, timeout)
+
+    async def searchAccountById(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResSearchAccountById:
+        '''rpc searchAccountById (ReqSearchAccountById) returns (ResSearchAccountById)'''
+        request = pb2.ReqSearchAccountById(account_id=account_id)
+        return await self._call(_Lobby_searchAccountById, request, timeout)
+
+    async def searchAccountByPattern(self, *, search_next: bool = False, pattern: str = '', timeout: Optional[float] = None) -> pb2.ResSearchAccountByPattern:
+        '''rpc searchAccountByPattern (ReqSearchAccountByPattern) returns (ResSearchAccountByPattern)'''
+        request = pb2.ReqSearchAccountByPattern(search_next=search_next, pattern=pattern)
+        return await self._call(_Lobby_searchAccountByPattern, request, timeout)
+
+    async def fetchAccountState(self, *, account_id_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResAccountStates:
+        '''rpc fetchAccountState (ReqAccountList) returns (ResAccountStates)'''
+        request = pb2.ReqAccountList()
+        if account_id_list is not None:
+            request.account_id_list.extend(account_id_list)
+        return await self._call(_Lobby_fetchAccountState, request, timeout)
+
+    async def fetchBagInfo(self, *, timeout: Optional[float] = None) -> pb2.ResBagInfo:
+        '''rpc fetchBagInfo (ReqCommon) returns (ResBagInfo)'''
+        return await self._call(_Lobby_fetchBagInfo, None, timeout)
+
+    async def useBagItem(self, *, item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc useBagItem (ReqUseBagItem) returns (ResCommon)'''
+        request = pb2.ReqUseBagItem(item_id=item_id)
+        return await self._call(_Lobby_useBagItem, request, timeout)
+
+    async def openManualItem(self, *, item_id: int = 0, count: int = 0, select_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc openManualItem (ReqOpenManualItem) returns (ResCommon)'''
+        request = pb2.ReqOpenManualItem(item_id=item_id, count=count, select_id=select_id)
+        return await self._call(_Lobby_openManualItem, request, timeout)
+
+    async def openRandomRewardItem(self, *, item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResOpenRandomRewardItem:
+        '''rpc openRandomRewardItem (ReqOpenRandomRewardItem) returns (ResOpenRandomRewardItem)'''
+        request = pb2.ReqOpenRandomRewardItem(item_id=item_id)
+        return await self._call(_Lobby_openRandomRewardItem, request, timeout)
+
+    async def openAllRewardItem(self, *, item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResOpenAllRewardItem:
+        '''rpc openAllRewardItem (ReqOpenAllRewardItem) returns (ResOpenAllRewardItem)'''
+        request = pb2.ReqOpenAllRewardItem(item_id=item_id)
+        return await self._call(_Lobby_openAllRewardItem, request, timeout)
+
+    async def composeShard(self, *, item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc composeShard (ReqComposeShard) returns (ResCommon)'''
+        request = pb2.ReqComposeShard(item_id=item_id)
+        return await self._call(_Lobby_composeShard, request, timeout)
+
+    async def fetchAnnouncement(self, *, lang: str = '', platform: str = '', timeout: Optional[float] = None) -> pb2.ResAnnouncement:
+        '''rpc fetchAnnouncement (ReqFetchAnnouncement) returns (ResAnnouncement)'''
+        request = pb2.ReqFetchAnnouncement(lang=lang, platform=platform)
+        return await self._call(_Lobby_fetchAnnouncement, request, timeout)
+
+    async def readAnnouncement(self, *, announcement_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc readAnnouncement (ReqReadAnnouncement) returns (ResCommon)'''
+        request = pb2.ReqReadAnnouncement(announcement_id=announcement_id)
+        return await self._call(_Lobby_readAnnouncement, request, timeout)
+
+    async def fetchMailInfo(self, *, timeout: Optional[float] = None) -> pb2.ResMailInfo:
+        '''rpc fetchMailInfo (ReqCommon) returns (ResMailInfo)'''
+        return await self._call(_Lobby_fetchMailInfo, None, timeout)
+
+    async def readMail(self, *, mail_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc readMail (ReqReadMail) returns (ResCommon)'''
+        request = pb2.ReqReadMail(mail_id=mail_id)
+        return await self._call(_Lobby_readMail, request, timeout)
+
+    async def deleteMail(self, *, mail_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc deleteMail (ReqDeleteMail) returns (ResCommon)'''
+        request = pb2.ReqDeleteMail(mail_id=mail_id)
+        return await self._call(_Lobby_deleteMail, request, timeout)
+
+    async def takeAttachmentFromMail(self, *, mail_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc takeAttachmentFromMail (ReqTakeAttachment) returns (ResCommon)'''
+        request = pb2.ReqTakeAttachment(mail_id=mail_id)
+        return await self._call(_Lobby_takeAttachmentFromMail, request, timeout)
+
+    async def receiveAchievementReward(self, *, achievement_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveAchievementReward:
+        '''rpc receiveAchievementReward (ReqReceiveAchievementReward) returns (ResReceiveAchievementReward)'''
+        request = pb2.ReqReceiveAchievementReward(achievement_id=achievement_id)
+        return await self._call(_Lobby_receiveAchievementReward, request, timeout)
+
+    async def receiveAchievementGroupReward(self, *, group_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveAchievementGroupReward:
+        '''rpc receiveAchievementGroupReward (ReqReceiveAchievementGroupReward) returns (ResReceiveAchievementGroupReward)'''
+        request = pb2.ReqReceiveAchievementGroupReward(group_id=group_id)
+        return await self._call(_Lobby_receiveAchievementGroupReward, request, timeout)
+
+    async def fetchAchievementRate(self, *, timeout: Optional[float] = None) -> pb2.ResFetchAchievementRate:
+        '''rpc fetchAchievementRate (ReqCommon) returns (ResFetchAchievementRate)'''
+        return await self._call(_Lobby_fetchAchievementRate, None, timeout)
+
+    async def fetchAchievement(self, *, timeout: Optional[float] = None) -> pb2.ResAchievement:
+        '''rpc fetchAchievement (ReqCommon) returns (ResAchievement)'''
+        return await self._call(_Lobby_fetchAchievement, None, timeout)
+
+    async def buyShiLian(self, *, type: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc buyShiLian (ReqBuyShiLian) returns (ResCommon)'''
+        request = pb2.ReqBuyShiLian(type=type)
+        return await self._call(_Lobby_buyShiLian, request, timeout)
+
+    async def matchShiLian(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc matchShiLian (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_matchShiLian, None, timeout)
+
+    async def goNextShiLian(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc goNextShiLian (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_goNextShiLian, None, timeout)
+
+    async def updateClientValue(self, *, key: int = 0, value: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateClientValue (ReqUpdateClientValue) returns (ResCommon)'''
+        request = pb2.ReqUpdateClientValue(key=key, value=value)
+        return await self._call(_Lobby_updateClientValue, request, timeout)
+
+    async def fetchClientValue(self, *, timeout: Optional[float] = None) -> pb2.ResClientValue:
+        '''rpc fetchClientValue (ReqCommon) returns (ResClientValue)'''
+        return await self._call(_Lobby_fetchClientValue, None, timeout)
+
+    async def clientMessage(self, *, timestamp: int = 0, message: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc clientMessage (ReqClientMessage) returns (ResCommon)'''
+        request = pb2.ReqClientMessage(timestamp=timestamp, message=message)
+        return await self._call(_Lobby_clientMessage, request, timeout)
+
+    async def fetchCurrentMatchInfo(self, *, mode_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCurrentMatchInfo:
+        '''rpc fetchCurrentMatchInfo (ReqCurrentMatchInfo) returns (ResCurrentMatchInfo)'''
+        request = pb2.ReqCurrentMatchInfo()
+        if mode_list is not None:
+            request.mode_list.extend(mode_list)
+        return await self._call(_Lobby_fetchCurrentMatchInfo, request, timeout)
+
+    async def userComplain(self, *, target_id: int = 0, type: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc userComplain (ReqUserComplain) returns (ResCommon)'''
+        request = pb2.ReqUserComplain(target_id=target_id, type=type)
+        return await self._call(_Lobby_userComplain, request, timeout)
+
+    async def fetchReviveCoinInfo(self, *, timeout: Optional[float] = None) -> pb2.ResReviveCoinInfo:
+        '''rpc fetchReviveCoinInfo (ReqCommon) returns (ResReviveCoinInfo)'''
+        return await self._call(_Lobby_fetchReviveCoinInfo, None, timeout)
+
+    async def gainReviveCoin(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gainReviveCoin (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_gainReviveCoin, None, timeout)
+
+    async def fetchDailyTask(self, *, timeout: Optional[float] = None) -> pb2.ResDailyTask:
+        '''rpc fetchDailyTask (ReqCommon) returns (ResDailyTask)'''
+        return await self._call(_Lobby_fetchDailyTask, None, timeout)
+
+    async def refreshDailyTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResRefreshDailyTask:
+        '''rpc refreshDailyTask (ReqRefreshDailyTask) returns (ResRefreshDailyTask)'''
+        request = pb2.ReqRefreshDailyTask(task_id=task_id)
+        return await self._call(_Lobby_refreshDailyTask, request, timeout)
+
+    async def useGiftCode(self, *, code: str = '', timeout: Optional[float] = None) -> pb2.ResUseGiftCode:
+        '''rpc useGiftCode (ReqUseGiftCode) returns (ResUseGiftCode)'''
+        request = pb2.ReqUseGiftCode(code=code)
+        return await self._call(_Lobby_useGiftCode, request, timeout)
+
+    async def useSpecialGiftCode(self, *, code: str = '', timeout: Optional[float] = None) -> pb2.ResUseSpecialGiftCode:
+        '''rpc useSpecialGiftCode (ReqUseGiftCode) returns (ResUseSpecialGiftCode)'''
+        request = pb2.ReqUseGiftCode(code=code)
+        return await self._call(_Lobby_useSpecialGiftCode, request, timeout)
+
+    async def fetchTitleList(self, *, timeout: Optional[float] = None) -> pb2.ResTitleList:
+        '''rpc fetchTitleList (ReqCommon) returns (ResTitleList)'''
+        return await self._call(_Lobby_fetchTitleList, None, timeout)
+
+    async def useTitle(self, *, title: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc useTitle (ReqUseTitle) returns (ResCommon)'''
+        request = pb2.ReqUseTitle(title=title)
+        return await self._call(_Lobby_useTitle, request, timeout)
+
+    async def sendClientMessage(self, *, target_id: int = 0, type: int = 0, content: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc sendClientMessage (ReqSendClientMessage) returns (ResCommon)'''
+        request = pb2.ReqSendClientMessage(target_id=target_id, type=type, content=content)
+        return await self._call(_Lobby_sendClientMessage, request, timeout)
+
+    async def fetchGameLiveInfo(self, *, game_uuid: str = '', timeout: Optional[float] = None) -> pb2.ResGameLiveInfo:
+        '''rpc fetchGameLiveInfo (ReqGameLiveInfo) returns (ResGameLiveInfo)'''
+        request = pb2.ReqGameLiveInfo(game_uuid=game_uuid)
+        return await self._call(_Lobby_fetchGameLiveInfo, request, timeout)
+
+    async def fetchGameLiveLeftSegment(self, *, game_uuid: str = '', last_segment_id: int = 0, timeout: Optional[float] = None) -> pb2.ResGameLiveLeftSegment:
+        '''rpc fetchGameLiveLeftSegment (ReqGameLiveLeftSegment) returns (ResGameLiveLeftSegment)'''
+        request = pb2.ReqGameLiveLeftSegment(game_uuid=game_uuid, last_segment_id=last_segment_id)
+        return await self._call(_Lobby_fetchGameLiveLeftSegment, request, timeout)
+
+    async def fetchGameLiveList(self, *, filter_id: int = 0, timeout: Optional[float] = None) -> pb2.ResGameLiveList:
+        '''rpc fetchGameLiveList (ReqGameLiveList) returns (ResGameLiveList)'''
+        request = pb2.ReqGameLiveList(filter_id=filter_id)
+        return await self._call(_Lobby_fetchGameLiveList, request, timeout)
+
+    async def fetchCommentSetting(self, *, timeout: Optional[float] = None) -> pb2.ResCommentSetting:
+        '''rpc fetchCommentSetting (ReqCommon) returns (ResCommentSetting)'''
+        return await self._call(_Lobby_fetchCommentSetting, None, timeout)
+
+    async def updateCommentSetting(self, *, comment_allow: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateCommentSetting (ReqUpdateCommentSetting) returns (ResCommon)'''
+        request = pb2.ReqUpdateCommentSetting(comment_allow=comment_allow)
+        return await self._call(_Lobby_updateCommentSetting, request, timeout)
+
+    async def fetchCommentList(self, *, target_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCommentList:
+        '''rpc fetchCommentList (ReqFetchCommentList) returns (ResFetchCommentList)'''
+        request = pb2.ReqFetchCommentList(target_id=target_id)
+        return await self._call(_Lobby_fetchCommentList, request, timeout)
+
+    async def fetchCommentContent(self, *, target_id: int = 0, comment_id_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchCommentContent:
+        '''rpc fetchCommentContent (ReqFetchCommentContent) returns (ResFetchCommentContent)'''
+        request = pb2.ReqFetchCommentContent(target_id=target_id)
+        if comment_id_list is not None:
+            request.comment_id_list.extend(comment_id_list)
+        return await self._call(_Lobby_fetchCommentContent, request, timeout)
+
+    async def leaveComment(self, *, target_id: int = 0, content: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc leaveComment (ReqLeaveComment) returns (ResCommon)'''
+        request = pb2.ReqLeaveComment(target_id=target_id, content=content)
+        return await self._call(_Lobby_leaveComment, request, timeout)
+
+    async def deleteComment(self, *, target_id: int = 0, delete_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc deleteComment (ReqDeleteComment) returns (ResCommon)'''
+        request = pb2.ReqDeleteComment(target_id=target_id)
+        if delete_list is not None:
+            request.delete_list.extend(delete_list)
+        return await self._call(_Lobby_deleteComment, request, timeout)
+
+    async def updateReadComment(self, *, read_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateReadComment (ReqUpdateReadComment) returns (ResCommon)'''
+        request = pb2.ReqUpdateReadComment(read_id=read_id)
+        return await self._call(_Lobby_updateReadComment, request, timeout)
+
+    async def fetchRollingNotice(self, *, timeout: Optional[float] = None) -> pb2.ReqRollingNotice:
+        '''rpc fetchRollingNotice (ReqCommon) returns (ReqRollingNotice)'''
+        return await self._call(_Lobby_fetchRollingNotice, None, timeout)
+
+    async def fetchServerTime(self, *, timeout: Optional[float] = None) -> pb2.ResServerTime:
+        '''rpc fetchServerTime (ReqCommon) returns (ResServerTime)'''
+        return await self._call(_Lobby_fetchServerTime, None, timeout)
+
+    async def fetchPlatformProducts(self, *, shelves_id: int = 0, timeout: Optional[float] = None) -> pb2.ResPlatformBillingProducts:
+        '''rpc fetchPlatformProducts (ReqPlatformBillingProducts) returns (ResPlatformBillingProducts)'''
+        request = pb2.ReqPlatformBillingProducts(shelves_id=shelves_id)
+        return await self._call(_Lobby_fetchPlatformProducts, request, timeout)
+
+    async def cancelGooglePlayOrder(self, *, order_id: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc cancelGooglePlayOrder (ReqCancelGooglePlayOrder) returns (ResCommon)'''
+        request = pb2.ReqCancelGooglePlayOrder(order_id=order_id)
+        return await self._call(_Lobby_cancelGooglePlayOrder, request, timeout)
+
+    async def openChest(self, *, chest_id: int = 0, count: int = 0, use_ticket: bool = False, timeout: Optional[float] = None) -> pb2.ResOpenChest:
+        '''rpc openChest (ReqOpenChest) returns (ResOpenChest)'''
+        request = pb2.ReqOpenChest(chest_id=chest_id, count=count, use_ticket=use_ticket)
+        return await self._call(_Lobby_openChest, request, timeout)
+
+    async def buyFromChestShop(self, *, goods_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResBuyFromChestShop:
+        '''rpc buyFromChestShop (ReqBuyFromChestShop) returns (ResBuyFromChestShop)'''
+        request = pb2.ReqBuyFromChestShop(goods_id=goods_id, count=count)
+        return await self._call(_Lobby_buyFromChestShop, request, timeout)
+
+    async def fetchDailySignInInfo(self, *, timeout: Optional[float] = None) -> pb2.ResDailySignInInfo:
+        '''rpc fetchDailySignInInfo (ReqCommon) returns (ResDailySignInInfo)'''
+        return await self._call(_Lobby_fetchDailySignInInfo, None, timeout)
+
+    async def doDailySignIn(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc doDailySignIn (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_doDailySignIn, None, timeout)
+
+    async def doActivitySignIn(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResDoActivitySignIn:
+        '''rpc doActivitySignIn (ReqDoActivitySignIn) returns (ResDoActivitySignIn)'''
+        request = pb2.ReqDoActivitySignIn(activity_id=activity_id)
+        return await self._call(_Lobby_doActivitySignIn, request, timeout)
+
+    async def fetchCharacterInfo(self, *, timeout: Optional[float] = None) -> pb2.ResCharacterInfo:
+        '''rpc fetchCharacterInfo (ReqCommon) returns (ResCharacterInfo)'''
+        return await self._call(_Lobby_fetchCharacterInfo, None, timeout)
+
+    async def updateCharacterSort(self, *, sort: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateCharacterSort (ReqUpdateCharacterSort) returns (ResCommon)'''
+        request = pb2.ReqUpdateCharacterSort()
+        if sort is not None:
+            request.sort.extend(sort)
+        return await self._call(_Lobby_updateCharacterSort, request, timeout)
+
+    async def changeMainCharacter(self, *, character_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc changeMainCharacter (ReqChangeMainCharacter) returns (ResCommon)'''
+        request = pb2.ReqChangeMainCharacter(character_id=character_id)
+        return await self._call(_Lobby_changeMainCharacter, request, timeout)
+
+    async def changeCharacterSkin(self, *, character_id: int = 0, skin: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc changeCharacterSkin (ReqChangeCharacterSkin) returns (ResCommon)'''
+        request = pb2.ReqChangeCharacterSkin(character_id=character_id, skin=skin)
+        return await self._call(_Lobby_changeCharacterSkin, request, timeout)
+
+    async def changeCharacterView(self, *, character_id: int = 0, slot: int = 0, item_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc changeCharacterView (ReqChangeCharacterView) returns (ResCommon)'''
+        request = pb2.ReqChangeCharacterView(character_id=character_id, slot=slot, item_id=item_id)
+        return await self._call(_Lobby_changeCharacterView, request, timeout)
+
+    async def setHiddenCharacter(self, *, chara_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResSetHiddenCharacter:
+        '''rpc setHiddenCharacter (ReqSetHiddenCharacter) returns (ResSetHiddenCharacter)'''
+        request = pb2.ReqSetHiddenCharacter()
+        if chara_list is not None:
+            request.chara_list.extend(chara_list)
+        return await self._call(_Lobby_setHiddenCharacter, request, timeout)
+
+    async def sendGiftToCharacter(self, *, character_id: int = 0, gifts: Optional[Iterable[pb2.ReqSendGiftToCharacter.Gift]] = None, timeout: Optional[float] = None) -> pb2.ResSendGiftToCharacter:
+        '''rpc sendGiftToCharacter (ReqSendGiftToCharacter) returns (ResSendGiftToCharacter)'''
+        request = pb2.ReqSendGiftToCharacter(character_id=character_id)
+        if gifts is not None:
+            request.gifts.extend(gifts)
+        return await self._call(_Lobby_sendGiftToCharacter, request, timeout)
+
+    async def sellItem(self, *, sells: Optional[Iterable[pb2.ReqSellItem.Item]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc sellItem (ReqSellItem) returns (ResCommon)'''
+        request = pb2.ReqSellItem()
+        if sells is not None:
+            request.sells.extend(sells)
+        return await self._call(_Lobby_sellItem, request, timeout)
+
+    async def fetchCommonView(self, *, timeout: Optional[float] = None) -> pb2.ResCommonView:
+        '''rpc fetchCommonView (ReqCommon) returns (ResCommonView)'''
+        return await self._call(_Lobby_fetchCommonView, None, timeout)
+
+    async def changeCommonView(self, *, slot: int = 0, value: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc changeCommonView (ReqChangeCommonView) returns (ResCommon)'''
+        request = pb2.ReqChangeCommonView(slot=slot, value=value)
+        return await self._call(_Lobby_changeCommonView, request, timeout)
+
+    async def saveCommonViews(self, *, views: Optional[Iterable[pb2.ViewSlot]] = None, save_index: int = 0, is_use: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc saveCommonViews (ReqSaveCommonViews) returns (ResCommon)'''
+        request = pb2.ReqSaveCommonViews(save_index=save_index, is_use=is_use)
+        if views is not None:
+            request.views.extend(views)
+        return await self._call(_Lobby_saveCommonViews, request, timeout)
+
+    async def fetchCommonViews(self, *, index: int = 0, timeout: Optional[float] = None) -> pb2.ResCommonViews:
+        '''rpc fetchCommonViews (ReqCommonViews) returns (ResCommonViews)'''
+        request = pb2.ReqCommonViews(index=index)
+        return await self._call(_Lobby_fetchCommonViews, request, timeout)
+
+    async def fetchAllCommonViews(self, *, timeout: Optional[float] = None) -> pb2.ResAllcommonViews:
+        '''rpc fetchAllCommonViews (ReqCommon) returns (ResAllcommonViews)'''
+        return await self._call(_Lobby_fetchAllCommonViews, None, timeout)
+
+    async def useCommonView(self, *, index: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc useCommonView (ReqUseCommonView) returns (ResCommon)'''
+        request = pb2.ReqUseCommonView(index=index)
+        return await self._call(_Lobby_useCommonView, request, timeout)
+
+    async def upgradeCharacter(self, *, character_id: int = 0, timeout: Optional[float] = None) -> pb2.ResUpgradeCharacter:
+        '''rpc upgradeCharacter (ReqUpgradeCharacter) returns (ResUpgradeCharacter)'''
+        request = pb2.ReqUpgradeCharacter(character_id=character_id)
+        return await self._call(_Lobby_upgradeCharacter, request, timeout)
+
+    async def addFinishedEnding(self, *, character_id: int = 0, story_id: int = 0, ending_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc addFinishedEnding (ReqFinishedEnding) returns (ResCommon)'''
+        request = pb2.ReqFinishedEnding(character_id=character_id, story_id=story_id, ending_id=ending_id)
+        return await self._call(_Lobby_addFinishedEnding, request, timeout)
+
+    async def receiveEndingReward(self, *, character_id: int = 0, story_id: int = 0, ending_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc receiveEndingReward (ReqFinishedEnding) returns (ResCommon)'''
+        request = pb2.ReqFinishedEnding(character_id=character_id, story_id=story_id, ending_id=ending_id)
+        return await self._call(_Lobby_receiveEndingReward, request, timeout)
+
+    async def gameMasterCommand(self, *, command: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gameMasterCommand (ReqGMCommand) returns (ResCommon)'''
+        request = pb2.ReqGMCommand(command=command)
+        return await self._call(_Lobby_gameMasterCommand, request, timeout)
+
+    async def fetchShopInfo(self, *, timeout: Optional[float] = None) -> pb2.ResShopInfo:
+        '''rpc fetchShopInfo (ReqCommon) returns (ResShopInfo)'''
+        return await self._call(_Lobby_fetchShopInfo, None, timeout)
+
+    async def buyFromShop(self, *, goods_id: int = 0, count: int = 0, ver_price: Optional[Iterable[pb2.ReqBuyFromShop.Item]] = None, ver_goods: Optional[Iterable[pb2.ReqBuyFromShop.Item]] = None, timeout: Optional[float] = None) -> pb2.ResBuyFromShop:
+        '''rpc buyFromShop (ReqBuyFromShop) returns (ResBuyFromShop)'''
+        request = pb2.ReqBuyFromShop(goods_id=goods_id, count=count)
+        if ver_price is not None:
+            request.ver_price.extend(ver_price)
+        if ver_goods is not None:
+            request.ver_goods.extend(ver_goods)
+        return await self._call(_Lobby_buyFromShop, request, timeout)
+
+    async def buyFromZHP(self, *, goods_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc buyFromZHP (ReqBuyFromZHP) returns (ResCommon)'''
+        request = pb2.ReqBuyFromZHP(goods_id=goods_id, count=count)
+        return await self._call(_Lobby_buyFromZHP, request, timeout)
+
+    async def refreshZHPShop(self, *, free_refresh: int = 0, cost_refresh: int = 0, timeout: Optional[float] = None) -> pb2.ResRefreshZHPShop:
+        '''rpc refreshZHPShop (ReqReshZHPShop) returns (ResRefreshZHPShop)'''
+        request = pb2.ReqReshZHPShop(free_refresh=free_refresh, cost_refresh=cost_refresh)
+        return await self._call(_Lobby_refreshZHPShop, request, timeout)
+
+    async def fetchMonthTicketInfo(self, *, timeout: Optional[float] = None) -> pb2.ResMonthTicketInfo:
+        '''rpc fetchMonthTicketInfo (ReqCommon) returns (ResMonthTicketInfo)'''
+        return await self._call(_Lobby_fetchMonthTicketInfo, None, timeout)
+
+    async def payMonthTicket(self, *, ticket_id: int = 0, timeout: Optional[float] = None) -> pb2.ResPayMonthTicket:
+        '''rpc payMonthTicket (ReqPayMonthTicket) returns (ResPayMonthTicket)'''
+        request = pb2.ReqPayMonthTicket(ticket_id=ticket_id)
+        return await self._call(_Lobby_payMonthTicket, request, timeout)
+
+    async def exchangeCurrency(self, *, id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc exchangeCurrency (ReqExchangeCurrency) returns (ResCommon)'''
+        request = pb2.ReqExchangeCurrency(id=id, count=count)
+        return await self._call(_Lobby_exchangeCurrency, request, timeout)
+
+    async def exchangeChestStone(self, *, id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc exchangeChestStone (ReqExchangeCurrency) returns (ResCommon)'''
+        request = pb2.ReqExchangeCurrency(id=id, count=count)
+        return await self._call(_Lobby_exchangeChestStone, request, timeout)
+
+    async def exchangeDiamond(self, *, id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc exchangeDiamond (ReqExchangeCurrency) returns (ResCommon)'''
+        request = pb2.ReqExchangeCurrency(id=id, count=count)
+        return await self._call(_Lobby_exchangeDiamond, request, timeout)
+
+    async def fetchServerSettings(self, *, timeout: Optional[float] = None) -> pb2.ResServerSettings:
+        '''rpc fetchServerSettings (ReqCommon) returns (ResServerSettings)'''
+        return await self._call(_Lobby_fetchServerSettings, None, timeout)
+
+    async def fetchAccountSettings(self, *, timeout: Optional[float] = None) -> pb2.ResAccountSettings:
+        '''rpc fetchAccountSettings (ReqCommon) returns (ResAccountSettings)'''
+        return await self._call(_Lobby_fetchAccountSettings, None, timeout)
+
+    async def updateAccountSettings(self, *, setting: Optional[pb2.AccountSetting] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateAccountSettings (ReqUpdateAccountSettings) returns (ResCommon)'''
+        request = pb2.ReqUpdateAccountSettings()
+        if setting is not None:
+            request.setting.CopyFrom(setting)
+        return await self._call(_Lobby_updateAccountSettings, request, timeout)
+
+    async def fetchModNicknameTime(self, *, timeout: Optional[float] = None) -> pb2.ResModNicknameTime:
+        '''rpc fetchModNicknameTime (ReqCommon) returns (ResModNicknameTime)'''
+        return await self._call(_Lobby_fetchModNicknameTime, None, timeout)
+
+    async def createWechatNativeOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, account_ip: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateWechatNativeOrder:
+        '''rpc createWechatNativeOrder (ReqCreateWechatNativeOrder) returns (ResCreateWechatNativeOrder)'''
+        request = pb2.ReqCreateWechatNativeOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, account_ip=account_ip, client_version_string=client_version_string)
+        return await self._call(_Lobby_createWechatNativeOrder, request, timeout)
+
+    async def createWechatAppOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, account_ip: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateWechatAppOrder:
+        '''rpc createWechatAppOrder (ReqCreateWechatAppOrder) returns (ResCreateWechatAppOrder)'''
+        request = pb2.ReqCreateWechatAppOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, account_ip=account_ip, client_version_string=client_version_string)
+        return await self._call(_Lobby_createWechatAppOrder, request, timeout)
+
+    async def createAlipayOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, alipay_trade_type: str = '', return_url: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateAlipayOrder:
+        '''rpc createAlipayOrder (ReqCreateAlipayOrder) returns (ResCreateAlipayOrder)'''
+        request = pb2.ReqCreateAlipayOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, alipay_trade_type=alipay_trade_type, return_url=return_url, client_version_string=client_version_string)
+        return await self._call(_Lobby_createAlipayOrder, request, timeout)
+
+    async def createAlipayScanOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateAlipayScanOrder:
+        '''rpc createAlipayScanOrder (ReqCreateAlipayScanOrder) returns (ResCreateAlipayScanOrder)'''
+        request = pb2.ReqCreateAlipayScanOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createAlipayScanOrder, request, timeout)
+
+    async def createAlipayAppOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateAlipayAppOrder:
+        '''rpc createAlipayAppOrder (ReqCreateAlipayAppOrder) returns (ResCreateAlipayAppOrder)'''
+        request = pb2.ReqCreateAlipayAppOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createAlipayAppOrder, request, timeout)
+
+    async def createJPCreditCardOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPCreditCardOrder:
+        '''rpc createJPCreditCardOrder (ReqCreateJPCreditCardOrder) returns (ResCreateJPCreditCardOrder)'''
+        request = pb2.ReqCreateJPCreditCardOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPCreditCardOrder, request, timeout)
+
+    async def createJPPaypalOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPPaypalOrder:
+        '''rpc createJPPaypalOrder (ReqCreateJPPaypalOrder) returns (ResCreateJPPaypalOrder)'''
+        request = pb2.ReqCreateJPPaypalOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPPaypalOrder, request, timeout)
+
+    async def createJPAuOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPAuOrder:
+        '''rpc createJPAuOrder (ReqCreateJPAuOrder) returns (ResCreateJPAuOrder)'''
+        request = pb2.ReqCreateJPAuOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPAuOrder, request, timeout)
+
+    async def createJPDocomoOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPDocomoOrder:
+        '''rpc createJPDocomoOrder (ReqCreateJPDocomoOrder) returns (ResCreateJPDocomoOrder)'''
+        request = pb2.ReqCreateJPDocomoOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPDocomoOrder, request, timeout)
+
+    async def createJPWebMoneyOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPWebMoneyOrder:
+        '''rpc createJPWebMoneyOrder (ReqCreateJPWebMoneyOrder) returns (ResCreateJPWebMoneyOrder)'''
+        request = pb2.ReqCreateJPWebMoneyOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPWebMoneyOrder, request, timeout)
+
+    async def createJPSoftbankOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPSoftbankOrder:
+        '''rpc createJPSoftbankOrder (ReqCreateJPSoftbankOrder) returns (ResCreateJPSoftbankOrder)'''
+        request = pb2.ReqCreateJPSoftbankOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPSoftbankOrder, request, timeout)
+
+    async def createJPPayPayOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateJPPayPayOrder:
+        '''rpc createJPPayPayOrder (ReqCreateJPPayPayOrder) returns (ResCreateJPPayPayOrder)'''
+        request = pb2.ReqCreateJPPayPayOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createJPPayPayOrder, request, timeout)
+
+    async def fetchJPCommonCreditCardOrder(self, *, order_id: str = '', account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchJPCommonCreditCardOrder:
+        '''rpc fetchJPCommonCreditCardOrder (ReqFetchJPCommonCreditCardOrder) returns (ResFetchJPCommonCreditCardOrder)'''
+        request = pb2.ReqFetchJPCommonCreditCardOrder(order_id=order_id, account_id=account_id)
+        return await self._call(_Lobby_fetchJPCommonCreditCardOrder, request, timeout)
+
+    async def createENPaypalOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateENPaypalOrder:
+        '''rpc createENPaypalOrder (ReqCreateENPaypalOrder) returns (ResCreateENPaypalOrder)'''
+        request = pb2.ReqCreateENPaypalOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createENPaypalOrder, request, timeout)
+
+    async def createENMasterCardOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateENMasterCardOrder:
+        '''rpc createENMasterCardOrder (ReqCreateENMasterCardOrder) returns (ResCreateENMasterCardOrder)'''
+        request = pb2.ReqCreateENMasterCardOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createENMasterCardOrder, request, timeout)
+
+    async def createENVisaOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateENVisaOrder:
+        '''rpc createENVisaOrder (ReqCreateENVisaOrder) returns (ResCreateENVisaOrder)'''
+        request = pb2.ReqCreateENVisaOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createENVisaOrder, request, timeout)
+
+    async def createENJCBOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateENJCBOrder:
+        '''rpc createENJCBOrder (ReqCreateENJCBOrder) returns (ResCreateENJCBOrder)'''
+        request = pb2.ReqCreateENJCBOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createENJCBOrder, request, timeout)
+
+    async def createENAlipayOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateENAlipayOrder:
+        '''rpc createENAlipayOrder (ReqCreateENAlipayOrder) returns (ResCreateENAlipayOrder)'''
+        request = pb2.ReqCreateENAlipayOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createENAlipayOrder, request, timeout)
+
+    async def createKRPaypalOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateKRPaypalOrder:
+        '''rpc createKRPaypalOrder (ReqCreateKRPaypalOrder) returns (ResCreateKRPaypalOrder)'''
+        request = pb2.ReqCreateKRPaypalOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createKRPaypalOrder, request, timeout)
+
+    async def createKRMasterCardOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateKRMasterCardOrder:
+        '''rpc createKRMasterCardOrder (ReqCreateKRMasterCardOrder) returns (ResCreateKRMasterCardOrder)'''
+        request = pb2.ReqCreateKRMasterCardOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createKRMasterCardOrder, request, timeout)
+
+    async def createKRVisaOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateKRVisaOrder:
+        '''rpc createKRVisaOrder (ReqCreateKRVisaOrder) returns (ResCreateKRVisaOrder)'''
+        request = pb2.ReqCreateKRVisaOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createKRVisaOrder, request, timeout)
+
+    async def createKRJCBOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateKRJCBOrder:
+        '''rpc createKRJCBOrder (ReqCreateKRJCBOrder) returns (ResCreateKRJCBOrder)'''
+        request = pb2.ReqCreateKRJCBOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createKRJCBOrder, request, timeout)
+
+    async def createKRAlipayOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, return_url: str = '', access_token: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateKRAlipayOrder:
+        '''rpc createKRAlipayOrder (ReqCreateKRAlipayOrder) returns (ResCreateKRAlipayOrder)'''
+        request = pb2.ReqCreateKRAlipayOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, return_url=return_url, access_token=access_token, client_version_string=client_version_string)
+        return await self._call(_Lobby_createKRAlipayOrder, request, timeout)
+
+    async def createDMMOrder(self, *, goods_id: int = 0, account_id: int = 0, client_type: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateDmmOrder:
+        '''rpc createDMMOrder (ReqCreateDMMOrder) returns (ResCreateDmmOrder)'''
+        request = pb2.ReqCreateDMMOrder(goods_id=goods_id, account_id=account_id, client_type=client_type, client_version_string=client_version_string)
+        return await self._call(_Lobby_createDMMOrder, request, timeout)
+
+    async def createIAPOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, access_token: str = '', debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateIAPOrder:
+        '''rpc createIAPOrder (ReqCreateIAPOrder) returns (ResCreateIAPOrder)'''
+        request = pb2.ReqCreateIAPOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, access_token=access_token, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createIAPOrder, request, timeout)
+
+    async def createSteamOrder(self, *, language: str = '', account_id: int = 0, client_type: int = 0, goods_id: int = 0, steam_id: str = '', debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateSteamOrder:
+        '''rpc createSteamOrder (ReqCreateSteamOrder) returns (ResCreateSteamOrder)'''
+        request = pb2.ReqCreateSteamOrder(language=language, account_id=account_id, client_type=client_type, goods_id=goods_id, steam_id=steam_id, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createSteamOrder, request, timeout)
+
+    async def verifySteamOrder(self, *, order_id: str = '', account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc verifySteamOrder (ReqVerifySteamOrder) returns (ResCommon)'''
+        request = pb2.ReqVerifySteamOrder(order_id=order_id, account_id=account_id)
+        return await self._call(_Lobby_verifySteamOrder, request, timeout)
+
+    async def createMyCardAndroidOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateMyCardOrder:
+        '''rpc createMyCardAndroidOrder (ReqCreateMyCardOrder) returns (ResCreateMyCardOrder)'''
+        request = pb2.ReqCreateMyCardOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createMyCardAndroidOrder, request, timeout)
+
+    async def createMyCardWebOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateMyCardOrder:
+        '''rpc createMyCardWebOrder (ReqCreateMyCardOrder) returns (ResCreateMyCardOrder)'''
+        request = pb2.ReqCreateMyCardOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createMyCardWebOrder, request, timeout)
+
+    async def createPaypalOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreatePaypalOrder:
+        '''rpc createPaypalOrder (ReqCreatePaypalOrder) returns (ResCreatePaypalOrder)'''
+        request = pb2.ReqCreatePaypalOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createPaypalOrder, request, timeout)
+
+    async def createXsollaOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, payment_method: int = 0, debt_order_id: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateXsollaOrder:
+        '''rpc createXsollaOrder (ReqCreateXsollaOrder) returns (ResCreateXsollaOrder)'''
+        request = pb2.ReqCreateXsollaOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, payment_method=payment_method, debt_order_id=debt_order_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createXsollaOrder, request, timeout)
+
+    async def verifyMyCardOrder(self, *, order_id: str = '', account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc verifyMyCardOrder (ReqVerifyMyCardOrder) returns (ResCommon)'''
+        request = pb2.ReqVerifyMyCardOrder(order_id=order_id, account_id=account_id)
+        return await self._call(_Lobby_verifyMyCardOrder, request, timeout)
+
+    async def verificationIAPOrder(self, *, order_id: str = '', transaction_id: str = '', receipt_data: str = '', account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResVerificationIAPOrder:
+        '''rpc verificationIAPOrder (ReqVerificationIAPOrder) returns (ResVerificationIAPOrder)'''
+        request = pb2.ReqVerificationIAPOrder(order_id=order_id, transaction_id=transaction_id, receipt_data=receipt_data, account_id=account_id)
+        return await self._call(_Lobby_verificationIAPOrder, request, timeout)
+
+    async def createYostarSDKOrder(self, *, goods_id: int = 0, client_type: int = 0, account_id: int = 0, order_type: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateYostarOrder:
+        '''rpc createYostarSDKOrder (ReqCreateYostarOrder) returns (ResCreateYostarOrder)'''
+        request = pb2.ReqCreateYostarOrder(goods_id=goods_id, client_type=client_type, account_id=account_id, order_type=order_type, client_version_string=client_version_string)
+        return await self._call(_Lobby_createYostarSDKOrder, request, timeout)
+
+    async def createBillingOrder(self, *, goods_id: int = 0, payment_platform: int = 0, client_type: int = 0, account_id: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCreateBillingOrder:
+        '''rpc createBillingOrder (ReqCreateBillingOrder) returns (ResCreateBillingOrder)'''
+        request = pb2.ReqCreateBillingOrder(goods_id=goods_id, payment_platform=payment_platform, client_type=client_type, account_id=account_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_createBillingOrder, request, timeout)
+
+    async def solveGooglePlayOrder(self, *, inapp_purchase_data: str = '', inapp_data_signature: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc solveGooglePlayOrder (ReqSolveGooglePlayOrder) returns (ResCommon)'''
+        request = pb2.ReqSolveGooglePlayOrder(inapp_purchase_data=inapp_purchase_data, inapp_data_signature=inapp_data_signature)
+        return await self._call(_Lobby_solveGooglePlayOrder, request, timeout)
+
+    async def solveGooglePayOrderV3(self, *, order_id: str = '', transaction_id: str = '', token: str = '', account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc solveGooglePayOrderV3 (ReqSolveGooglePlayOrderV3) returns (ResCommon)'''
+        request = pb2.ReqSolveGooglePlayOrderV3(order_id=order_id, transaction_id=transaction_id, token=token, account_id=account_id)
+        return await self._call(_Lobby_solveGooglePayOrderV3, request, timeout)
+
+    async def deliverAA32Order(self, *, account_id: int = 0, nsa_id: str = '', nsa_token: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc deliverAA32Order (ReqDeliverAA32Order) returns (ResCommon)'''
+        request = pb2.ReqDeliverAA32Order(account_id=account_id, nsa_id=nsa_id, nsa_token=nsa_token)
+        return await self._call(_Lobby_deliverAA32Order, request, timeout)
+
+    async def fetchMisc(self, *, timeout: Optional[float] = None) -> pb2.ResMisc:
+        '''rpc fetchMisc (ReqCommon) returns (ResMisc)'''
+        return await self._call(_Lobby_fetchMisc, None, timeout)
+
+    async def modifySignature(self, *, signature: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc modifySignature (ReqModifySignature) returns (ResCommon)'''
+        request = pb2.ReqModifySignature(signature=signature)
+        return await self._call(_Lobby_modifySignature, request, timeout)
+
+    async def fetchIDCardInfo(self, *, timeout: Optional[float] = None) -> pb2.ResIDCardInfo:
+        '''rpc fetchIDCardInfo (ReqCommon) returns (ResIDCardInfo)'''
+        return await self._call(_Lobby_fetchIDCardInfo, None, timeout)
+
+    async def updateIDCardInfo(self, *, fullname: str = '', card_no: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateIDCardInfo (ReqUpdateIDCardInfo) returns (ResCommon)'''
+        request = pb2.ReqUpdateIDCardInfo(fullname=fullname, card_no=card_no)
+        return await self._call(_Lobby_updateIDCardInfo, request, timeout)
+
+    async def fetchVipReward(self, *, timeout: Optional[float] = None) -> pb2.ResVipReward:
+        '''rpc fetchVipReward (ReqCommon) returns (ResVipReward)'''
+        return await self._call(_Lobby_fetchVipReward, None, timeout)
+
+    async def gainVipReward(self, *, vip_level: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gainVipReward (ReqGainVipReward) returns (ResCommon)'''
+        request = pb2.ReqGainVipReward(vip_level=vip_level)
+        return await self._call(_Lobby_gainVipReward, request, timeout)
+
+    async def fetchRefundOrder(self, *, timeout: Optional[float] = None) -> pb2.ResFetchRefundOrder:
+        '''rpc fetchRefundOrder (ReqCommon) returns (ResFetchRefundOrder)'''
+        return await self._call(_Lobby_fetchRefundOrder, None, timeout)
+
+    async def fetchCustomizedContestList(self, *, start: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestList:
+        '''rpc fetchCustomizedContestList (ReqFetchCustomizedContestList) returns (ResFetchCustomizedContestList)'''
+        request = pb2.ReqFetchCustomizedContestList(start=start, count=count)
+        return await self._call(_Lobby_fetchCustomizedContestList, request, timeout)
+
+    async def fetchCustomizedContestExtendInfo(self, *, uid_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestExtendInfo:
+        '''rpc fetchCustomizedContestExtendInfo (ReqFetchCustomizedContestExtendInfo) returns (ResFetchCustomizedContestExtendInfo)'''
+        request = pb2.ReqFetchCustomizedContestExtendInfo()
+        if uid_list is not None:
+            request.uid_list.extend(uid_list)
+        return await self._call(_Lobby_fetchCustomizedContestExtendInfo, request, timeout)
+
+    async def fetchCustomizedContestAuthInfo(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestAuthInfo:
+        '''rpc fetchCustomizedContestAuthInfo (ReqFetchCustomizedContestAuthInfo) returns (ResFetchCustomizedContestAuthInfo)'''
+        request = pb2.ReqFetchCustomizedContestAuthInfo(unique_id=unique_id)
+        return await self._call(_Lobby_fetchCustomizedContestAuthInfo, request, timeout)
+
+    async def enterCustomizedContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResEnterCustomizedContest:
+        '''rpc enterCustomizedContest (ReqEnterCustomizedContest) returns (ResEnterCustomizedContest)'''
+        request = pb2.ReqEnterCustomizedContest(unique_id=unique_id)
+        return await self._call(_Lobby_enterCustomizedContest, request, timeout)
+
+    async def leaveCustomizedContest(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc leaveCustomizedContest (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_leaveCustomizedContest, None, timeout)
+
+    async def fetchCustomizedContestOnlineInfo(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestOnlineInfo:
+        '''rpc fetchCustomizedContestOnlineInfo (ReqFetchCustomizedContestOnlineInfo) returns (ResFetchCustomizedContestOnlineInfo)'''
+        request = pb2.ReqFetchCustomizedContestOnlineInfo(unique_id=unique_id)
+        return await self._call(_Lobby_fetchCustomizedContestOnlineInfo, request, timeout)
+
+    async def fetchCustomizedContestByContestId(self, *, contest_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestByContestId:
+        '''rpc fetchCustomizedContestByContestId (ReqFetchCustomizedContestByContestId) returns (ResFetchCustomizedContestByContestId)'''
+        request = pb2.ReqFetchCustomizedContestByContestId(contest_id=contest_id)
+        return await self._call(_Lobby_fetchCustomizedContestByContestId, request, timeout)
+
+    async def startCustomizedContest(self, *, unique_id: int = 0, client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc startCustomizedContest (ReqStartCustomizedContest) returns (ResCommon)'''
+        request = pb2.ReqStartCustomizedContest(unique_id=unique_id, client_version_string=client_version_string)
+        return await self._call(_Lobby_startCustomizedContest, request, timeout)
+
+    async def stopCustomizedContest(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc stopCustomizedContest (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_stopCustomizedContest, None, timeout)
+
+    async def joinCustomizedContestChatRoom(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResJoinCustomizedContestChatRoom:
+        '''rpc joinCustomizedContestChatRoom (ReqJoinCustomizedContestChatRoom) returns (ResJoinCustomizedContestChatRoom)'''
+        request = pb2.ReqJoinCustomizedContestChatRoom(unique_id=unique_id)
+        return await self._call(_Lobby_joinCustomizedContestChatRoom, request, timeout)
+
+    async def leaveCustomizedContestChatRoom(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc leaveCustomizedContestChatRoom (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_leaveCustomizedContestChatRoom, None, timeout)
+
+    async def sayChatMessage(self, *, content: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc sayChatMessage (ReqSayChatMessage) returns (ResCommon)'''
+        request = pb2.ReqSayChatMessage(content=content)
+        return await self._call(_Lobby_sayChatMessage, request, timeout)
+
+    async def fetchCustomizedContestGameRecords(self, *, unique_id: int = 0, last_index: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameRecords:
+        '''rpc fetchCustomizedContestGameRecords (ReqFetchCustomizedContestGameRecords) returns (ResFetchCustomizedContestGameRecords)'''
+        request = pb2.ReqFetchCustomizedContestGameRecords(unique_id=unique_id, last_index=last_index)
+        return await self._call(_Lobby_fetchCustomizedContestGameRecords, request, timeout)
+
+    async def fetchCustomizedContestGameLiveList(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameLiveList:
+        '''rpc fetchCustomizedContestGameLiveList (ReqFetchCustomizedContestGameLiveList) returns (ResFetchCustomizedContestGameLiveList)'''
+        request = pb2.ReqFetchCustomizedContestGameLiveList(unique_id=unique_id)
+        return await self._call(_Lobby_fetchCustomizedContestGameLiveList, request, timeout)
+
+    async def followCustomizedContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc followCustomizedContest (ReqTargetCustomizedContest) returns (ResCommon)'''
+        request = pb2.ReqTargetCustomizedContest(unique_id=unique_id)
+        return await self._call(_Lobby_followCustomizedContest, request, timeout)
+
+    async def unfollowCustomizedContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc unfollowCustomizedContest (ReqTargetCustomizedContest) returns (ResCommon)'''
+        request = pb2.ReqTargetCustomizedContest(unique_id=unique_id)
+        return await self._call(_Lobby_unfollowCustomizedContest, request, timeout)
+
+    async def fetchActivityList(self, *, timeout: Optional[float] = None) -> pb2.ResActivityList:
+        '''rpc fetchActivityList (ReqCommon) returns (ResActivityList)'''
+        return await self._call(_Lobby_fetchActivityList, None, timeout)
+
+    async def fetchAccountActivityData(self, *, timeout: Optional[float] = None) -> pb2.ResAccountActivityData:
+        '''rpc fetchAccountActivityData (ReqCommon) returns (ResAccountActivityData)'''
+        return await self._call(_Lobby_fetchAccountActivityData, None, timeout)
+
+    async def exchangeActivityItem(self, *, exchange_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResExchangeActivityItem:
+        '''rpc exchangeActivityItem (ReqExchangeActivityItem) returns (ResExchangeActivityItem)'''
+        request = pb2.ReqExchangeActivityItem(exchange_id=exchange_id, count=count)
+        return await self._call(_Lobby_exchangeActivityItem, request, timeout)
+
+    async def completeActivityTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc completeActivityTask (ReqCompleteActivityTask) returns (ResCommon)'''
+        request = pb2.ReqCompleteActivityTask(task_id=task_id)
+        return await self._call(_Lobby_completeActivityTask, request, timeout)
+
+    async def completeActivityFlipTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc completeActivityFlipTask (ReqCompleteActivityTask) returns (ResCommon)'''
+        request = pb2.ReqCompleteActivityTask(task_id=task_id)
+        return await self._call(_Lobby_completeActivityFlipTask, request, timeout)
+
+    async def completePeriodActivityTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc completePeriodActivityTask (ReqCompleteActivityTask) returns (ResCommon)'''
+        request = pb2.ReqCompleteActivityTask(task_id=task_id)
+        return await self._call(_Lobby_completePeriodActivityTask, request, timeout)
+
+    async def completePeriodActivityTaskBatch(self, *, task_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc completePeriodActivityTaskBatch (ReqCompletePeriodActivityTaskBatch) returns (ResCommon)'''
+        request = pb2.ReqCompletePeriodActivityTaskBatch()
+        if task_list is not None:
+            request.task_list.extend(task_list)
+        return await self._call(_Lobby_completePeriodActivityTaskBatch, request, timeout)
+
+    async def completeRandomActivityTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc completeRandomActivityTask (ReqCompleteActivityTask) returns (ResCommon)'''
+        request = pb2.ReqCompleteActivityTask(task_id=task_id)
+        return await self._call(_Lobby_completeRandomActivityTask, request, timeout)
+
+    async def receiveActivityFlipTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveActivityFlipTask:
+        '''rpc receiveActivityFlipTask (ReqReceiveActivityFlipTask) returns (ResReceiveActivityFlipTask)'''
+        request = pb2.ReqReceiveActivityFlipTask(task_id=task_id)
+        return await self._call(_Lobby_receiveActivityFlipTask, request, timeout)
+
+    async def completeSegmentTaskReward(self, *, task_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResCompleteSegmentTaskReward:
+        '''rpc completeSegmentTaskReward (ReqCompleteSegmentTaskReward) returns (ResCompleteSegmentTaskReward)'''
+        request = pb2.ReqCompleteSegmentTaskReward(task_id=task_id, count=count)
+        return await self._call(_Lobby_completeSegmentTaskReward, request, timeout)
+
+    async def fetchActivityFlipInfo(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchActivityFlipInfo:
+        '''rpc fetchActivityFlipInfo (ReqFetchActivityFlipInfo) returns (ResFetchActivityFlipInfo)'''
+        request = pb2.ReqFetchActivityFlipInfo(activity_id=activity_id)
+        return await self._call(_Lobby_fetchActivityFlipInfo, request, timeout)
+
+    async def gainAccumulatedPointActivityReward(self, *, activity_id: int = 0, reward_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gainAccumulatedPointActivityReward (ReqGainAccumulatedPointActivityReward) returns (ResCommon)'''
+        request = pb2.ReqGainAccumulatedPointActivityReward(activity_id=activity_id, reward_id=reward_id)
+        return await self._call(_Lobby_gainAccumulatedPointActivityReward, request, timeout)
+
+    async def gainMultiPointActivityReward(self, *, activity_id: int = 0, reward_id_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gainMultiPointActivityReward (ReqGainMultiPointActivityReward) returns (ResCommon)'''
+        request = pb2.ReqGainMultiPointActivityReward(activity_id=activity_id)
+        if reward_id_list is not None:
+            request.reward_id_list.extend(reward_id_list)
+        return await self._call(_Lobby_gainMultiPointActivityReward, request, timeout)
+
+    async def fetchRankPointLeaderboard(self, *, leaderboard_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchRankPointLeaderboard:
+        '''rpc fetchRankPointLeaderboard (ReqFetchRankPointLeaderboard) returns (ResFetchRankPointLeaderboard)'''
+        request = pb2.ReqFetchRankPointLeaderboard(leaderboard_id=leaderboard_id)
+        return await self._call(_Lobby_fetchRankPointLeaderboard, request, timeout)
+
+    async def gainRankPointReward(self, *, leaderboard_id: int = 0, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc gainRankPointReward (ReqGainRankPointReward) returns (ResCommon)'''
+        request = pb2.ReqGainRankPointReward(leaderboard_id=leaderboard_id, activity_id=activity_id)
+        return await self._call(_Lobby_gainRankPointReward, request, timeout)
+
+    async def richmanActivityNextMove(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResRichmanNextMove:
+        '''rpc richmanActivityNextMove (ReqRichmanNextMove) returns (ResRichmanNextMove)'''
+        request = pb2.ReqRichmanNextMove(activity_id=activity_id)
+        return await self._call(_Lobby_richmanActivityNextMove, request, timeout)
+
+    async def richmanAcitivitySpecialMove(self, *, activity_id: int = 0, step: int = 0, timeout: Optional[float] = None) -> pb2.ResRichmanNextMove:
+        '''rpc richmanAcitivitySpecialMove (ReqRichmanSpecialMove) returns (ResRichmanNextMove)'''
+        request = pb2.ReqRichmanSpecialMove(activity_id=activity_id, step=step)
+        return await self._call(_Lobby_richmanAcitivitySpecialMove, request, timeout)
+
+    async def richmanActivityChestInfo(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResRichmanChestInfo:
+        '''rpc richmanActivityChestInfo (ReqRichmanChestInfo) returns (ResRichmanChestInfo)'''
+        request = pb2.ReqRichmanChestInfo(activity_id=activity_id)
+        return await self._call(_Lobby_richmanActivityChestInfo, request, timeout)
+
+    async def createGameObserveAuth(self, *, game_uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCreateGameObserveAuth:
+        '''rpc createGameObserveAuth (ReqCreateGameObserveAuth) returns (ResCreateGameObserveAuth)'''
+        request = pb2.ReqCreateGameObserveAuth(game_uuid=game_uuid)
+        return await self._call(_Lobby_createGameObserveAuth, request, timeout)
+
+    async def refreshGameObserveAuth(self, *, token: str = '', timeout: Optional[float] = None) -> pb2.ResRefreshGameObserveAuth:
+        '''rpc refreshGameObserveAuth (ReqRefreshGameObserveAuth) returns (ResRefreshGameObserveAuth)'''
+        request = pb2.ReqRefreshGameObserveAuth(token=token)
+        return await self._call(_Lobby_refreshGameObserveAuth, request, timeout)
+
+    async def fetchActivityBuff(self, *, timeout: Optional[float] = None) -> pb2.ResActivityBuff:
+        '''rpc fetchActivityBuff (ReqCommon) returns (ResActivityBuff)'''
+        return await self._call(_Lobby_fetchActivityBuff, None, timeout)
+
+    async def upgradeActivityBuff(self, *, buff_id: int = 0, timeout: Optional[float] = None) -> pb2.ResActivityBuff:
+        '''rpc upgradeActivityBuff (ReqUpgradeActivityBuff) returns (ResActivityBuff)'''
+        request = pb2.ReqUpgradeActivityBuff(buff_id=buff_id)
+        return await self._call(_Lobby_upgradeActivityBuff, request, timeout)
+
+    async def upgradeActivityLevel(self, *, activity_id: int = 0, group: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResUpgradeActivityLevel:
+        '''rpc upgradeActivityLevel (ReqUpgradeActivityLevel) returns (ResUpgradeActivityLevel)'''
+        request = pb2.ReqUpgradeActivityLevel(activity_id=activity_id, group=group, count=count)
+        return await self._call(_Lobby_upgradeActivityLevel, request, timeout)
+
+    async def receiveUpgradeActivityReward(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveUpgradeActivityReward:
+        '''rpc receiveUpgradeActivityReward (ReqReceiveUpgradeActivityReward) returns (ResReceiveUpgradeActivityReward)'''
+        request = pb2.ReqReceiveUpgradeActivityReward(activity_id=activity_id)
+        return await self._call(_Lobby_receiveUpgradeActivityReward, request, timeout)
+
+    async def upgradeChallenge(self, *, timeout: Optional[float] = None) -> pb2.ResUpgradeChallenge:
+        '''rpc upgradeChallenge (ReqCommon) returns (ResUpgradeChallenge)'''
+        return await self._call(_Lobby_upgradeChallenge, None, timeout)
+
+    async def refreshChallenge(self, *, timeout: Optional[float] = None) -> pb2.ResRefreshChallenge:
+        '''rpc refreshChallenge (ReqCommon) returns (ResRefreshChallenge)'''
+        return await self._call(_Lobby_refreshChallenge, None, timeout)
+
+    async def fetchChallengeInfo(self, *, timeout: Optional[float] = None) -> pb2.ResFetchChallengeInfo:
+        '''rpc fetchChallengeInfo (ReqCommon) returns (ResFetchChallengeInfo)'''
+        return await self._call(_Lobby_fetchChallengeInfo, None, timeout)
+
+    async def forceCompleteChallengeTask(self, *, task_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc forceCompleteChallengeTask (ReqForceCompleteChallengeTask) returns (ResCommon)'''
+        request = pb2.ReqForceCompleteChallengeTask(task_id=task_id)
+        return await self._call(_Lobby_forceCompleteChallengeTask, request, timeout)
+
+    async def fetchChallengeSeason(self, *, timeout: Optional[float] = None) -> pb2.ResChallengeSeasonInfo:
+        '''rpc fetchChallengeSeason (ReqCommon) returns (ResChallengeSeasonInfo)'''
+        return await self._call(_Lobby_fetchChallengeSeason, None, timeout)
+
+    async def receiveChallengeRankReward(self, *, season_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveChallengeRankReward:
+        '''rpc receiveChallengeRankReward (ReqReceiveChallengeRankReward) returns (ResReceiveChallengeRankReward)'''
+        request = pb2.ReqReceiveChallengeRankReward(season_id=season_id)
+        return await self._call(_Lobby_receiveChallengeRankReward, request, timeout)
+
+    async def fetchABMatchInfo(self, *, timeout: Optional[float] = None) -> pb2.ResFetchABMatch:
+        '''rpc fetchABMatchInfo (ReqCommon) returns (ResFetchABMatch)'''
+        return await self._call(_Lobby_fetchABMatchInfo, None, timeout)
+
+    async def buyInABMatch(self, *, match_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc buyInABMatch (ReqBuyInABMatch) returns (ResCommon)'''
+        request = pb2.ReqBuyInABMatch(match_id=match_id)
+        return await self._call(_Lobby_buyInABMatch, request, timeout)
+
+    async def receiveABMatchReward(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc receiveABMatchReward (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_receiveABMatchReward, None, timeout)
+
+    async def quitABMatch(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc quitABMatch (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_quitABMatch, None, timeout)
+
+    async def startUnifiedMatch(self, *, match_sid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc startUnifiedMatch (ReqStartUnifiedMatch) returns (ResCommon)'''
+        request = pb2.ReqStartUnifiedMatch(match_sid=match_sid, client_version_string=client_version_string)
+        return await self._call(_Lobby_startUnifiedMatch, request, timeout)
+
+    async def cancelUnifiedMatch(self, *, match_sid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc cancelUnifiedMatch (ReqCancelUnifiedMatch) returns (ResCommon)'''
+        request = pb2.ReqCancelUnifiedMatch(match_sid=match_sid)
+        return await self._call(_Lobby_cancelUnifiedMatch, request, timeout)
+
+    async def fetchGamePointRank(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResGamePointRank:
+        '''rpc fetchGamePointRank (ReqGamePointRank) returns (ResGamePointRank)'''
+        request = pb2.ReqGamePointRank(activity_id=activity_id)
+        return await self._call(_Lobby_fetchGamePointRank, request, timeout)
+
+    async def fetchSelfGamePointRank(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchSelfGamePointRank:
+        '''rpc fetchSelfGamePointRank (ReqGamePointRank) returns (ResFetchSelfGamePointRank)'''
+        request = pb2.ReqGamePointRank(activity_id=activity_id)
+        return await self._call(_Lobby_fetchSelfGamePointRank, request, timeout)
+
+    async def readSNS(self, *, id: int = 0, timeout: Optional[float] = None) -> pb2.ResReadSNS:
+        '''rpc readSNS (ReqReadSNS) returns (ResReadSNS)'''
+        request = pb2.ReqReadSNS(id=id)
+        return await self._call(_Lobby_readSNS, request, timeout)
+
+    async def replySNS(self, *, id: int = 0, timeout: Optional[float] = None) -> pb2.ResReplySNS:
+        '''rpc replySNS (ReqReplySNS) returns (ResReplySNS)'''
+        request = pb2.ReqReplySNS(id=id)
+        return await self._call(_Lobby_replySNS, request, timeout)
+
+    async def likeSNS(self, *, id: int = 0, timeout: Optional[float] = None) -> pb2.ResLikeSNS:
+        '''rpc likeSNS (ReqLikeSNS) returns (ResLikeSNS)'''
+        request = pb2.ReqLikeSNS(id=id)
+        return await self._call(_Lobby_likeSNS, request, timeout)
+
+    async def digMine(self, *, activity_id: int = 0, point: Optional[pb2.Point] = None, timeout: Optional[float] = None) -> pb2.ResDigMine:
+        '''rpc digMine (ReqDigMine) returns (ResDigMine)'''
+        request = pb2.ReqDigMine(activity_id=activity_id)
+        if point is not None:
+            request.point.CopyFrom(point)
+        return await self._call(_Lobby_digMine, request, timeout)
+
+    async def fetchLastPrivacy(self, *, type: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchLastPrivacy:
+        '''rpc fetchLastPrivacy (ReqFetchLastPrivacy) returns (ResFetchLastPrivacy)'''
+        request = pb2.ReqFetchLastPrivacy()
+        if type is not None:
+            request.type.extend(type)
+        return await self._call(_Lobby_fetchLastPrivacy, request, timeout)
+
+    async def checkPrivacy(self, *, device_type: str = '', versions: Optional[Iterable[pb2.ReqCheckPrivacy.Versions]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc checkPrivacy (ReqCheckPrivacy) returns (ResCommon)'''
+        request = pb2.ReqCheckPrivacy(device_type=device_type)
+        if versions is not None:
+            request.versions.extend(versions)
+        return await self._call(_Lobby_checkPrivacy, request, timeout)
+
+    async def responseCaptcha(self, *, check_id: int = 0, check_time: int = 0, result: str = '', client_version_string: str = '', type: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc responseCaptcha (ReqResponseCaptcha) returns (ResCommon)'''
+        request = pb2.ReqResponseCaptcha(check_id=check_id, check_time=check_time, result=result, client_version_string=client_version_string, type=type)
+        return await self._call(_Lobby_responseCaptcha, request, timeout)
+
+    async def fetchRPGBattleHistory(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchRPGBattleHistory:
+        '''rpc fetchRPGBattleHistory (ReqFetchRPGBattleHistory) returns (ResFetchRPGBattleHistory)'''
+        request = pb2.ReqFetchRPGBattleHistory(activity_id=activity_id)
+        return await self._call(_Lobby_fetchRPGBattleHistory, request, timeout)
+
+    async def fetchRPGBattleHistoryV2(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchRPGBattleHistoryV2:
+        '''rpc fetchRPGBattleHistoryV2 (ReqFetchRPGBattleHistory) returns (ResFetchRPGBattleHistoryV2)'''
+        request = pb2.ReqFetchRPGBattleHistory(activity_id=activity_id)
+        return await self._call(_Lobby_fetchRPGBattleHistoryV2, request, timeout)
+
+    async def receiveRPGRewards(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveRPGRewards:
+        '''rpc receiveRPGRewards (ReqReceiveRPGRewards) returns (ResReceiveRPGRewards)'''
+        request = pb2.ReqReceiveRPGRewards(activity_id=activity_id)
+        return await self._call(_Lobby_receiveRPGRewards, request, timeout)
+
+    async def receiveRPGReward(self, *, activity_id: int = 0, monster_seq: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveRPGRewards:
+        '''rpc receiveRPGReward (ReqReceiveRPGReward) returns (ResReceiveRPGRewards)'''
+        request = pb2.ReqReceiveRPGReward(activity_id=activity_id, monster_seq=monster_seq)
+        return await self._call(_Lobby_receiveRPGReward, request, timeout)
+
+    async def buyArenaTicket(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc buyArenaTicket (ReqBuyArenaTicket) returns (ResCommon)'''
+        request = pb2.ReqBuyArenaTicket(activity_id=activity_id)
+        return await self._call(_Lobby_buyArenaTicket, request, timeout)
+
+    async def enterArena(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc enterArena (ReqEnterArena) returns (ResCommon)'''
+        request = pb2.ReqEnterArena(activity_id=activity_id)
+        return await self._call(_Lobby_enterArena, request, timeout)
+
+    async def receiveArenaReward(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResArenaReward:
+        '''rpc receiveArenaReward (ReqArenaReward) returns (ResArenaReward)'''
+        request = pb2.ReqArenaReward(activity_id=activity_id)
+        return await self._call(_Lobby_receiveArenaReward, request, timeout)
+
+    async def fetchOBToken(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResFetchOBToken:
+        '''rpc fetchOBToken (ReqFetchOBToken) returns (ResFetchOBToken)'''
+        request = pb2.ReqFetchOBToken(uuid=uuid)
+        return await self._call(_Lobby_fetchOBToken, request, timeout)
+
+    async def receiveCharacterRewards(self, *, character_id: int = 0, level: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveCharacterRewards:
+        '''rpc receiveCharacterRewards (ReqReceiveCharacterRewards) returns (ResReceiveCharacterRewards)'''
+        request = pb2.ReqReceiveCharacterRewards(character_id=character_id, level=level)
+        return await self._call(_Lobby_receiveCharacterRewards, request, timeout)
+
+    async def feedActivityFeed(self, *, activity_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResFeedActivityFeed:
+        '''rpc feedActivityFeed (ReqFeedActivityFeed) returns (ResFeedActivityFeed)'''
+        request = pb2.ReqFeedActivityFeed(activity_id=activity_id, count=count)
+        return await self._call(_Lobby_feedActivityFeed, request, timeout)
+
+    async def sendActivityGiftToFriend(self, *, activity_id: int = 0, item_id: int = 0, target_id: int = 0, timeout: Optional[float] = None) -> pb2.ResSendActivityGiftToFriend:
+        '''rpc sendActivityGiftToFriend (ReqSendActivityGiftToFriend) returns (ResSendActivityGiftToFriend)'''
+        request = pb2.ReqSendActivityGiftToFriend(activity_id=activity_id, item_id=item_id, target_id=target_id)
+        return await self._call(_Lobby_sendActivityGiftToFriend, request, timeout)
+
+    async def receiveActivityGift(self, *, activity_id: int = 0, id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc receiveActivityGift (ReqReceiveActivityGift) returns (ResCommon)'''
+        request = pb2.ReqReceiveActivityGift(activity_id=activity_id, id=id)
+        return await self._call(_Lobby_receiveActivityGift, request, timeout)
+
+    async def receiveAllActivityGift(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveAllActivityGift:
+        '''rpc receiveAllActivityGift (ReqReceiveAllActivityGift) returns (ResReceiveAllActivityGift)'''
+        request = pb2.ReqReceiveAllActivityGift(activity_id=activity_id)
+        return await self._call(_Lobby_receiveAllActivityGift, request, timeout)
+
+    async def fetchFriendGiftActivityData(self, *, activity_id: int = 0, account_list: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchFriendGiftActivityData:
+        '''rpc fetchFriendGiftActivityData (ReqFetchFriendGiftActivityData) returns (ResFetchFriendGiftActivityData)'''
+        request = pb2.ReqFetchFriendGiftActivityData(activity_id=activity_id)
+        if account_list is not None:
+            request.account_list.extend(account_list)
+        return await self._call(_Lobby_fetchFriendGiftActivityData, request, timeout)
+
+    async def openPreChestItem(self, *, item_id: int = 0, pool_id: int = 0, timeout: Optional[float] = None) -> pb2.ResOpenPreChestItem:
+        '''rpc openPreChestItem (ReqOpenPreChestItem) returns (ResOpenPreChestItem)'''
+        request = pb2.ReqOpenPreChestItem(item_id=item_id, pool_id=pool_id)
+        return await self._call(_Lobby_openPreChestItem, request, timeout)
+
+    async def fetchVoteActivity(self, *, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchVoteActivity:
+        '''rpc fetchVoteActivity (ReqFetchVoteActivity) returns (ResFetchVoteActivity)'''
+        request = pb2.ReqFetchVoteActivity(activity_id=activity_id)
+        return await self._call(_Lobby_fetchVoteActivity, request, timeout)
+
+    async def voteActivity(self, *, vote: int = 0, activity_id: int = 0, timeout: Optional[float] = None) -> pb2.ResVoteActivity:
+        '''rpc voteActivity (ReqVoteActivity) returns (ResVoteActivity)'''
+        request = pb2.ReqVoteActivity(vote=vote, activity_id=activity_id)
+        return await self._call(_Lobby_voteActivity, request, timeout)
+
+    async def unlockActivitySpot(self, *, unique_id: int = 0, ending_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc unlockActivitySpot (ReqUnlockActivitySpot) returns (ResCommon)'''
+        request = pb2.ReqUnlockActivitySpot(unique_id=unique_id, ending_id=ending_id)
+        return await self._call(_Lobby_unlockActivitySpot, request, timeout)
+
+    async def receiveActivitySpotReward(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResReceiveActivitySpotReward:
+        '''rpc receiveActivitySpotReward (ReqReceiveActivitySpotReward) returns (ResReceiveActivitySpotReward)'''
+        request = pb2.ReqReceiveActivitySpotReward(unique_id=unique_id)
+        return await self._call(_Lobby_receiveActivitySpotReward, request, timeout)
+
+    async def deleteAccount(self, *, timeout: Optional[float] = None) -> pb2.ResDeleteAccount:
+        '''rpc deleteAccount (ReqCommon) returns (ResDeleteAccount)'''
+        return await self._call(_Lobby_deleteAccount, None, timeout)
+
+    async def cancelDeleteAccount(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc cancelDeleteAccount (ReqCommon) returns (ResCommon)'''
+        return await self._call(_Lobby_cancelDeleteAccount, None, timeout)
+
+    async def logReport(self, *, success: int = 0, failed: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc logReport (ReqLogReport) returns (ResCommon)'''
+        request = pb2.ReqLogReport(success=success, failed=failed)
+        return await self._call(_Lobby_logReport, request, timeout)
+
+    async def bindOauth2(self, *, type: int = 0, token: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc bindOauth2 (ReqBindOauth2) returns (ResCommon)'''
+        request = pb2.ReqBindOauth2(type=type, token=token)
+        return await self._call(_Lobby_bindOauth2, request, timeout)
+
+    async def fetchOauth2Info(self, *, type: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchOauth2:
+        '''rpc fetchOauth2Info (ReqFetchOauth2) returns (ResFetchOauth2)'''
+        request = pb2.ReqFetchOauth2(type=type)
+        return await self._call(_Lobby_fetchOauth2Info, request, timeout)
+
+    async def setLoadingImage(self, *, images: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc setLoadingImage (ReqSetLoadingImage) returns (ResCommon)'''
+        request = pb2.ReqSetLoadingImage()
+        if images is not None:
+            request.images.extend(images)
+        return await self._call(_Lobby_setLoadingImage, request, timeout)
+
+    async def fetchShopInterval(self, *, timeout: Optional[float] = None) -> pb2.ResFetchShopInterval:
+        '''rpc fetchShopInterval (ReqCommon) returns (ResFetchShopInterval)'''
+        return await self._call(_Lobby_fetchShopInterval, None, timeout)
+
+    async def fetchActivityInterval(self, *, timeout: Optional[float] = None) -> pb2.ResFetchActivityInterval:
+        '''rpc fetchActivityInterval (ReqCommon) returns (ResFetchActivityInterval)'''
+        return await self._call(_Lobby_fetchActivityInterval, None, timeout)
+
+    async def fetchRecentFriend(self, *, timeout: Optional[float] = None) -> pb2.ResFetchrecentFriend:
+        '''rpc fetchRecentFriend (ReqCommon) returns (ResFetchrecentFriend)'''
+        return await self._call(_Lobby_fetchRecentFriend, None, timeout)
+
+    async def openGacha(self, *, activity_id: int = 0, count: int = 0, timeout: Optional[float] = None) -> pb2.ResOpenGacha:
+        '''rpc openGacha (ReqOpenGacha) returns (ResOpenGacha)'''
+        request = pb2.ReqOpenGacha(activity_id=activity_id, count=count)
+        return await self._call(_Lobby_openGacha, request, timeout)
+
+    async def taskRequest(self, *, params: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc taskRequest (ReqTaskRequest) returns (ResCommon)'''
+        request = pb2.ReqTaskRequest()
+        if params is not None:
+            request.params.extend(params)
+        return await self._call(_Lobby_taskRequest, request, timeout)
+
+_FastTest_authGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['authGame'])
+_FastTest_enterGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['enterGame'])
+_FastTest_syncGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['syncGame'])
+_FastTest_finishSyncGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['finishSyncGame'])
+_FastTest_terminateGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['terminateGame'])
+_FastTest_inputOperation = MethodEntry(_SERVICES['FastTest'].methods_by_name['inputOperation'])
+_FastTest_inputChiPengGang = MethodEntry(_SERVICES['FastTest'].methods_by_name['inputChiPengGang'])
+_FastTest_confirmNewRound = MethodEntry(_SERVICES['FastTest'].methods_by_name['confirmNewRound'])
+_FastTest_broadcastInGame = MethodEntry(_SERVICES['FastTest'].methods_by_name['broadcastInGame'])
+_FastTest_inputGameGMCommand = MethodEntry(_SERVICES['FastTest'].methods_by_name['inputGameGMCommand'])
+_FastTest_fetchGamePlayerState = MethodEntry(_SERVICES['FastTest'].methods_by_name['fetchGamePlayerState'])
+_FastTest_checkNetworkDelay = MethodEntry(_SERVICES['FastTest'].methods_by_name['checkNetworkDelay'])
+_FastTest_clearLeaving = MethodEntry(_SERVICES['FastTest'].methods_by_name['clearLeaving'])
+_FastTest_voteGameEnd = MethodEntry(_SERVICES['FastTest'].methods_by_name['voteGameEnd'])
+_FastTest_authObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['authObserve'])
+_FastTest_startObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['startObserve'])
+_FastTest_stopObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['stopObserve'])
+
+class FastTestStub():
+    '''
+    rpc methods of `lq.FastTest`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def authGame(self, *, account_id: int = 0, token: str = '', game_uuid: str = '', session: str = '', gift: str = '', vs: int = 0, timeout: Optional[float] = None) -> pb2.ResAuthGame:
+        '''rpc authGame (ReqAuthGame) returns (ResAuthGame)'''
+        request = pb2.ReqAuthGame(account_id=account_id, token=token, game_uuid=game_uuid, session=session, gift=gift, vs=vs)
+        return await self._call(_FastTest_authGame, request, timeout)
+
+    async def enterGame(self, *, timeout: Optional[float] = None) -> pb2.ResEnterGame:
+        '''rpc enterGame (ReqCommon) returns (ResEnterGame)'''
+        return await self._call(_FastTest_enterGame, None, timeout)
+
+    async def syncGame(self, *, round_id: str = '', step: int = 0, timeout: Optional[float] = None) -> pb2.ResSyncGame:
+        '''rpc syncGame (ReqSyncGame) returns (ResSyncGame)'''
+        request = pb2.ReqSyncGame(round_id=round_id, step=step)
+        return await self._call(_FastTest_syncGame, request, timeout)
+
+    async def finishSyncGame(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc finishSyncGame (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_finishSyncGame, None, timeout)
+
+    async def terminateGame(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc terminateGame (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_terminateGame, None, timeout)
+
+    async def inputOperation(self, *, type: int = 0, index: int = 0, tile: str = '', cancel_operation: bool = False, moqie: bool = False, timeuse: int = 0, tile_state: int = 0, change_tiles: Optional[Iterable[str]] = None, tile_states: Optional[Iterable[int]] = None, gap_type: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc inputOperation (ReqSelfOperation) returns (ResCommon)'''
+        request = pb2.ReqSelfOperation(type=type, index=index, tile=tile, cancel_operation=cancel_operation, moqie=moqie, timeuse=timeuse, tile_state=tile_state, gap_type=gap_type)
+        if change_tiles is not None:
+            request.change_tiles.extend(change_tiles)
+        if tile_states is not None:
+            request.tile_states.extend(tile_states)
+        return await self._call(_FastTest_inputOperation, request, timeout)
+
+    async def inputChiPengGang(self, *, type: int = 0, index: int = 0, cancel_operation: bool = False, timeuse: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc inputChiPengGang (ReqChiPengGang) returns (ResCommon)'''
+        request = pb2.ReqChiPengGang(type=type, index=index, cancel_operation=cancel_operation, timeuse=timeuse)
+        return await self._call(_FastTest_inputChiPengGang, request, timeout)
+
+    async def confirmNewRound(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc confirmNewRound (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_confirmNewRound, None, timeout)
+
+    async def broadcastInGame(self, *, content: str = '', except_self: bool = False, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc broadcastInGame (ReqBroadcastInGame) returns (ResCommon)'''
+        request = pb2.ReqBroadcastInGame(content=content, except_self=except_self)
+        return await self._call(_FastTest_broadcastInGame, request, timeout)
+
+    async def inputGameGMCommand(self, *, json_data: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc inputGameGMCommand (ReqGMCommandInGaming) returns (ResCommon)'''
+        request = pb2.ReqGMCommandInGaming(json_data=json_data)
+        return await self._call(_FastTest_inputGameGMCommand, request, timeout)
+
+    async def fetchGamePlayerState(self, *, timeout: Optional[float] = None) -> pb2.ResGamePlayerState:
+        '''rpc fetchGamePlayerState (ReqCommon) returns (ResGamePlayerState)'''
+        return await self._call(_FastTest_fetchGamePlayerState, None, timeout)
+
+    async def checkNetworkDelay(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc checkNetworkDelay (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_checkNetworkDelay, None, timeout)
+
+    async def clearLeaving(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc clearLeaving (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_clearLeaving, None, timeout)
+
+    async def voteGameEnd(self, *, yes: bool = False, timeout: Optional[float] = None) -> pb2.ResGameEndVote:
+        '''rpc voteGameEnd (ReqVoteGameEnd) returns (ResGameEndVote)'''
+        request = pb2.ReqVoteGameEnd(yes=yes)
+        return await self._call(_FastTest_voteGameEnd, request, timeout)
+
+    async def authObserve(self, *, token: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc authObserve (ReqAuthObserve) returns (ResCommon)'''
+        request = pb2.ReqAuthObserve(token=token)
+        return await self._call(_FastTest_authObserve, request, timeout)
+
+    async def startObserve(self, *, timeout: Optional[float] = None) -> pb2.ResStartObserve:
+        '''rpc startObserve (ReqCommon) returns (ResStartObserve)'''
+        return await self._call(_FastTest_startObserve, None, timeout)
+
+    async def stopObserve(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc stopObserve (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_stopObserve, None, timeout)
+
+_CustomizedContestManagerApi_loginContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['loginContestManager'])
+_CustomizedContestManagerApi_oauth2AuthContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['oauth2AuthContestManager'])
+_CustomizedContestManagerApi_oauth2LoginContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['oauth2LoginContestManager'])
+_CustomizedContestManagerApi_logoutContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['logoutContestManager'])
+_CustomizedContestManagerApi_fetchRelatedContestList = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchRelatedContestList'])
+_CustomizedContestManagerApi_createContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['createContest'])
+_CustomizedContestManagerApi_deleteContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['deleteContest'])
+_CustomizedContestManagerApi_prolongContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['prolongContest'])
+_CustomizedContestManagerApi_manageContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['manageContest'])
+_CustomizedContestManagerApi_fetchContestInfo = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestInfo'])
+_CustomizedContestManagerApi_exitManageContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['exitManageContest'])
+_CustomizedContestManagerApi_fetchContestGameRule = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestGameRule'])
+_CustomizedContestManagerApi_updateContestGameRule = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestGameRule'])
+_CustomizedContestManagerApi_searchAccountByNickname = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['searchAccountByNickname'])
+_CustomizedContestManagerApi_searchAccountByEid = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['searchAccountByEid'])
+_CustomizedContestManagerApi_fetchContestPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestPlayer'])
+_CustomizedContestManagerApi_fetchContestMatchingPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestMatchingPlayer'])
+_CustomizedContestManagerApi_updateContestPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestPlayer'])
+_CustomizedContestManagerApi_startManageGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['startManageGame'])
+_CustomizedContestManagerApi_stopManageGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['stopManageGame'])
+_CustomizedContestManagerApi_lockGamePlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['lockGamePlayer'])
+_CustomizedContestManagerApi_unlockGamePlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['unlockGamePlayer'])
+_CustomizedContestManagerApi_createContestGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['createContestGame'])
+_CustomizedContestManagerApi_fetchContestGameRecords = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestGameRecords'])
+_CustomizedContestManagerApi_removeContestGameRecord = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['removeContestGameRecord'])
+_CustomizedContestManagerApi_fetchContestNotice = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestNotice'])
+_CustomizedContestManagerApi_updateContestNotice = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestNotice'])
+_CustomizedContestManagerApi_fetchContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestManager'])
+_CustomizedContestManagerApi_updateContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestManager'])
+_CustomizedContestManagerApi_fetchChatSetting = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchChatSetting'])
+_CustomizedContestManagerApi_updateChatSetting = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateChatSetting'])
+_CustomizedContestManagerApi_updateGameTag = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateGameTag'])
+_CustomizedContestManagerApi_terminateGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['terminateGame'])
+_CustomizedContestManagerApi_pauseGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['pauseGame'])
+_CustomizedContestManagerApi_resumeGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['resumeGame'])
+_CustomizedContestManagerApi_fetchCurrentRankList = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchCurrentRankList'])
+_CustomizedContestManagerApi_fetchContestLastModify = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestLastModify'])
+_CustomizedContestManagerApi_fetchContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestObserver'])
+_CustomizedContestManagerApi_addContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['addContestObserver'])
+_CustomizedContestManagerApi_removeContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['removeContestObserver'])
+_CustomizedContestManagerApi_fetchContestChatHistory = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestChatHistory'])
+_CustomizedContestManagerApi_clearChatHistory = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['clearChatHistory'])
+
+class CustomizedContestManagerApiStub():
+    '''
+    rpc methods of `lq.CustomizedContestManagerApi`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def loginContestManager(self, *, account: str = '', password: str = '', gen_access_token: bool = False, type: int = 0, timeout: Optional[float] = None) -> pb2.ResContestManageLogin:
+        '''rpc loginContestManager (ReqContestManageLogin) returns (ResContestManageLogin)'''
+        request = pb2.ReqContestManageLogin(account=account, password=password, gen_access_token=gen_access_token, type=type)
+        return await self._call(_CustomizedContestManagerApi_loginContestManager, request, timeout)
+
+    async def oauth2AuthContestManager(self, *, type: int = 0, code: str = '', uid: str = '', timeout: Optional[float] = None) -> pb2.ResContestManageOauth2Auth:
+        '''rpc oauth2AuthContestManager (ReqContestManageOauth2Auth) returns (ResContestManageOauth2Auth)'''
+        request = pb2.ReqContestManageOauth2Auth(type=type, code=code, uid=uid)
+        return await self._call(_CustomizedContestManagerApi_oauth2AuthContestManager, request, timeout)
+
+    async def oauth2LoginContestManager(self, *, type: int = 0, access_token: str = '', reconnect: bool = False, timeout: Optional[float] = None) -> pb2.ResContestManageOauth2Login:
+        '''rpc oauth2LoginContestManager (ReqContestManageOauth2Login) returns (ResContestManageOauth2Login)'''
+        request = pb2.ReqContestManageOauth2Login(type=type, access_token=access_token, reconnect=reconnect)
+        return await self._call(_CustomizedContestManagerApi_oauth2LoginContestManager, request, timeout)
+
+    async def logoutContestManager(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc logoutContestManager (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_logoutContestManager, None, timeout)
+
+    async def fetchRelatedContestList(self, *, timeout: Optional[float] = None) -> pb2.ResFetchRelatedContestList:
+        '''rpc fetchRelatedContestList (ReqCommon) returns (ResFetchRelatedContestList)'''
+        return await self._call(_CustomizedContestManagerApi_fetchRelatedContestList, None, timeout)
+
+    async def createContest(self, *, contest_name: str = '', start_time: int = 0, finish_time: int = 0, open: bool = False, rank_rule: int = 0, game_rule_setting: Optional[pb2.GameRuleSetting] = None, timeout: Optional[float] = None) -> pb2.ResCreateCustomizedContest:
+        '''rpc createContest (ReqCreateCustomizedContest) returns (ResCreateCustomizedContest)'''
+        request = pb2.ReqCreateCustomizedContest(contest_name=contest_name, start_time=start_time, finish_time=finish_time, open=open, rank_rule=rank_rule)
+        if game_rule_setting is not None:
+            request.game_rule_setting.CopyFrom(game_rule_setting)
+        return await self._call(_CustomizedContestManagerApi_createContest, request, timeout)
+
+    async def deleteContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc deleteContest (ReqDeleteCustomizedContest) returns (ResCommon)'''
+        request = pb2.ReqDeleteCustomizedContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_deleteContest, request, timeout)
+
+    async def prolongContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResProlongContest:
+        '''rpc prolongContest (ReqProlongContest) returns (ResProlongContest)'''
+        request = pb2.ReqProlongContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_prolongContest, request, timeout)
+
+    async def manageContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResManageContest:
+        '''rpc manageContest (ReqManageContest) returns (ResManageContest)'''
+        request = pb2.ReqManageContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_manageContest, request, timeout)
+
+    async def fetchContestInfo(self, *, timeout: Optional[float] = None) -> pb2.ResManageContest:
+        '''rpc fetchContestInfo (ReqCommon) returns (ResManageContest)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestInfo, None, timeout)
+
+    async def exitManageContest(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc exitManageContest (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_exitManageContest, None, timeout)
+
+    async def fetchContestGameRule(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestGameRule:
+        '''rpc fetchContestGameRule (ReqCommon) returns (ResFetchContestGameRule)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestGameRule, None, timeout)
+
+    async def updateContestGameRule(self, *, contest_name: str = '', start_time: int = 0, finish_time: int = 0, open: bool = False, rank_rule: int = 0, game_rule_setting: Optional[pb2.GameRuleSetting] = None, auto_match: bool = False, auto_disable_end_chat: bool = False, contest_type: int = 0, banned_zones: str = '', hidden_zones: str = '', emoji_switch: bool = False, player_roster_type: int = 0, disable_broadcast: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestGameRule (ReqUpdateContestGameRule) returns (ResCommon)'''
+        request = pb2.ReqUpdateContestGameRule(contest_name=contest_name, start_time=start_time, finish_time=finish_time, open=open, rank_rule=rank_rule, auto_match=auto_match, auto_disable_end_chat=auto_disable_end_chat, contest_type=contest_type, banned_zones=banned_zones, hidden_zones=hidden_zones, emoji_switch=emoji_switch, player_roster_type=player_roster_type, disable_broadcast=disable_broadcast)
+        if game_rule_setting is not None:
+            request.game_rule_setting.CopyFrom(game_rule_setting)
+        return await self._call(_CustomizedContestManagerApi_updateContestGameRule, request, timeout)
+
+    async def searchAccountByNickname(self, *, query_nicknames: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> pb2.ResSearchAccountByNickname:
+        '''rpc searchAccountByNickname (ReqSearchAccountByNickname) returns (ResSearchAccountByNickname)'''
+        request = pb2.ReqSearchAccountByNickname()
+        if query_nicknames is not None:
+            request.query_nicknames.extend(query_nicknames)
+        return await self._call(_CustomizedContestManagerApi_searchAccountByNickname, request, timeout)
+
+    async def searchAccountByEid(self, *, eids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResSearchAccountByEid:
+        '''rpc searchAccountByEid (ReqSearchAccountByEid) returns (ResSearchAccountByEid)'''
+        request = pb2.ReqSearchAccountByEid()
+        if eids is not None:
+            request.eids.extend(eids)
+        return await self._call(_CustomizedContestManagerApi_searchAccountByEid, request, timeout)
+
+    async def fetchContestPlayer(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestPlayer:
+        '''rpc fetchContestPlayer (ReqCommon) returns (ResFetchCustomizedContestPlayer)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestPlayer, None, timeout)
+
+    async def fetchContestMatchingPlayer(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestPlayer:
+        '''rpc fetchContestMatchingPlayer (ReqCommon) returns (ResFetchCustomizedContestPlayer)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestMatchingPlayer, None, timeout)
+
+    async def updateContestPlayer(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestPlayer (ReqUpdateCustomizedContestPlayer) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestPlayer(setting_type=setting_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateContestPlayer, request, timeout)
+
+    async def startManageGame(self, *, timeout: Optional[float] = None) -> pb2.ResStartManageGame:
+        '''rpc startManageGame (ReqCommon) returns (ResStartManageGame)'''
+        return await self._call(_CustomizedContestManagerApi_startManageGame, None, timeout)
+
+    async def stopManageGame(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc stopManageGame (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_stopManageGame, None, timeout)
+
+    async def lockGamePlayer(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc lockGamePlayer (ReqLockGamePlayer) returns (ResCommon)'''
+        request = pb2.ReqLockGamePlayer(account_id=account_id)
+        return await self._call(_CustomizedContestManagerApi_lockGamePlayer, request, timeout)
+
+    async def unlockGamePlayer(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc unlockGamePlayer (ReqUnlockGamePlayer) returns (ResCommon)'''
+        request = pb2.ReqUnlockGamePlayer(account_id=account_id)
+        return await self._call(_CustomizedContestManagerApi_unlockGamePlayer, request, timeout)
+
+    async def createContestGame(self, *, slots: Optional[Iterable[pb2.ReqCreateContestGame.Slot]] = None, tag: str = '', random_position: bool = False, open_live: bool = False, chat_broadcast_for_end: bool = False, ai_level: int = 0, timeout: Optional[float] = None) -> pb2.ResCreateContestGame:
+        '''rpc createContestGame (ReqCreateContestGame) returns (ResCreateContestGame)'''
+        request = pb2.ReqCreateContestGame(tag=tag, random_position=random_position, open_live=open_live, chat_broadcast_for_end=chat_broadcast_for_end, ai_level=ai_level)
+        if slots is not None:
+            request.slots.extend(slots)
+        return await self._call(_CustomizedContestManagerApi_createContestGame, request, timeout)
+
+    async def fetchContestGameRecords(self, *, last_index: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameRecordList:
+        '''rpc fetchContestGameRecords (ReqFetchCustomizedContestGameRecordList) returns (ResFetchCustomizedContestGameRecordList)'''
+        request = pb2.ReqFetchCustomizedContestGameRecordList(last_index=last_index)
+        return await self._call(_CustomizedContestManagerApi_fetchContestGameRecords, request, timeout)
+
+    async def removeContestGameRecord(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc removeContestGameRecord (ReqRemoveContestGameRecord) returns (ResCommon)'''
+        request = pb2.ReqRemoveContestGameRecord(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_removeContestGameRecord, request, timeout)
+
+    async def fetchContestNotice(self, *, notice_types: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchContestNotice:
+        '''rpc fetchContestNotice (ReqFetchContestNotice) returns (ResFetchContestNotice)'''
+        request = pb2.ReqFetchContestNotice()
+        if notice_types is not None:
+            request.notice_types.extend(notice_types)
+        return await self._call(_CustomizedContestManagerApi_fetchContestNotice, request, timeout)
+
+    async def updateContestNotice(self, *, notice_type: int = 0, content: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestNotice (ReqUpdateCustomizedContestNotice) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestNotice(notice_type=notice_type, content=content)
+        return await self._call(_CustomizedContestManagerApi_updateContestNotice, request, timeout)
+
+    async def fetchContestManager(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestManager:
+        '''rpc fetchContestManager (ReqCommon) returns (ResFetchCustomizedContestManager)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestManager, None, timeout)
+
+    async def updateContestManager(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestManager (ReqUpdateCustomizedContestManager) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestManager(setting_type=setting_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateContestManager, request, timeout)
+
+    async def fetchChatSetting(self, *, timeout: Optional[float] = None) -> pb2.ResCustomizedContestChatInfo:
+        '''rpc fetchChatSetting (ReqCommon) returns (ResCustomizedContestChatInfo)'''
+        return await self._call(_CustomizedContestManagerApi_fetchChatSetting, None, timeout)
+
+    async def updateChatSetting(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, chat_limit_type: int = 0, timeout: Optional[float] = None) -> pb2.ResUpdateCustomizedContestChatSetting:
+        '''rpc updateChatSetting (ReqUpdateCustomizedContestChatSetting) returns (ResUpdateCustomizedContestChatSetting)'''
+        request = pb2.ReqUpdateCustomizedContestChatSetting(setting_type=setting_type, chat_limit_type=chat_limit_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateChatSetting, request, timeout)
+
+    async def updateGameTag(self, *, uuid: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateGameTag (ReqUpdateGameTag) returns (ResCommon)'''
+        request = pb2.ReqUpdateGameTag(uuid=uuid, tag=tag)
+        return await self._call(_CustomizedContestManagerApi_updateGameTag, request, timeout)
+
+    async def terminateGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc terminateGame (ReqTerminateContestGame) returns (ResCommon)'''
+        request = pb2.ReqTerminateContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_terminateGame, request, timeout)
+
+    async def pauseGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc pauseGame (ReqPauseContestGame) returns (ResCommon)'''
+        request = pb2.ReqPauseContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_pauseGame, request, timeout)
+
+    async def resumeGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc resumeGame (ReqResumeContestGame) returns (ResCommon)'''
+        request = pb2.ReqResumeContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_resumeGame, request, timeout)
+
+    async def fetchCurrentRankList(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCurrentRankList:
+        '''rpc fetchCurrentRankList (ReqCommon) returns (ResFetchCurrentRankList)'''
+        return await self._call(_CustomizedContestManagerApi_fetchCurrentRankList, None, timeout)
+
+    async def fetchContestLastModify(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestLastModify:
+        '''rpc fetchContestLastModify (ReqCommon) returns (ResFetchContestLastModify)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestLastModify, None, timeout)
+
+    async def fetchContestObserver(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestObserver:
+        '''rpc fetchContestObserver (ReqCommon) returns (ResFetchContestObserver)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestObserver, None, timeout)
+
+    async def addContestObserver(self, *, observers: Optional[Iterable[pb2.ReqAddContestObserver.Observer]] = None, timeout: Optional[float] = None) -> pb2.ResAddContestObserver:
+        '''rpc addContestObserver (ReqAddContestObserver) returns (ResAddContestObserver)'''
+        request = pb2.ReqAddContestObserver()
+        if observers is not None:
+            request.observers.extend(observers)
+        return await self._call(_CustomizedContestManagerApi_addContestObserver, request, timeout)
+
+    async def removeContestObserver(self, *, observers: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc removeContestObserver (ReqRemoveContestObserver) returns (ResCommon)'''
+        request = pb2.ReqRemoveContestObserver()
+        if observers is not None:
+            request.observers.extend(observers)
+        return await self._call(_CustomizedContestManagerApi_removeContestObserver, request, timeout)
+
+    async def fetchContestChatHistory(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestChatHistory:
+        '''rpc fetchContestChatHistory (ReqCommon) returns (ResFetchContestChatHistory)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestChatHistory, None, timeout)
+
+    async def clearChatHistory(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc clearChatHistory (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_clearChatHistory, None, timeout)
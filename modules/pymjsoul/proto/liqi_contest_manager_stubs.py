@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from the contest_manager descriptor subset.  DO NOT EDIT!
+"""Typed async client stubs for the services in the contest_manager protocol subset."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from .liqi_subsets import load_protocol
+from ..registry import MethodEntry
+
+pb2 = load_protocol('contest_manager')
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+
+_CustomizedContestManagerApi_loginContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['loginContestManager'])
+_CustomizedContestManagerApi_oauth2AuthContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['oauth2AuthContestManager'])
+_CustomizedContestManagerApi_oauth2LoginContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['oauth2LoginContestManager'])
+_CustomizedContestManagerApi_logoutContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['logoutContestManager'])
+_CustomizedContestManagerApi_fetchRelatedContestList = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchRelatedContestList'])
+_CustomizedContestManagerApi_createContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['createContest'])
+_CustomizedContestManagerApi_deleteContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['deleteContest'])
+_CustomizedContestManagerApi_prolongContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['prolongContest'])
+_CustomizedContestManagerApi_manageContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['manageContest'])
+_CustomizedContestManagerApi_fetchContestInfo = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestInfo'])
+_CustomizedContestManagerApi_exitManageContest = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['exitManageContest'])
+_CustomizedContestManagerApi_fetchContestGameRule = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestGameRule'])
+_CustomizedContestManagerApi_updateContestGameRule = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestGameRule'])
+_CustomizedContestManagerApi_searchAccountByNickname = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['searchAccountByNickname'])
+_CustomizedContestManagerApi_searchAccountByEid = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['searchAccountByEid'])
+_CustomizedContestManagerApi_fetchContestPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestPlayer'])
+_CustomizedContestManagerApi_fetchContestMatchingPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestMatchingPlayer'])
+_CustomizedContestManagerApi_updateContestPlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestPlayer'])
+_CustomizedContestManagerApi_startManageGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['startManageGame'])
+_CustomizedContestManagerApi_stopManageGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['stopManageGame'])
+_CustomizedContestManagerApi_lockGamePlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['lockGamePlayer'])
+_CustomizedContestManagerApi_unlockGamePlayer = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['unlockGamePlayer'])
+_CustomizedContestManagerApi_createContestGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['createContestGame'])
+_CustomizedContestManagerApi_fetchContestGameRecords = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestGameRecords'])
+_CustomizedContestManagerApi_removeContestGameRecord = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['removeContestGameRecord'])
+_CustomizedContestManagerApi_fetchContestNotice = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestNotice'])
+_CustomizedContestManagerApi_updateContestNotice = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestNotice'])
+_CustomizedContestManagerApi_fetchContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestManager'])
+_CustomizedContestManagerApi_updateContestManager = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateContestManager'])
+_CustomizedContestManagerApi_fetchChatSetting = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchChatSetting'])
+_CustomizedContestManagerApi_updateChatSetting = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateChatSetting'])
+_CustomizedContestManagerApi_updateGameTag = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['updateGameTag'])
+_CustomizedContestManagerApi_terminateGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['terminateGame'])
+_CustomizedContestManagerApi_pauseGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['pauseGame'])
+_CustomizedContestManagerApi_resumeGame = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['resumeGame'])
+_CustomizedContestManagerApi_fetchCurrentRankList = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchCurrentRankList'])
+_CustomizedContestManagerApi_fetchContestLastModify = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestLastModify'])
+_CustomizedContestManagerApi_fetchContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestObserver'])
+_CustomizedContestManagerApi_addContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['addContestObserver'])
+_CustomizedContestManagerApi_removeContestObserver = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['removeContestObserver'])
+_CustomizedContestManagerApi_fetchContestChatHistory = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['fetchContestChatHistory'])
+_CustomizedContestManagerApi_clearChatHistory = MethodEntry(_SERVICES['CustomizedContestManagerApi'].methods_by_name['clearChatHistory'])
+
+class CustomizedContestManagerApiStub():
+    '''
+    rpc methods of `lq.CustomizedContestManagerApi`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def loginContestManager(self, *, account: str = '', password: str = '', gen_access_token: bool = False, type: int = 0, timeout: Optional[float] = None) -> pb2.ResContestManageLogin:
+        '''rpc loginContestManager (ReqContestManageLogin) returns (ResContestManageLogin)'''
+        request = pb2.ReqContestManageLogin(account=account, password=password, gen_access_token=gen_access_token, type=type)
+        return await self._call(_CustomizedContestManagerApi_loginContestManager, request, timeout)
+
+    async def oauth2AuthContestManager(self, *, type: int = 0, code: str = '', uid: str = '', timeout: Optional[float] = None) -> pb2.ResContestManageOauth2Auth:
+        '''rpc oauth2AuthContestManager (ReqContestManageOauth2Auth) returns (ResContestManageOauth2Auth)'''
+        request = pb2.ReqContestManageOauth2Auth(type=type, code=code, uid=uid)
+        return await self._call(_CustomizedContestManagerApi_oauth2AuthContestManager, request, timeout)
+
+    async def oauth2LoginContestManager(self, *, type: int = 0, access_token: str = '', reconnect: bool = False, timeout: Optional[float] = None) -> pb2.ResContestManageOauth2Login:
+        '''rpc oauth2LoginContestManager (ReqContestManageOauth2Login) returns (ResContestManageOauth2Login)'''
+        request = pb2.ReqContestManageOauth2Login(type=type, access_token=access_token, reconnect=reconnect)
+        return await self._call(_CustomizedContestManagerApi_oauth2LoginContestManager, request, timeout)
+
+    async def logoutContestManager(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc logoutContestManager (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_logoutContestManager, None, timeout)
+
+    async def fetchRelatedContestList(self, *, timeout: Optional[float] = None) -> pb2.ResFetchRelatedContestList:
+        '''rpc fetchRelatedContestList (ReqCommon) returns (ResFetchRelatedContestList)'''
+        return await self._call(_CustomizedContestManagerApi_fetchRelatedContestList, None, timeout)
+
+    async def createContest(self, *, contest_name: str = '', start_time: int = 0, finish_time: int = 0, open: bool = False, rank_rule: int = 0, game_rule_setting: Optional[pb2.GameRuleSetting] = None, timeout: Optional[float] = None) -> pb2.ResCreateCustomizedContest:
+        '''rpc createContest (ReqCreateCustomizedContest) returns (ResCreateCustomizedContest)'''
+        request = pb2.ReqCreateCustomizedContest(contest_name=contest_name, start_time=start_time, finish_time=finish_time, open=open, rank_rule=rank_rule)
+        if game_rule_setting is not None:
+            request.game_rule_setting.CopyFrom(game_rule_setting)
+        return await self._call(_CustomizedContestManagerApi_createContest, request, timeout)
+
+    async def deleteContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc deleteContest (ReqDeleteCustomizedContest) returns (ResCommon)'''
+        request = pb2.ReqDeleteCustomizedContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_deleteContest, request, timeout)
+
+    async def prolongContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResProlongContest:
+        '''rpc prolongContest (ReqProlongContest) returns (ResProlongContest)'''
+        request = pb2.ReqProlongContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_prolongContest, request, timeout)
+
+    async def manageContest(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResManageContest:
+        '''rpc manageContest (ReqManageContest) returns (ResManageContest)'''
+        request = pb2.ReqManageContest(unique_id=unique_id)
+        return await self._call(_CustomizedContestManagerApi_manageContest, request, timeout)
+
+    async def fetchContestInfo(self, *, timeout: Optional[float] = None) -> pb2.ResManageContest:
+        '''rpc fetchContestInfo (ReqCommon) returns (ResManageContest)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestInfo, None, timeout)
+
+    async def exitManageContest(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc exitManageContest (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_exitManageContest, None, timeout)
+
+    async def fetchContestGameRule(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestGameRule:
+        '''rpc fetchContestGameRule (ReqCommon) returns (ResFetchContestGameRule)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestGameRule, None, timeout)
+
+    async def updateContestGameRule(self, *, contest_name: str = '', start_time: int = 0, finish_time: int = 0, open: bool = False, rank_rule: int = 0, game_rule_setting: Optional[pb2.GameRuleSetting] = None, auto_match: bool = False, auto_disable_end_chat: bool = False, contest_type: int = 0, banned_zones: str = '', hidden_zones: str = '', emoji_switch: bool = False, player_roster_type: int = 0, disable_broadcast: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestGameRule (ReqUpdateContestGameRule) returns (ResCommon)'''
+        request = pb2.ReqUpdateContestGameRule(contest_name=contest_name, start_time=start_time, finish_time=finish_time, open=open, rank_rule=rank_rule, auto_match=auto_match, auto_disable_end_chat=auto_disable_end_chat, contest_type=contest_type, banned_zones=banned_zones, hidden_zones=hidden_zones, emoji_switch=emoji_switch, player_roster_type=player_roster_type, disable_broadcast=disable_broadcast)
+        if game_rule_setting is not None:
+            request.game_rule_setting.CopyFrom(game_rule_setting)
+        return await self._call(_CustomizedContestManagerApi_updateContestGameRule, request, timeout)
+
+    async def searchAccountByNickname(self, *, query_nicknames: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> pb2.ResSearchAccountByNickname:
+        '''rpc searchAccountByNickname (ReqSearchAccountByNickname) returns (ResSearchAccountByNickname)'''
+        request = pb2.ReqSearchAccountByNickname()
+        if query_nicknames is not None:
+            request.query_nicknames.extend(query_nicknames)
+        return await self._call(_CustomizedContestManagerApi_searchAccountByNickname, request, timeout)
+
+    async def searchAccountByEid(self, *, eids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResSearchAccountByEid:
+        '''rpc searchAccountByEid (ReqSearchAccountByEid) returns (ResSearchAccountByEid)'''
+        request = pb2.ReqSearchAccountByEid()
+        if eids is not None:
+            request.eids.extend(eids)
+        return await self._call(_CustomizedContestManagerApi_searchAccountByEid, request, timeout)
+
+    async def fetchContestPlayer(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestPlayer:
+        '''rpc fetchContestPlayer (ReqCommon) returns (ResFetchCustomizedContestPlayer)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestPlayer, None, timeout)
+
+    async def fetchContestMatchingPlayer(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestPlayer:
+        '''rpc fetchContestMatchingPlayer (ReqCommon) returns (ResFetchCustomizedContestPlayer)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestMatchingPlayer, None, timeout)
+
+    async def updateContestPlayer(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestPlayer (ReqUpdateCustomizedContestPlayer) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestPlayer(setting_type=setting_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateContestPlayer, request, timeout)
+
+    async def startManageGame(self, *, timeout: Optional[float] = None) -> pb2.ResStartManageGame:
+        '''rpc startManageGame (ReqCommon) returns (ResStartManageGame)'''
+        return await self._call(_CustomizedContestManagerApi_startManageGame, None, timeout)
+
+    async def stopManageGame(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc stopManageGame (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_stopManageGame, None, timeout)
+
+    async def lockGamePlayer(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc lockGamePlayer (ReqLockGamePlayer) returns (ResCommon)'''
+        request = pb2.ReqLockGamePlayer(account_id=account_id)
+        return await self._call(_CustomizedContestManagerApi_lockGamePlayer, request, timeout)
+
+    async def unlockGamePlayer(self, *, account_id: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc unlockGamePlayer (ReqUnlockGamePlayer) returns (ResCommon)'''
+        request = pb2.ReqUnlockGamePlayer(account_id=account_id)
+        return await self._call(_CustomizedContestManagerApi_unlockGamePlayer, request, timeout)
+
+    async def createContestGame(self, *, slots: Optional[Iterable[pb2.ReqCreateContestGame.Slot]] = None, tag: str = '', random_position: bool = False, open_live: bool = False, chat_broadcast_for_end: bool = False, ai_level: int = 0, timeout: Optional[float] = None) -> pb2.ResCreateContestGame:
+        '''rpc createContestGame (ReqCreateContestGame) returns (ResCreateContestGame)'''
+        request = pb2.ReqCreateContestGame(tag=tag, random_position=random_position, open_live=open_live, chat_broadcast_for_end=chat_broadcast_for_end, ai_level=ai_level)
+        if slots is not None:
+            request.slots.extend(slots)
+        return await self._call(_CustomizedContestManagerApi_createContestGame, request, timeout)
+
+    async def fetchContestGameRecords(self, *, last_index: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameRecordList:
+        '''rpc fetchContestGameRecords (ReqFetchCustomizedContestGameRecordList) returns (ResFetchCustomizedContestGameRecordList)'''
+        request = pb2.ReqFetchCustomizedContestGameRecordList(last_index=last_index)
+        return await self._call(_CustomizedContestManagerApi_fetchContestGameRecords, request, timeout)
+
+    async def removeContestGameRecord(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc removeContestGameRecord (ReqRemoveContestGameRecord) returns (ResCommon)'''
+        request = pb2.ReqRemoveContestGameRecord(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_removeContestGameRecord, request, timeout)
+
+    async def fetchContestNotice(self, *, notice_types: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResFetchContestNotice:
+        '''rpc fetchContestNotice (ReqFetchContestNotice) returns (ResFetchContestNotice)'''
+        request = pb2.ReqFetchContestNotice()
+        if notice_types is not None:
+            request.notice_types.extend(notice_types)
+        return await self._call(_CustomizedContestManagerApi_fetchContestNotice, request, timeout)
+
+    async def updateContestNotice(self, *, notice_type: int = 0, content: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestNotice (ReqUpdateCustomizedContestNotice) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestNotice(notice_type=notice_type, content=content)
+        return await self._call(_CustomizedContestManagerApi_updateContestNotice, request, timeout)
+
+    async def fetchContestManager(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestManager:
+        '''rpc fetchContestManager (ReqCommon) returns (ResFetchCustomizedContestManager)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestManager, None, timeout)
+
+    async def updateContestManager(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateContestManager (ReqUpdateCustomizedContestManager) returns (ResCommon)'''
+        request = pb2.ReqUpdateCustomizedContestManager(setting_type=setting_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateContestManager, request, timeout)
+
+    async def fetchChatSetting(self, *, timeout: Optional[float] = None) -> pb2.ResCustomizedContestChatInfo:
+        '''rpc fetchChatSetting (ReqCommon) returns (ResCustomizedContestChatInfo)'''
+        return await self._call(_CustomizedContestManagerApi_fetchChatSetting, None, timeout)
+
+    async def updateChatSetting(self, *, setting_type: int = 0, nicknames: Optional[Iterable[str]] = None, account_ids: Optional[Iterable[int]] = None, chat_limit_type: int = 0, timeout: Optional[float] = None) -> pb2.ResUpdateCustomizedContestChatSetting:
+        '''rpc updateChatSetting (ReqUpdateCustomizedContestChatSetting) returns (ResUpdateCustomizedContestChatSetting)'''
+        request = pb2.ReqUpdateCustomizedContestChatSetting(setting_type=setting_type, chat_limit_type=chat_limit_type)
+        if nicknames is not None:
+            request.nicknames.extend(nicknames)
+        if account_ids is not None:
+            request.account_ids.extend(account_ids)
+        return await self._call(_CustomizedContestManagerApi_updateChatSetting, request, timeout)
+
+    async def updateGameTag(self, *, uuid: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc updateGameTag (ReqUpdateGameTag) returns (ResCommon)'''
+        request = pb2.ReqUpdateGameTag(uuid=uuid, tag=tag)
+        return await self._call(_CustomizedContestManagerApi_updateGameTag, request, timeout)
+
+    async def terminateGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc terminateGame (ReqTerminateContestGame) returns (ResCommon)'''
+        request = pb2.ReqTerminateContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_terminateGame, request, timeout)
+
+    async def pauseGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc pauseGame (ReqPauseContestGame) returns (ResCommon)'''
+        request = pb2.ReqPauseContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_pauseGame, request, timeout)
+
+    async def resumeGame(self, *, uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc resumeGame (ReqResumeContestGame) returns (ResCommon)'''
+        request = pb2.ReqResumeContestGame(uuid=uuid)
+        return await self._call(_CustomizedContestManagerApi_resumeGame, request, timeout)
+
+    async def fetchCurrentRankList(self, *, timeout: Optional[float] = None) -> pb2.ResFetchCurrentRankList:
+        '''rpc fetchCurrentRankList (ReqCommon) returns (ResFetchCurrentRankList)'''
+        return await self._call(_CustomizedContestManagerApi_fetchCurrentRankList, None, timeout)
+
+    async def fetchContestLastModify(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestLastModify:
+        '''rpc fetchContestLastModify (ReqCommon) returns (ResFetchContestLastModify)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestLastModify, None, timeout)
+
+    async def fetchContestObserver(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestObserver:
+        '''rpc fetchContestObserver (ReqCommon) returns (ResFetchContestObserver)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestObserver, None, timeout)
+
+    async def addContestObserver(self, *, observers: Optional[Iterable[pb2.ReqAddContestObserver.Observer]] = None, timeout: Optional[float] = None) -> pb2.ResAddContestObserver:
+        '''rpc addContestObserver (ReqAddContestObserver) returns (ResAddContestObserver)'''
+        request = pb2.ReqAddContestObserver()
+        if observers is not None:
+            request.observers.extend(observers)
+        return await self._call(_CustomizedContestManagerApi_addContestObserver, request, timeout)
+
+    async def removeContestObserver(self, *, observers: Optional[Iterable[int]] = None, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc removeContestObserver (ReqRemoveContestObserver) returns (ResCommon)'''
+        request = pb2.ReqRemoveContestObserver()
+        if observers is not None:
+            request.observers.extend(observers)
+        return await self._call(_CustomizedContestManagerApi_removeContestObserver, request, timeout)
+
+    async def fetchContestChatHistory(self, *, timeout: Optional[float] = None) -> pb2.ResFetchContestChatHistory:
+        '''rpc fetchContestChatHistory (ReqCommon) returns (ResFetchContestChatHistory)'''
+        return await self._call(_CustomizedContestManagerApi_fetchContestChatHistory, None, timeout)
+
+    async def clearChatHistory(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc clearChatHistory (ReqCommon) returns (ResCommon)'''
+        return await self._call(_CustomizedContestManagerApi_clearChatHistory, None, timeout)
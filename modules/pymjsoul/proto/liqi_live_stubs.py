@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from the live descriptor subset.  DO NOT EDIT!
+"""Typed async client stubs for the services in the live protocol subset."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from .liqi_subsets import load_protocol
+from ..registry import MethodEntry
+
+pb2 = load_protocol('live')
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+
+_Lobby_login = MethodEntry(_SERVICES['Lobby'].methods_by_name['login'])
+_Lobby_oauth2Auth = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Auth'])
+_Lobby_oauth2Check = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Check'])
+_Lobby_oauth2Login = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Login'])
+_Lobby_logout = MethodEntry(_SERVICES['Lobby'].methods_by_name['logout'])
+_Lobby_heatbeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['heatbeat'])
+_Lobby_loginBeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['loginBeat'])
+_Lobby_fetchGameLiveInfo = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveInfo'])
+_Lobby_fetchGameLiveLeftSegment = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveLeftSegment'])
+_Lobby_fetchGameLiveList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameLiveList'])
+_Lobby_fetchCustomizedContestGameLiveList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestGameLiveList'])
+_Lobby_createGameObserveAuth = MethodEntry(_SERVICES['Lobby'].methods_by_name['createGameObserveAuth'])
+_Lobby_refreshGameObserveAuth = MethodEntry(_SERVICES['Lobby'].methods_by_name['refreshGameObserveAuth'])
+
+class LobbyStub():
+    '''
+    rpc methods of `lq.Lobby`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def login(self, *, account: str = '', password: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, type: int = 0, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc login (ReqLogin) returns (ResLogin)'''
+        request = pb2.ReqLogin(account=account, password=password, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, type=type, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_login, request, timeout)
+
+    async def oauth2Auth(self, *, type: int = 0, code: str = '', uid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Auth:
+        '''rpc oauth2Auth (ReqOauth2Auth) returns (ResOauth2Auth)'''
+        request = pb2.ReqOauth2Auth(type=type, code=code, uid=uid, client_version_string=client_version_string)
+        return await self._call(_Lobby_oauth2Auth, request, timeout)
+
+    async def oauth2Check(self, *, type: int = 0, access_token: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Check:
+        '''rpc oauth2Check (ReqOauth2Check) returns (ResOauth2Check)'''
+        request = pb2.ReqOauth2Check(type=type, access_token=access_token)
+        return await self._call(_Lobby_oauth2Check, request, timeout)
+
+    async def oauth2Login(self, *, type: int = 0, access_token: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc oauth2Login (ReqOauth2Login) returns (ResLogin)'''
+        request = pb2.ReqOauth2Login(type=type, access_token=access_token, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_oauth2Login, request, timeout)
+
+    async def logout(self, *, timeout: Optional[float] = None) -> pb2.ResLogout:
+        '''rpc logout (ReqLogout) returns (ResLogout)'''
+        return await self._call(_Lobby_logout, None, timeout)
+
+    async def heatbeat(self, *, no_operation_counter: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc heatbeat (ReqHeatBeat) returns (ResCommon)'''
+        request = pb2.ReqHeatBeat(no_operation_counter=no_operation_counter)
+        return await self._call(_Lobby_heatbeat, request, timeout)
+
+    async def loginBeat(self, *, contract: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc loginBeat (ReqLoginBeat) returns (ResCommon)'''
+        request = pb2.ReqLoginBeat(contract=contract)
+        return await self._call(_Lobby_loginBeat, request, timeout)
+
+    async def fetchGameLiveInfo(self, *, game_uuid: str = '', timeout: Optional[float] = None) -> pb2.ResGameLiveInfo:
+        '''rpc fetchGameLiveInfo (ReqGameLiveInfo) returns (ResGameLiveInfo)'''
+        request = pb2.ReqGameLiveInfo(game_uuid=game_uuid)
+        return await self._call(_Lobby_fetchGameLiveInfo, request, timeout)
+
+    async def fetchGameLiveLeftSegment(self, *, game_uuid: str = '', last_segment_id: int = 0, timeout: Optional[float] = None) -> pb2.ResGameLiveLeftSegment:
+        '''rpc fetchGameLiveLeftSegment (ReqGameLiveLeftSegment) returns (ResGameLiveLeftSegment)'''
+        request = pb2.ReqGameLiveLeftSegment(game_uuid=game_uuid, last_segment_id=last_segment_id)
+        return await self._call(_Lobby_fetchGameLiveLeftSegment, request, timeout)
+
+    async def fetchGameLiveList(self, *, filter_id: int = 0, timeout: Optional[float] = None) -> pb2.ResGameLiveList:
+        '''rpc fetchGameLiveList (ReqGameLiveList) returns (ResGameLiveList)'''
+        request = pb2.ReqGameLiveList(filter_id=filter_id)
+        return await self._call(_Lobby_fetchGameLiveList, request, timeout)
+
+    async def fetchCustomizedContestGameLiveList(self, *, unique_id: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameLiveList:
+        '''rpc fetchCustomizedContestGameLiveList (ReqFetchCustomizedContestGameLiveList) returns (ResFetchCustomizedContestGameLiveList)'''
+        request = pb2.ReqFetchCustomizedContestGameLiveList(unique_id=unique_id)
+        return await self._call(_Lobby_fetchCustomizedContestGameLiveList, request, timeout)
+
+    async def createGameObserveAuth(self, *, game_uuid: str = '', timeout: Optional[float] = None) -> pb2.ResCreateGameObserveAuth:
+        '''rpc createGameObserveAuth (ReqCreateGameObserveAuth) returns (ResCreateGameObserveAuth)'''
+        request = pb2.ReqCreateGameObserveAuth(game_uuid=game_uuid)
+        return await self._call(_Lobby_createGameObserveAuth, request, timeout)
+
+    async def refreshGameObserveAuth(self, *, token: str = '', timeout: Optional[float] = None) -> pb2.ResRefreshGameObserveAuth:
+        '''rpc refreshGameObserveAuth (ReqRefreshGameObserveAuth) returns (ResRefreshGameObserveAuth)'''
+        request = pb2.ReqRefreshGameObserveAuth(token=token)
+        return await self._call(_Lobby_refreshGameObserveAuth, request, timeout)
+
+_FastTest_authObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['authObserve'])
+_FastTest_startObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['startObserve'])
+_FastTest_stopObserve = MethodEntry(_SERVICES['FastTest'].methods_by_name['stopObserve'])
+
+class FastTestStub():
+    '''
+    rpc methods of `lq.FastTest`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def authObserve(self, *, token: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc authObserve (ReqAuthObserve) returns (ResCommon)'''
+        request = pb2.ReqAuthObserve(token=token)
+        return await self._call(_FastTest_authObserve, request, timeout)
+
+    async def startObserve(self, *, timeout: Optional[float] = None) -> pb2.ResStartObserve:
+        '''rpc startObserve (ReqCommon) returns (ResStartObserve)'''
+        return await self._call(_FastTest_startObserve, None, timeout)
+
+    async def stopObserve(self, *, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc stopObserve (ReqCommon) returns (ResCommon)'''
+        return await self._call(_FastTest_stopObserve, None, timeout)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Generated by generate_stubs.py from the lobby_records descriptor subset.  DO NOT EDIT!
+"""Typed async client stubs for the services in the lobby_records protocol subset."""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from .liqi_subsets import load_protocol
+from ..registry import MethodEntry
+
+pb2 = load_protocol('lobby_records')
+_SERVICES = pb2.DESCRIPTOR.services_by_name
+
+_Lobby_login = MethodEntry(_SERVICES['Lobby'].methods_by_name['login'])
+_Lobby_oauth2Auth = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Auth'])
+_Lobby_oauth2Check = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Check'])
+_Lobby_oauth2Login = MethodEntry(_SERVICES['Lobby'].methods_by_name['oauth2Login'])
+_Lobby_logout = MethodEntry(_SERVICES['Lobby'].methods_by_name['logout'])
+_Lobby_heatbeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['heatbeat'])
+_Lobby_loginBeat = MethodEntry(_SERVICES['Lobby'].methods_by_name['loginBeat'])
+_Lobby_fetchGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecord'])
+_Lobby_readGameRecord = MethodEntry(_SERVICES['Lobby'].methods_by_name['readGameRecord'])
+_Lobby_fetchGameRecordList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecordList'])
+_Lobby_fetchCollectedGameRecordList = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCollectedGameRecordList'])
+_Lobby_fetchGameRecordsDetail = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchGameRecordsDetail'])
+_Lobby_fetchCustomizedContestGameRecords = MethodEntry(_SERVICES['Lobby'].methods_by_name['fetchCustomizedContestGameRecords'])
+
+class LobbyStub():
+    '''
+    rpc methods of `lq.Lobby`. Every call goes through `call_method(method, request, timeout)`,
+    by default `channel.call_method` (see `MajsoulChannel.call_method`).
+    '''
+    def __init__(self, channel, call_method=None):
+        self._call = call_method or channel.call_method
+
+    async def login(self, *, account: str = '', password: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, type: int = 0, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc login (ReqLogin) returns (ResLogin)'''
+        request = pb2.ReqLogin(account=account, password=password, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, type=type, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_login, request, timeout)
+
+    async def oauth2Auth(self, *, type: int = 0, code: str = '', uid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Auth:
+        '''rpc oauth2Auth (ReqOauth2Auth) returns (ResOauth2Auth)'''
+        request = pb2.ReqOauth2Auth(type=type, code=code, uid=uid, client_version_string=client_version_string)
+        return await self._call(_Lobby_oauth2Auth, request, timeout)
+
+    async def oauth2Check(self, *, type: int = 0, access_token: str = '', timeout: Optional[float] = None) -> pb2.ResOauth2Check:
+        '''rpc oauth2Check (ReqOauth2Check) returns (ResOauth2Check)'''
+        request = pb2.ReqOauth2Check(type=type, access_token=access_token)
+        return await self._call(_Lobby_oauth2Check, request, timeout)
+
+    async def oauth2Login(self, *, type: int = 0, access_token: str = '', reconnect: bool = False, device: Optional[pb2.ClientDeviceInfo] = None, random_key: str = '', client_version: Optional[pb2.ClientVersionInfo] = None, gen_access_token: bool = False, currency_platforms: Optional[Iterable[int]] = None, version: int = 0, client_version_string: str = '', tag: str = '', timeout: Optional[float] = None) -> pb2.ResLogin:
+        '''rpc oauth2Login (ReqOauth2Login) returns (ResLogin)'''
+        request = pb2.ReqOauth2Login(type=type, access_token=access_token, reconnect=reconnect, random_key=random_key, gen_access_token=gen_access_token, version=version, client_version_string=client_version_string, tag=tag)
+        if device is not None:
+            request.device.CopyFrom(device)
+        if client_version is not None:
+            request.client_version.CopyFrom(client_version)
+        if currency_platforms is not None:
+            request.currency_platforms.extend(currency_platforms)
+        return await self._call(_Lobby_oauth2Login, request, timeout)
+
+    async def logout(self, *, timeout: Optional[float] = None) -> pb2.ResLogout:
+        '''rpc logout (ReqLogout) returns (ResLogout)'''
+        return await self._call(_Lobby_logout, None, timeout)
+
+    async def heatbeat(self, *, no_operation_counter: int = 0, timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc heatbeat (ReqHeatBeat) returns (ResCommon)'''
+        request = pb2.ReqHeatBeat(no_operation_counter=no_operation_counter)
+        return await self._call(_Lobby_heatbeat, request, timeout)
+
+    async def loginBeat(self, *, contract: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc loginBeat (ReqLoginBeat) returns (ResCommon)'''
+        request = pb2.ReqLoginBeat(contract=contract)
+        return await self._call(_Lobby_loginBeat, request, timeout)
+
+    async def fetchGameRecord(self, *, game_uuid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResGameRecord:
+        '''rpc fetchGameRecord (ReqGameRecord) returns (ResGameRecord)'''
+        request = pb2.ReqGameRecord(game_uuid=game_uuid, client_version_string=client_version_string)
+        return await self._call(_Lobby_fetchGameRecord, request, timeout)
+
+    async def readGameRecord(self, *, game_uuid: str = '', client_version_string: str = '', timeout: Optional[float] = None) -> pb2.ResCommon:
+        '''rpc readGameRecord (ReqGameRecord) returns (ResCommon)'''
+        request = pb2.ReqGameRecord(game_uuid=game_uuid, client_version_string=client_version_string)
+        return await self._call(_Lobby_readGameRecord, request, timeout)
+
+    async def fetchGameRecordList(self, *, start: int = 0, count: int = 0, type: int = 0, timeout: Optional[float] = None) -> pb2.ResGameRecordList:
+        '''rpc fetchGameRecordList (ReqGameRecordList) returns (ResGameRecordList)'''
+        request = pb2.ReqGameRecordList(start=start, count=count, type=type)
+        return await self._call(_Lobby_fetchGameRecordList, request, timeout)
+
+    async def fetchCollectedGameRecordList(self, *, timeout: Optional[float] = None) -> pb2.ResCollectedGameRecordList:
+        '''rpc fetchCollectedGameRecordList (ReqCommon) returns (ResCollectedGameRecordList)'''
+        return await self._call(_Lobby_fetchCollectedGameRecordList, None, timeout)
+
+    async def fetchGameRecordsDetail(self, *, uuid_list: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> pb2.ResGameRecordsDetail:
+        '''rpc fetchGameRecordsDetail (ReqGameRecordsDetail) returns (ResGameRecordsDetail)'''
+        request = pb2.ReqGameRecordsDetail()
+        if uuid_list is not None:
+            request.uuid_list.extend(uuid_list)
+        return await self._call(_Lobby_fetchGameRecordsDetail, request, timeout)
+
+    async def fetchCustomizedContestGameRecords(self, *, unique_id: int = 0, last_index: int = 0, timeout: Optional[float] = None) -> pb2.ResFetchCustomizedContestGameRecords:
+        '''rpc fetchCustomizedContestGameRecords (ReqFetchCustomizedContestGameRecords) returns (ResFetchCustomizedContestGameRecords)'''
+        request = pb2.ReqFetchCustomizedContestGameRecords(unique_id=unique_id, last_index=last_index)
+        return await self._call(_Lobby_fetchCustomizedContestGameRecords, request, timeout)
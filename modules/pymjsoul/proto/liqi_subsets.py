@@ -0,0 +1,70 @@
+'''
+Loads the per-service descriptor subsets written by `split_protocol.py` instead of the
+whole `liqi_combined_pb2`:
+
+    pb2 = load_protocol('contest_manager')
+    channel = MajsoulChannel(pb2)
+
+The result works like `liqi_combined_pb2` (`pb2.DESCRIPTOR`, `pb2.Wrapper`,
+`pb2.ReqCreateContestGame.Slot`, ...) but only has the messages and rpc methods of the
+given subsets and core. The subsets are merged into one file, in a descriptor pool of
+their own, so that they don't collide with `liqi_combined_pb2` (or another combination)
+in the same process; the same combination is only loaded once.
+'''
+import types
+from os.path import join, dirname
+
+from google.protobuf import descriptor_pb2, descriptor_pool
+from google.protobuf.internal import builder
+
+DESCRIPTORS_DIR = join(dirname(__file__), "descriptors")
+
+SUBSETS = ('core', 'contest_manager', 'lobby_records', 'live')
+
+# tuple of subsets -> module
+_loaded = {}
+
+def _merge(subsets):
+    merged = descriptor_pb2.FileDescriptorProto(name=f"liqi_{'_'.join(subsets)}.proto")
+    # service name -> ServiceDescriptorProto; `Lobby` is in several subsets
+    services = {}
+
+    for subset in subsets:
+        with open(join(DESCRIPTORS_DIR, f"{subset}.pb"), "rb") as f:
+            part = descriptor_pb2.FileDescriptorProto.FromString(f.read())
+
+        merged.package = part.package
+        merged.syntax = part.syntax
+        merged.message_type.extend(part.message_type)
+        merged.enum_type.extend(part.enum_type)
+
+        for service in part.service:
+            target = services.get(service.name)
+            if target is None:
+                target = services[service.name] = merged.service.add(name=service.name, options=service.options)
+            known = {method.name for method in target.method}
+            target.method.extend(method for method in service.method if method.name not in known)
+
+    return merged
+
+def load_protocol(*subsets):
+    '''
+    The messages and services of `subsets` (see `SUBSETS`; core is always included),
+    as a module.
+    '''
+    for subset in subsets:
+        if subset not in SUBSETS:
+            raise ValueError(f"Unknown protocol subset {subset!r}; expected one of {SUBSETS}")
+    subsets = tuple(subset for subset in SUBSETS if subset == 'core' or subset in subsets)
+
+    module = _loaded.get(subsets)
+    if module is not None:
+        return module
+
+    module = types.ModuleType(f"{__name__}.{'_'.join(subsets)}")
+    module.DESCRIPTOR = descriptor_pool.DescriptorPool().AddSerializedFile(_merge(subsets).SerializeToString())
+    builder.BuildMessageAndEnumDescriptors(module.DESCRIPTOR, module.__dict__)
+    builder.BuildTopDescriptorsAndMessages(module.DESCRIPTOR, module.__name__, module.__dict__)
+
+    _loaded[subsets] = module
+    return module
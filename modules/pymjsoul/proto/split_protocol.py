@@ -0,0 +1,144 @@
+'''
+Splits `liqi_combined_pb2` into per-service descriptor subsets (`descriptors/<subset>.pb`,
+serialized `FileDescriptorProto`s), so that a client only registers the few dozen
+messages it uses instead of all ~700 (see `liqi_subsets.load_protocol()`):
+
+- contest_manager: `CustomizedContestManagerApi` and the contest notifications;
+- lobby_records: logging in to the `Lobby` and fetching game records (and the
+  `Record*` messages inside them);
+- live: spectating (`Lobby` live lists, `FastTest` observing, the `Action*` messages);
+- core: `Wrapper`, `Error`, ... and every message used by more than one subset.
+
+Every subset is closed over its references together with core, so any combination
+of subsets can be loaded.
+
+Usage (run from this directory after regenerating `liqi_combined_pb2.py`):
+    python3 split_protocol.py
+'''
+import os
+from os.path import join, dirname
+
+from google.protobuf import descriptor_pb2
+
+import liqi_combined_pb2
+
+CURR_DIR = dirname(__file__)
+OUTPUT_DIR = join(CURR_DIR, "descriptors")
+
+# methods every lobby client needs to log in and stay logged in
+LOBBY_SESSION_METHODS = ['login', 'oauth2Auth', 'oauth2Check', 'oauth2Login', 'logout', 'heatbeat', 'loginBeat']
+
+CORE_MESSAGES = ['Wrapper', 'Error', 'ReqCommon', 'ResCommon']
+
+# subset -> ({service: [method, ...] or None for all of them}, [top-level message or prefix*, ...])
+SUBSETS = {
+    'contest_manager': (
+        {'CustomizedContestManagerApi': None},
+        ['NotifyContest*', 'NotifyCustomContest*'],
+    ),
+    'lobby_records': (
+        {'Lobby': LOBBY_SESSION_METHODS + [
+            'fetchGameRecord', 'readGameRecord', 'fetchGameRecordList', 'fetchCollectedGameRecordList',
+            'fetchGameRecordsDetail', 'fetchCustomizedContestGameRecords']},
+        ['GameDetailRecords', 'Record*'],
+    ),
+    'live': (
+        {'Lobby': LOBBY_SESSION_METHODS + [
+            'fetchGameLiveInfo', 'fetchGameLiveLeftSegment', 'fetchGameLiveList',
+            'fetchCustomizedContestGameLiveList', 'createGameObserveAuth', 'refreshGameObserveAuth'],
+         'FastTest': ['authObserve', 'startObserve', 'stopObserve']},
+        ['NotifyObserveData', 'GameLive*', 'Action*'],
+    ),
+}
+
+def top_level_name(typeName, package):
+    '''
+    ".lq.ReqCreateContestGame.Slot" -> "ReqCreateContestGame"
+    '''
+    return typeName[len(package) + 2:].split('.')[0]
+
+def message_references(message, package):
+    for field in message.field:
+        if field.type_name:
+            yield top_level_name(field.type_name, package)
+    for nested in message.nested_type:
+        yield from message_references(nested, package)
+
+def closure(roots, types, package):
+    seen = set()
+    pending = list(roots)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if isinstance(types[name], descriptor_pb2.DescriptorProto):
+            pending.extend(message_references(types[name], package))
+    return seen
+
+def matching(patterns, names):
+    for pattern in patterns:
+        if pattern.endswith('*'):
+            yield from (name for name in names if name.startswith(pattern[:-1]))
+        else:
+            yield pattern
+
+def selected_services(combined, serviceMethods):
+    services = []
+    for service in combined.service:
+        if service.name not in serviceMethods:
+            continue
+        methodNames = serviceMethods[service.name]
+        subset = descriptor_pb2.ServiceDescriptorProto(name=service.name, options=service.options)
+        subset.method.extend(m for m in service.method if methodNames is None or m.name in methodNames)
+        services.append(subset)
+    return services
+
+def split(combined):
+    '''
+    {subset: FileDescriptorProto}, core included.
+    '''
+    package = combined.package
+    types = {m.name: m for m in combined.message_type}
+    types.update({e.name: e for e in combined.enum_type})
+
+    services = {}
+    closures = {}
+    for subset, (serviceMethods, messages) in SUBSETS.items():
+        services[subset] = selected_services(combined, serviceMethods)
+        roots = list(matching(messages, types))
+        for service in services[subset]:
+            for method in service.method:
+                roots += [top_level_name(method.input_type, package), top_level_name(method.output_type, package)]
+        closures[subset] = closure(roots, types, package)
+
+    core = closure(CORE_MESSAGES, types, package)
+    subsetNames = list(closures)
+    for i, subset in enumerate(subsetNames):
+        for other in subsetNames[i + 1:]:
+            core |= closures[subset] & closures[other]
+    closures = {'core': core, **{subset: names - core for subset, names in closures.items()}}
+    services['core'] = []
+
+    files = {}
+    for subset, names in closures.items():
+        fileProto = descriptor_pb2.FileDescriptorProto(name=f"liqi_{subset}.proto", package=package, syntax=combined.syntax)
+        # declaration order, as in the combined file
+        fileProto.message_type.extend(m for m in combined.message_type if m.name in names)
+        fileProto.enum_type.extend(e for e in combined.enum_type if e.name in names)
+        fileProto.service.extend(services[subset])
+        files[subset] = fileProto
+    return files
+
+def main():
+    combined = descriptor_pb2.FileDescriptorProto.FromString(liqi_combined_pb2.DESCRIPTOR.serialized_pb)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for subset, fileProto in split(combined).items():
+        with open(join(OUTPUT_DIR, f"{subset}.pb"), "wb") as f:
+            f.write(fileProto.SerializeToString())
+        methods = sum(len(service.method) for service in fileProto.service)
+        print(f"{subset}: {len(fileProto.message_type)} messages, {len(fileProto.enum_type)} enums, {methods} methods")
+
+if __name__ == "__main__":
+    main()
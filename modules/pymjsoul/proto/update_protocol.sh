@@ -4,4 +4,10 @@ python3 combine_json.py
 # install protobufjs CLI locally if you don't have it:
 # npm install protobufjs-cli
 npx pbjs -t proto3 liqi_combined.json > liqi_combined.proto
-protoc --python_out=. liqi_combined.proto
\ No newline at end of file
+protoc --python_out=. liqi_combined.proto
+python3 generate_stubs.py
+# per-service descriptor subsets (descriptors/*.pb) and their stubs
+python3 split_protocol.py
+for subset in contest_manager lobby_records live; do
+    python3 generate_stubs.py --subset $subset
+done
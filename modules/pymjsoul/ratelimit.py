@@ -0,0 +1,128 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+from .metrics import LatencyHistogram, histogram_snapshot
+from .scheduler import PRIORITY_INTERACTIVE
+
+# the group of the methods not listed in the `method_groups` of a `RateLimiter`
+DEFAULT_GROUP = 'default'
+
+def parse_rate_limits(text):
+    '''
+    Parses "group=rate/burst, ..." (e.g. "default=10/20, search=2/5"): `rate` requests
+    per second on average, at most `burst` at once. Returns {group: (rate, burst)}.
+    '''
+    limits = {}
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            group, limit = item.split('=')
+            rate, _, burst = limit.partition('/')
+            rate = float(rate)
+            burst = float(burst) if burst else max(1.0, rate)
+        except ValueError:
+            raise ValueError(f"Invalid rate limit {item!r}; expected group=rate/burst") from None
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate limit {item!r}; rate must be > 0 and burst >= 1")
+        limits[group.strip()] = (rate, burst)
+    return limits
+
+class TokenBucket():
+    '''
+    `rate` tokens per second, up to `burst` saved up. A request takes one token, or
+    waits for one: nothing is rejected. Waiting requests get their tokens in priority
+    order (see `scheduler.py`), first come first served within a priority.
+    '''
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+
+        # heap of (priority, arrival, future)
+        self._waiters = []
+        self._arrivals = itertools.count()
+        self._timer = None
+
+        # requests that had to wait, and for how long
+        self.waited = 0
+        self.wait_times = LatencyHistogram(lowest=0.0001)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _schedule(self):
+        if self._timer is not None or not self._waiters:
+            return
+        self._refill()
+        delay = max(0.0, (1 - self.tokens) / self.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._hand_out)
+
+    def _hand_out(self):
+        self._timer = None
+        self._refill()
+        while self._waiters and self.tokens >= 1:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                # cancelled while waiting
+                continue
+            self.tokens -= 1
+            waiter.set_result(None)
+        self._schedule()
+
+    async def acquire(self, priority=PRIORITY_INTERACTIVE):
+        self._refill()
+        if not self._waiters and self.tokens >= 1:
+            self.tokens -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._arrivals), waiter))
+        self._schedule()
+        self.waited += 1
+        start = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # got a token, but was cancelled before it could be used
+                self.tokens = min(self.burst, self.tokens + 1)
+                self._schedule()
+            raise
+        self.wait_times.record(time.perf_counter() - start)
+
+    def snapshot(self):
+        self._refill()
+        snapshot = {
+            'rate': self.rate,
+            'burst': self.burst,
+            'tokens': self.tokens,
+            'waiting': sum(not waiter.done() for _, _, waiter in self._waiters),
+            'waited': self.waited,
+        }
+        if self.wait_times.total_count:
+            snapshot['wait_seconds'] = histogram_snapshot(self.wait_times)
+        return snapshot
+
+class RateLimiter():
+    '''
+    Token buckets per method group (`MajsoulChannel.rate_limiter`): `limits` is
+    {group: (rate, burst)} (see `parse_rate_limits()`), `method_groups` maps method
+    names (e.g. "searchAccountByEid") to their group; the other methods are in
+    `DEFAULT_GROUP`. Methods of a group without a limit aren't limited.
+    '''
+    def __init__(self, limits=None, method_groups=None):
+        self.method_groups = dict(method_groups or {})
+        self.buckets = {group: TokenBucket(rate, burst) for group, (rate, burst) in (limits or {}).items()}
+
+    def bucket_for(self, methodName):
+        return self.buckets.get(self.method_groups.get(methodName, DEFAULT_GROUP))
+
+    def snapshot(self):
+        return {group: bucket.snapshot() for group, bucket in self.buckets.items()}
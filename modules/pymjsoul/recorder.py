@@ -0,0 +1,162 @@
+'''
+Capture and replay of raw websocket frames.
+
+A recording is the header `MAGIC` followed by one record per frame:
+
+    timestamp (float64, monotonic seconds since the recording started)
+    direction (uint8, `DIRECTION_IN` or `DIRECTION_OUT`)
+    msg type  (uint8, `MSG_TYPE_*` of `channel.py`)
+    index     (uint16, 0 for notifications)
+    length    (uint32)
+    the frame itself (`length` bytes)
+
+all little-endian. Record with `MajsoulChannel(..., record_path=...)` or
+`channel.start_recording(path)`; replay with `replay()`, e.g. to feed a tournament
+night's notifications to the `UvUManager` callbacks offline:
+
+    channel = ContestManager(...)
+    await channel.subscribe("NotifyContestGameEnd", cog.on_NotifyContestGameEnd)
+    await replay(channel, "session.mjsrec", speed=None)
+
+Summary of a recording:
+    python -m modules.pymjsoul.recorder session.mjsrec
+'''
+import argparse
+import asyncio
+import struct
+import time
+from collections import Counter, namedtuple
+
+MAGIC = b'MJSREC1\n'
+RECORD = struct.Struct('<dBBHI')
+
+DIRECTION_IN = 0
+DIRECTION_OUT = 1
+
+RecordedFrame = namedtuple('RecordedFrame', ['timestamp', 'direction', 'msg_type', 'index', 'frame'])
+
+class FrameRecorder():
+    '''
+    Appends frames to the recording at `path` (buffered; `flush()`/`close()` to write
+    everything out).
+    '''
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._start = time.monotonic()
+        self.frames = 0
+
+    def record(self, direction, frame):
+        msgType = frame[0]
+        # notifications don't have an index
+        index = int.from_bytes(frame[1:3], 'little') if msgType != 1 else 0
+        self._file.write(RECORD.pack(time.monotonic() - self._start, direction, msgType, index, len(frame)))
+        self._file.write(frame)
+        self.frames += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def read_frames(path):
+    '''
+    Yields the `RecordedFrame`s of the recording at `path`, in order.
+    '''
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a frame recording")
+
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                # end of file (or a record cut short by a crash)
+                return
+            timestamp, direction, msgType, index, length = RECORD.unpack(header)
+            frame = f.read(length)
+            if len(frame) < length:
+                return
+            yield RecordedFrame(timestamp, direction, msgType, index, frame)
+
+class ReplayWebsocket():
+    '''
+    Stands in for the websocket: iterating over it yields the inbound frames of a
+    recording, `speed` times as fast as they were recorded (None: as fast as possible).
+    Sent frames are discarded.
+    '''
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.open = True
+        self.sent = 0
+
+    async def __aiter__(self):
+        start = time.monotonic()
+        try:
+            for recorded in read_frames(self.path):
+                if recorded.direction != DIRECTION_IN:
+                    continue
+                if self.speed:
+                    delay = recorded.timestamp / self.speed - (time.monotonic() - start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                else:
+                    # still let the other tasks (the event loop, the callbacks) run
+                    await asyncio.sleep(0)
+                yield recorded.frame
+        finally:
+            self.open = False
+
+    async def send(self, message):
+        self.sent += 1
+
+    async def ping(self):
+        pong = asyncio.get_running_loop().create_future()
+        pong.set_result(None)
+        return pong
+
+    async def close(self):
+        self.open = False
+
+async def replay(channel, path, speed=1.0):
+    '''
+    Feeds the inbound frames recorded at `path` through `channel.listen()` (and so
+    through the subscriptions of `channel`), and waits until every notification has
+    been handled. Returns the time that took, in seconds. Call `channel.clean_up()`
+    afterwards.
+    '''
+    start = time.perf_counter()
+    await channel.connect(f'replay:{path}', ReplayWebsocket(path, speed))
+    await channel.listen_task
+
+    while not channel.Notifications.empty() or channel.dispatcher.pending:
+        await asyncio.sleep(0.01)
+        await channel.dispatcher.join()
+
+    return time.perf_counter() - start
+
+def summarize(path):
+    counts = Counter()
+    duration = 0.0
+    size = 0
+    for recorded in read_frames(path):
+        direction = 'in' if recorded.direction == DIRECTION_IN else 'out'
+        counts[(direction, recorded.msg_type)] += 1
+        duration = recorded.timestamp
+        size += len(recorded.frame)
+
+    print(f'{sum(counts.values())} frames, {size} bytes over {duration:.1f}s')
+    for (direction, msgType), count in sorted(counts.items()):
+        print(f'{direction:>4} type {msgType}: {count}')
+
+def main():
+    parser = argparse.ArgumentParser(description="Summary of a recording of websocket frames (see `recorder.py`).")
+    parser.add_argument('path', help="the recording, e.g. session.mjsrec")
+    args = parser.parse_args()
+
+    summarize(args.path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from google.protobuf import reflection
+
+class MethodEntry():
+    '''
+    Everything `MajsoulChannel.call` needs to know about one rpc, resolved ahead of time.
+    '''
+    __slots__ = ('name', 'service_name', 'full_name', 'descriptor', 'request_class', 'response_class')
+
+    def __init__(self, methodDescriptor):
+        self.name = methodDescriptor.name
+        self.service_name = methodDescriptor.containing_service.name
+        # the name that goes into the `Wrapper` envelope, e.g. ".lq.Lobby.oauth2Login"
+        self.full_name = f'.{methodDescriptor.full_name}'
+        self.descriptor = methodDescriptor
+        self.request_class = reflection.MakeClass(methodDescriptor.input_type)
+        self.response_class = reflection.MakeClass(methodDescriptor.output_type)
+
+    def __repr__(self):
+        return f'<MethodEntry {self.full_name}>'
+
+class MessageEntry():
+    '''
+    A top-level message (e.g. a notification) as it is named inside a `Wrapper`.
+    '''
+    __slots__ = ('name', 'full_name', 'descriptor', 'message_class')
+
+    def __init__(self, messageDescriptor):
+        self.name = messageDescriptor.name
+        # e.g. ".lq.NotifyContestGameEnd"
+        self.full_name = f'.{messageDescriptor.full_name}'
+        self.descriptor = messageDescriptor
+        self.message_class = reflection.MakeClass(messageDescriptor)
+
+    def __repr__(self):
+        return f'<MessageEntry {self.full_name}>'
+
+class ProtoRegistry():
+    '''
+    Lookup tables for a generated protobuf module (e.g. `liqi_combined_pb2`), built once
+    so that no descriptor scanning or class creation happens per request/notification.
+
+    Lookups return None when nothing matches.
+    '''
+    def __init__(self, proto):
+        self.proto = proto
+
+        # methodName -> MethodEntry. When several services define the same method,
+        # the first service (in declaration order) wins; this matches the old linear scan.
+        self.methods = {}
+        # (serviceName, methodName) -> MethodEntry
+        self.service_methods = {}
+        # ".lq.MessageName" -> MessageEntry
+        self.messages = {}
+        # "MessageName" -> MessageEntry
+        self.messages_by_name = {}
+
+        for serviceDescriptor in proto.DESCRIPTOR.services_by_name.values():
+            for methodDescriptor in serviceDescriptor.methods:
+                entry = MethodEntry(methodDescriptor)
+                self.service_methods[(entry.service_name, entry.name)] = entry
+                self.methods.setdefault(entry.name, entry)
+
+        for messageDescriptor in proto.DESCRIPTOR.message_types_by_name.values():
+            entry = MessageEntry(messageDescriptor)
+            self.messages[entry.full_name] = entry
+            self.messages_by_name[entry.name] = entry
+
+    def method(self, methodName, serviceName=None):
+        if serviceName:
+            return self.service_methods.get((serviceName, methodName))
+
+        return self.methods.get(methodName)
+
+    def message(self, wrapperName):
+        '''
+        Accepts either the fully-qualified name found in a `Wrapper`
+        (".lq.NotifyContestGameEnd") or the bare message name.
+        '''
+        entry = self.messages.get(wrapperName)
+
+        if entry is None:
+            entry = self.messages_by_name.get(wrapperName)
+
+        return entry
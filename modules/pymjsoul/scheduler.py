@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections import deque
+
+from .metrics import LatencyHistogram, histogram_snapshot
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_NAMES = ('interactive', 'background')
+
+# the priority of the requests sent from the current task (and the tasks it creates);
+# see `background()`
+current_priority = contextvars.ContextVar('majsoul_request_priority', default=PRIORITY_INTERACTIVE)
+
+@contextlib.contextmanager
+def background():
+    '''
+    Requests sent inside this block (e.g. `with channel.background(): await ...`) are
+    background traffic; see `RequestScheduler`.
+    '''
+    token = current_priority.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+class RequestScheduler():
+    '''
+    Decides when a request may be sent (`MajsoulChannel.send()`), by priority lane:
+    interactive (the default) or background (see `background()`).
+
+    - at most `window` requests are in flight; beyond that, requests wait in their lane;
+    - background requests never take more than `background_share` of the window, so
+      there is always room for interactive ones;
+    - when a slot frees up and both lanes are waiting, interactive requests go first,
+      except that background requests still get `background_share` of what is in flight
+      (they can't be starved by a steady stream of interactive ones);
+    - an interactive request only waits if the window is full of other requests.
+    '''
+    def __init__(self, window=64, background_share=0.25):
+        self.window = window
+        self.background_share = background_share
+
+        # per lane
+        self.in_flight = [0, 0]
+        self._waiters = (deque(), deque())
+        # requests that had to wait, and for how long
+        self.queued = [0, 0]
+        self.wait_times = (LatencyHistogram(lowest=0.0001), LatencyHistogram(lowest=0.0001))
+
+    @property
+    def background_limit(self):
+        return max(1, int(self.window * self.background_share))
+
+    def _can_start(self, priority):
+        if sum(self.in_flight) >= self.window:
+            return False
+        return priority == PRIORITY_INTERACTIVE or self.in_flight[PRIORITY_BACKGROUND] < self.background_limit
+
+    def _next_lane(self):
+        interactiveWaiting = self._waiters[PRIORITY_INTERACTIVE] and self._can_start(PRIORITY_INTERACTIVE)
+        backgroundWaiting = self._waiters[PRIORITY_BACKGROUND] and self._can_start(PRIORITY_BACKGROUND)
+
+        if interactiveWaiting and backgroundWaiting:
+            if self.in_flight[PRIORITY_BACKGROUND] < self.background_share * sum(self.in_flight):
+                return PRIORITY_BACKGROUND
+            return PRIORITY_INTERACTIVE
+        if interactiveWaiting:
+            return PRIORITY_INTERACTIVE
+        if backgroundWaiting:
+            return PRIORITY_BACKGROUND
+        return None
+
+    def _wake(self):
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                return
+
+            waiter = self._waiters[lane].popleft()
+            if waiter.done():
+                # cancelled while waiting
+                continue
+            self.in_flight[lane] += 1
+            waiter.set_result(None)
+
+    async def acquire(self, priority=PRIORITY_INTERACTIVE):
+        # nobody of the same or a higher priority is waiting for a slot
+        if self._can_start(priority) and not any(self._waiters[:priority + 1]):
+            self.in_flight[priority] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        self.queued[priority] += 1
+        start = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # granted, but cancelled before it could be used
+                self.release(priority)
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters[priority].remove(waiter)
+            raise
+        self.wait_times[priority].record(time.perf_counter() - start)
+
+    def release(self, priority=PRIORITY_INTERACTIVE):
+        self.in_flight[priority] -= 1
+        self._wake()
+
+    def snapshot(self):
+        snapshot = {'window': self.window, 'background_limit': self.background_limit}
+        for priority, name in enumerate(PRIORITY_NAMES):
+            lane = snapshot[name] = {
+                'in_flight': self.in_flight[priority],
+                'waiting': sum(not waiter.done() for waiter in self._waiters[priority]),
+                'queued': self.queued[priority],
+            }
+            if self.wait_times[priority].total_count:
+                lane['wait_seconds'] = histogram_snapshot(self.wait_times[priority])
+        return snapshot
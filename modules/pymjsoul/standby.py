@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import websockets
+from websockets.exceptions import ConnectionClosed, WebSocketException
+
+class StandbyWebsocket():
+    '''
+    Keeps one spare websocket to `uri` open (TCP and TLS handshakes done, nothing sent on it)
+    so that a reconnect only has to log in; see `MajsoulChannel.reconnect()`.
+
+    The spare connection is pinged every `health_interval` seconds and replaced when its
+    pong doesn't arrive within `ping_timeout` seconds or it was closed by the server.
+    `take()` hands it over (or returns None if there is no healthy one) and a new spare
+    is opened in the background.
+    '''
+    def __init__(self, uri, health_interval=30.0, ping_timeout=5.0, logger=None):
+        self.uri = uri
+        self.health_interval = health_interval
+        self.ping_timeout = ping_timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.websocket = None
+        self._healthy = False
+        self._wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+        # number of spare connections opened / health checks failed / spares handed over
+        self.handshakes = 0
+        self.failed_checks = 0
+        self.taken = 0
+        # how long the latest handshake took (what a reconnect saves), in seconds
+        self.handshake_seconds = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.maintain())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        await self._discard()
+
+    def take(self):
+        '''
+        Returns the spare websocket if it passed its latest health check, else None.
+        '''
+        websocket = self.websocket
+        if websocket is None or not self._healthy or not websocket.open:
+            return None
+
+        self.websocket = None
+        self._healthy = False
+        self.taken += 1
+        self._wakeup.set()
+        return websocket
+
+    async def maintain(self):
+        '''
+        Looping coroutine that keeps a healthy spare connection around.
+        '''
+        try:
+            while True:
+                if self.websocket is None or not self.websocket.open:
+                    await self._open()
+                else:
+                    await self._check()
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.health_interval)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            self.logger.info("`standby` task cancelled")
+
+    async def _open(self):
+        await self._discard()
+        start = time.perf_counter()
+        try:
+            # checked by `_check()`; `MajsoulChannel.sustain()` takes over once it's taken
+            self.websocket = await websockets.connect(self.uri, ping_interval=None)
+        except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+            self.logger.warning(f"Couldn't open a standby connection to {self.uri}: {e!r}")
+            return
+
+        self.handshake_seconds = time.perf_counter() - start
+        self.handshakes += 1
+        self._healthy = True
+        self.logger.info(f"Standby connection to {self.uri} open ({self.handshake_seconds * 1000:.0f}ms handshake)")
+
+    async def _check(self):
+        websocket = self.websocket
+        try:
+            pong = await websocket.ping()
+            await asyncio.wait_for(pong, self.ping_timeout)
+        except (asyncio.TimeoutError, ConnectionClosed):
+            if self.websocket is not websocket:
+                # handed over in the meantime
+                return
+            self.failed_checks += 1
+            self.logger.warning("Standby connection failed its health check; replacing it.")
+            await self._open()
+            return
+
+        if self.websocket is websocket:
+            self._healthy = True
+
+    async def _discard(self):
+        websocket, self.websocket = self.websocket, None
+        self._healthy = False
+        if websocket is not None:
+            await websocket.close()
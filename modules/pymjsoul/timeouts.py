@@ -0,0 +1,41 @@
+from .metrics import LatencyHistogram
+
+class AdaptiveTimeouts():
+    '''
+    Per-method response timeouts derived from the observed latencies:
+    the `percentile` latency of the method times `multiplier`, kept within
+    [`floor`, `ceiling`] seconds. Until a method has `min_samples` samples,
+    its timeout is `ceiling`.
+
+    Timed out requests are recorded as taking the full timeout, so a method that
+    got slower pushes its own timeout back up instead of timing out forever.
+    '''
+    def __init__(self, percentile=0.99, multiplier=3.0, floor=3.0, ceiling=10.0, min_samples=20):
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+
+        # method name -> LatencyHistogram
+        self.histograms = {}
+
+    def histogram(self, methodName):
+        histogram = self.histograms.get(methodName)
+
+        if histogram is None:
+            histogram = self.histograms[methodName] = LatencyHistogram(highest=self.ceiling)
+
+        return histogram
+
+    def record(self, methodName, seconds):
+        self.histogram(methodName).record(seconds)
+
+    def timeout_for(self, methodName):
+        histogram = self.histograms.get(methodName)
+
+        if histogram is None or histogram.total_count < self.min_samples:
+            return self.ceiling
+
+        latency = histogram.percentile(self.percentile)
+        return min(max(latency * self.multiplier, self.floor), self.ceiling)